@@ -0,0 +1,109 @@
+################
+# Dependencies #
+################
+import os
+import sys
+import time
+import tracemalloc
+import psycopg2
+from psycopg2.extras import DictCursor, RealDictCursor
+from aurora.connector import DictRowsCursor
+
+
+##
+# @desc Compares the old Postgres result path (DictCursor rows + a second list of dicts)
+#       with the single-copy paths (RealDictCursor rows, DictRowsCursor rows) on a large select
+#       The wall time is the best of 3 untraced runs, the memory comes from one tracemalloc run
+#
+#       Usage (from an app with DB_SYSTEM = "Postgres"):
+#       AURORA_PG_DSN="dbname=test user=postgres" python benchmarks/postgres_rows.py [rows]
+##
+
+
+##
+# @desc Fetches all the rows with the given cursor factory
+#
+# @param {object} conn    -- Required database connection
+# @param {class}  factory -- Required cursor factory
+# @param {bool}   copy    -- Optional copy the rows into a second list of dicts (the old real_dict path)
+#
+# @return {list}
+##
+def fetch(conn, factory, copy:bool=False):
+    cur = conn.cursor(cursor_factory=factory)
+    cur.execute('SELECT * FROM aurora_bench;')
+    rows = cur.fetchall()
+    cur.close()
+
+    if copy:
+        rows = [dict(row) for row in rows]
+
+    return rows
+
+
+##
+# @desc Measures a result path -- the best wall time of some runs (without tracing), then the traced memory of one run
+#
+# @param {object} conn    -- Required database connection
+# @param {class}  factory -- Required cursor factory
+# @param {bool}   copy    -- Optional copy the rows into a second list of dicts (the old real_dict path)
+# @param {int}    repeat  -- Optional timed runs
+#
+# @return {tuple} -- (best seconds, peak bytes, retained bytes)
+##
+def run(conn, factory, copy:bool=False, repeat:int=3):
+    times = []
+
+    for i in range(repeat):
+        start = time.perf_counter()
+        rows = fetch(conn, factory, copy)
+        times.append(time.perf_counter() - start)
+        del rows
+
+    # Memory (peak while fetching, retained by the returned rows)
+    tracemalloc.start()
+    rows = fetch(conn, factory, copy)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del rows
+
+    return min(times), peak, retained
+
+
+##
+# @desc Creates the benchmark table and prints the results
+##
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    conn = psycopg2.connect(os.environ.get('AURORA_PG_DSN', 'dbname=postgres'))
+
+    # Create the benchmark table
+    cur = conn.cursor()
+    cur.execute('DROP TABLE IF EXISTS aurora_bench;')
+    cur.execute('CREATE TABLE aurora_bench (id SERIAL PRIMARY KEY, name TEXT, email TEXT, score FLOAT);')
+    cur.execute('INSERT INTO aurora_bench (name, email, score) SELECT md5(i::text), i || \'@x\', random() FROM generate_series(1, %s) i;', [n])
+    conn.commit()
+
+    try:
+        # Warm up
+        fetch(conn, DictRowsCursor)
+
+        old = run(conn, DictCursor, copy=True)
+        real = run(conn, RealDictCursor)
+        new = run(conn, DictRowsCursor)
+
+        print(f'rows: {n}')
+        print(f'DictCursor + real_dict: {old[0]:.3f}s, peak {old[1] / 2**20:.1f} MiB, retained {old[2] / 2**20:.1f} MiB')
+        print(f'RealDictCursor:         {real[0]:.3f}s, peak {real[1] / 2**20:.1f} MiB, retained {real[2] / 2**20:.1f} MiB')
+        print(f'DictRowsCursor:         {new[0]:.3f}s, peak {new[1] / 2**20:.1f} MiB, retained {new[2] / 2**20:.1f} MiB')
+        print(f'saved:                  {old[0] - new[0]:.3f}s, peak {(old[1] - new[1]) / 2**20:.1f} MiB, retained {(old[2] - new[2]) / 2**20:.1f} MiB')
+
+    # Drop the benchmark table
+    finally:
+        cur.execute('DROP TABLE IF EXISTS aurora_bench;')
+        conn.commit()
+        conn.close()
+
+
+if __name__ == '__main__':
+    main()
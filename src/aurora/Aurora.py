@@ -6,6 +6,7 @@ import platform
 import importlib
 import time
 from flask import Flask
+from .helpers import Settings
 from flask_compress import Compress
 
 
@@ -96,6 +97,7 @@ class Aurora():
     ##
     # @desc The serve method -- Serves the root application and its child apps
     #
+    # @var settings: object -- The precomputed settings (built once, shared by the controllers and helpers)
     # @var apps: dict -- The APPS attribute of the _apps module
     # @var root_path: str -- The root app path
     # @var default_app: str -- The DEFAULT_APP attribute of the config module
@@ -107,15 +109,20 @@ class Aurora():
     # @var app: object -- The root application
     #
     # @decorator context_processor: function -- For decorating global_variables local method
+    # @decorator teardown_appcontext: function -- For decorating close_session local method
     # @method global_variables: function -- A local method for setting global variables
+    # @method close_session: function -- A local method for closing the request database session
     #
     # @return object -- The root app
     ##
     def serve(self):
+        # The settings (built once, shared by the controllers, security functions and helpers)
+        settings          = Settings.current()
+
         # Fetch the required attributes
-        apps              = getattr(self.apps, "apps")
+        apps              = settings.apps
         root_path         = getattr(self.config, "ROOT_PATH")
-        statics           = getattr(self.config, 'STATICS')
+        statics           = settings.statics
         secret_key        = getattr(self.config, "SECRET_KEY")
         upload_size       = getattr(self.config, "UPLOAD_SIZE")
         UPLOAD_TYPES      = getattr(self.config, "UPLOAD_TYPES")
@@ -143,47 +150,33 @@ class Aurora():
         ##
         # @desc The local global_variables method -- Sets the global variables usable in views
         #
-        # @var global_dict: dict -- A dictionary for all global variables (GLOBALS + Auto Globals)
-        # @var translate dict -- Uppercase key version of global_dict
+        # @var translate dict -- The precomputed global variables (GLOBALS + Auto Globals, uppercase keys)
         #
         # @return dict -- Global variables dictionary
         ##
         app = self.app
         @app.context_processor
         def global_variables():
-            translate = {}
-            auto_globals = {}
-    
-            # Global attibutes
-            error_app = getattr(self.config, 'ERROR_APP')
-            default_app = getattr(self.config, 'DEFAULT_APP')
-            globals = getattr(self.config, 'GLOBALS')
-            
-            # Auto globals
-            auto_globals['statics'] = '/' + statics
+            translate = settings.globals
 
-            # Add apps
-            for app in apps:
-                # Error app
-                if app[0] == error_app:
-                    auto_globals['error_app'] = '/' + app[1]
+            # Return the translated dictionary (a copy, Flask updates the template context with it)
+            return dict(translate)
 
-                # Default app
-                if app[0] == default_app:
-                    auto_globals['default_app'] = '/' + app[1]
 
-                # All apps
-                auto_globals[app[0]] = '/' + app[1]
-
-            # Add global variables
-            auto_globals.update(globals)
+        ##
+        # @desc The local close_session method -- Commits (or rolls back) the request database session once
+        #
+        # @param error: Exception -- The request error (if any)
+        #
+        # @return None
+        ##
+        @app.teardown_appcontext
+        def close_session(error=None):
+            # Import the Session class (needs the config module)
+            from .SQL import Session
 
-            # Translate auto_globals to uppercase
-            for k, v in auto_globals.items():
-                translate[k.upper()] = v
-            
-            # Return the translated dictionary
-            return translate
+            # Close the request sessions
+            Session.teardown(error)
 
         # Try to bootstrap the apps
         try:
@@ -263,17 +263,17 @@ class CLI:
             Class = getattr(Model, model)
 
             # The table name
-            table = Class().table
+            table = Class._meta()['table']
 
             # Atributes dictionary
             attrs = {}
 
             # Add model columns (class attributes) to attrs
-            attrs.update(dict([(x,y) for x,y in Class.__dict__.items() if not x.startswith('__')]))
+            attrs.update(Class._meta()['columns'])
 
             # Table default parameters
             col_type = {}
-            primary_key = Class().primary_key
+            primary_key = Class._meta()['primary_key']
             unique = []
             not_null = []
             default = {}
@@ -327,8 +327,8 @@ class CLI:
                     r_model = importlib.import_module(f"models.{new_attrs[x]['related_to']}")
                     r_class = getattr(r_model, new_attrs[x]['related_to'])
 
-                    r_table = r_class().table
-                    r_column = r_class().primary_key if r_class().primary_key else 'id'
+                    r_table = r_class._meta()['table']
+                    r_column = r_class._meta()['primary_key'] if r_class._meta()['primary_key'] else 'id'
 
                     foreign_key[x] = {
                         'r_table': r_table,
@@ -570,9 +570,9 @@ class CLI:
             Class = getattr(Model, model)
 
             # Model meta data
-            table = Class().table
-            primary_key = Class().primary_key
-            repair = Class().repair
+            table = Class._meta()['table']
+            primary_key = Class._meta()['primary_key']
+            repair = Class._meta()['repair']
 
             # Update the tables list
             tables.append(table)
@@ -623,7 +623,7 @@ class CLI:
                 exit()
 
             # Add model columns (class attributes) to attrs
-            attrs.update(dict([(x,y) for x,y in Class.__dict__.items() if not x.startswith('__')]))
+            attrs.update(Class._meta()['columns'])
 
             # Check columns
             for x in attrs:
@@ -910,17 +910,17 @@ class CLI:
             Class = getattr(Model, model)
 
             # The table name
-            table = Class().table
+            table = Class._meta()['table']
 
             # Atributes dictionary
             attrs = {}
 
             # Add model columns (class attributes) to attrs
-            attrs.update(dict([(x,y) for x,y in Class.__dict__.items() if not x.startswith('__')]))
+            attrs.update(Class._meta()['columns'])
 
             # Table default parameters
             col_type = {}
-            primary_key = Class().primary_key
+            primary_key = Class._meta()['primary_key']
             unique = []
             not_null = []
             default = {}
@@ -974,8 +974,8 @@ class CLI:
                     r_model = importlib.import_module(f"models.{new_attrs[x]['related_to']}")
                     r_class = getattr(r_model, new_attrs[x]['related_to'])
 
-                    r_table = r_class().table
-                    r_column = r_class().primary_key if r_class().primary_key else 'id'
+                    r_table = r_class._meta()['table']
+                    r_column = r_class._meta()['primary_key'] if r_class._meta()['primary_key'] else 'id'
 
                     foreign_key[x] = {
                         'r_table': r_table,
@@ -1690,7 +1690,7 @@ class CLI:
                 # Find the current model repair attribute
                 c_model = importlib.import_module(f'models.{model}')
                 c_class = getattr(c_model, model)
-                repair = c_class().repair
+                repair = c_class._meta()['repair']
 
                 # Produce repairing model attributes
                 r_attrs = {}
@@ -2920,6 +2920,15 @@ class CLI:
         # Check the database
         CLI.check_database(pattern="check")
 
+        # Report the SQLite pragmas (DB_CONFIG['pragmas'])
+        if db_system == 'SQLite' and db._pragmas():
+            print('SQLite pragmas:')
+
+            for name, value in db._pragma_values().items():
+                print(f'- {name}: {value}')
+
+            time.sleep(0.1)
+
         # Chech for migrations
         if not CLI.migrate_database(pattern="check"):
             # Check the database for repairs
@@ -3,9 +3,8 @@
 ################
 import sys
 import pathlib
-import importlib
 from aurora.security import request, redirect, check_cookie, get_cookie, check_session, get_session, set_session
-from aurora.helpers import app_exists
+from aurora.helpers import Settings
 from flask.views import View
 
 
@@ -17,32 +16,61 @@ from flask.views import View
 ##
 class Controller(View):
 
+    # The controller registry -- {controller class: app name}
+    registry = {}
+
+
+    ##
+    # @desc Registers a controller class -- Its app name (the folder of the controller file) is found once per class
+    #
+    # @var {str} path -- The controller file path
+    ##
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # The controller file
+        path = getattr(sys.modules.get(cls.__module__), '__file__', None)
+
+        if path:
+            Controller.registry[cls] = pathlib.PurePath(path).parent.name
+
+
     ##
     # @desc Constructor method -- Generates Pluggable Views
+    #
+    # @var {object} settings -- The precomputed settings
+    # @var {str}    segment  -- The first segment of the requested path
     ##
     def __init__(self) -> None:
-        # Required modules
-        config = importlib.import_module('config')
-
         # Required attributes
-        self.default_lang = getattr(config, 'DEFAULT_LANG') 
-        self.multi_lang   = getattr(config, "MULTI_LANG")
-        self.languages    = getattr(config, 'LANGUAGES') 
+        settings = Settings.current()
+
+        self.default_lang = settings.default_lang
+        self.multi_lang   = settings.multi_lang
+        self.languages    = settings.languages
 
         # Public properties
         self.active_lang = self.default_lang
         self.LANGUAGE    = ''
         self.path        = request.path
 
-        # Inspect the app name from caller file
-        caller        = sys._getframe().f_back.f_code.co_filename
-        self.app_name = pathlib.PurePath(caller).parent.name
-        self.app_url  = app_exists(self.app_name)['url'] if app_exists(self.app_name)['result'] else False
+        # The app name of the controller class (inspect the caller file of unregistered controllers)
+        self.app_name = Controller.registry.get(type(self))
+
+        if not self.app_name:
+            caller        = sys._getframe().f_back.f_code.co_filename
+            self.app_name = pathlib.PurePath(caller).parent.name
+
+        self.app_url = settings.app_urls.get(self.app_name, False)
+
+        # The root path and apps path
+        segment = self.path.split('/')[1]
+        self.app_path = self.path == '/' or segment == self.app_url or segment in settings.app_urls
 
         # Multi language
         if self.multi_lang:
             # The root path and apps path
-            if self.path == '/' or self.path.split('/')[1] == self.app_url or app_exists(self.path.split('/')[1])['result']:
+            if self.app_path:
                 # active_lang cookie exists
                 if check_cookie('active_lang'):
                     self.active_lang = get_cookie('active_lang')
@@ -58,9 +86,9 @@ class Controller(View):
                     set_session('active_lang', self.default_lang)
 
             # Languages path
-            elif self.path.split('/')[1] in self.languages:
-                self.active_lang = self.path.split('/')[1]
-                set_session('active_lang', self.path.split('/')[1])
+            elif segment in self.languages:
+                self.active_lang = segment
+                set_session('active_lang', segment)
 
             # Other paths
             else:
@@ -89,7 +117,7 @@ class Controller(View):
             # Check the language
             if self.multi_lang:
                 # The root path
-                if self.path == '/' or self.path.split('/')[1] == self.app_url or app_exists(self.path.split('/')[1])['result']:
+                if self.app_path:
                     if check_cookie('active_lang'):
                         return redirect('/' + get_cookie('active_lang') + self.path)
 
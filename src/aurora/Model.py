@@ -3,10 +3,12 @@
 ################
 import sys
 import re
+import time
 import pathlib
 import importlib
+import functools
 from .helpers import snake_case
-from .SQL import Database
+from .SQL import Database, AsyncDatabase
 
 
 ###############
@@ -16,6 +18,56 @@ from .SQL import Database
 # @desc Instantiates the Database class of the Database API
 ##
 class Model:
+
+    # The model registry -- {model class: metadata}
+    registry = {}
+
+
+    ##
+    # @desc Registers a model class -- Its name (the model file name), default table name and columns are computed once per class
+    #
+    # @var {str} path -- The model file path
+    ##
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # The model file
+        path = getattr(sys.modules.get(cls.__module__), '__file__', None)
+
+        # Model name (the model file name)
+        name = pathlib.PurePath(path).stem if path else cls.__name__
+
+        Model.registry[cls] = {
+            'model': name,
+            'table': snake_case(name),
+            'primary_key': None,
+            'repair': {},
+            'columns': dict([(x,y) for x,y in cls.__dict__.items() if not x.startswith('__')]),
+            'loaded': False,
+        }
+
+
+    ##
+    # @desc Finds the metadata of a model class (the table, primary key and repair of the model constructor are read once)
+    #
+    # @return {dict} -- {"model", "table", "primary_key", "repair", "columns"}
+    ##
+    @classmethod
+    def _meta(cls):
+        meta = Model.registry[cls]
+
+        # Read the constructor properties once
+        if not meta['loaded']:
+            instance = cls()
+
+            meta['table'] = instance.table
+            meta['primary_key'] = instance.primary_key
+            meta['repair'] = instance.repair
+            meta['loaded'] = True
+
+        return meta
+
+
     ##
     # @desc Constructor method
     #
@@ -24,25 +76,32 @@ class Model:
     # @property {str}  primary_key -- The table primary key
     # @property {dict} repair      -- The repair dictionary
     #
-    # @var {str}    caller_path -- The caller path
+    # @var {dict}   meta        -- The registered model metadata
+    # @var {str}    caller_path -- The caller path (unregistered models)
     # @var {str}    caller_file -- The caller file
     # @var {str}    caller_name -- The caller name (the model name)
-    # @var {module} model       -- The model module
     ##
     def __init__(self):
+        meta = Model.registry.get(type(self))
+
+        # Registered model
+        if meta:
+            caller_name = meta['model']
+
         # Find information about the caller
-        caller_path = sys._getframe().f_back.f_code.co_filename
-        caller_file = pathlib.PurePath(caller_path).name
-        caller_name = caller_file.replace('.py', '')
+        else:
+            caller_path = sys._getframe().f_back.f_code.co_filename
+            caller_file = pathlib.PurePath(caller_path).name
+            caller_name = caller_file.replace('.py', '')
 
         # Model name
         self.model = caller_name
 
         # The table name
-        self.table = snake_case(caller_name)
+        self.table = meta['table'] if meta else snake_case(caller_name)
 
         # The model primary key
-        self.primary_key = None
+        self.primary_key = meta['primary_key'] if meta else None
 
         # Repair the database (rename the columns)
         self.repair = {}
@@ -482,6 +541,23 @@ class Model:
         return Database.save(self)
 
 
+    ##
+    # @desc rollback method to discard the changes manually
+    ##
+    def rollback(self):
+        return Database.rollback(self)
+
+
+    ##
+    # @desc Starts a transaction (a savepoint if a transaction is already open on the connection)
+    #       ex. with Users().transaction() as users: users.create(...); users.update(...)
+    #
+    # @return {object} -- The Transaction context manager
+    ##
+    def transaction(self):
+        return Database.transaction(self)
+
+
     ##
     # CAUTION! Use this methods only in development.
     #
@@ -528,24 +604,43 @@ class Model:
 
 
     ##
-    # @desc Inserts multi rows
+    # @desc Inserts multi rows (bulk insert)
     #
-    # @param {str}  table -- Required Table name (ex. "users")
-    # @param {list} data  -- Required data (ex. [{...}, {...}, ...])
+    # @param {list} data      -- Required data (ex. [{...}, {...}, ...])
+    # @param {bool} returning -- Optional return the inserted ids
     #
-    # @return {int} -- Last inserted id
+    # @return {int|list|bool} -- The number of inserted rows | The inserted ids (returning) | False on error
     ##
-    def create_multi(self, data:list):
-        # Loop data
-        i = 1
-        for x in data:
-            if i == len(data):
-                return self.create(data=x)
+    def create_multi(self, data:list, returning:bool=False):
+        return Database.create_multi(self, table=self.table, data=data, returning=returning)
 
-            else:
-                self.create(data=x)
 
-            i += 1
+    ##
+    # @desc Inserts a row or updates it on conflict (upsert)
+    #
+    # @param {dict} data          -- Required data (ex. {"email": "john@doe.com", "name": "John"})
+    # @param {list} conflict_cols -- Optional unique columns (the primary key by default)
+    # @param {list} update_cols   -- Optional columns to update on conflict (all the other data columns by default)
+    #
+    # @return {bool}
+    ##
+    def upsert(self, data:dict, conflict_cols:list=None, update_cols:list=None):
+        return Database.upsert(self, table=self.table, data=data, update_cols=update_cols, 
+                               conflict_cols=conflict_cols if conflict_cols else [self.primary_key if self.primary_key else 'id'])
+
+
+    ##
+    # @desc Inserts multi rows or updates them on conflict (bulk upsert)
+    #
+    # @param {list} data          -- Required data (ex. [{...}, {...}, ...])
+    # @param {list} conflict_cols -- Optional unique columns (the primary key by default)
+    # @param {list} update_cols   -- Optional columns to update on conflict (all the other data columns by default)
+    #
+    # @return {bool}
+    ##
+    def upsert_multi(self, data:list, conflict_cols:list=None, update_cols:list=None):
+        return Database.upsert_multi(self, table=self.table, data=data, update_cols=update_cols, 
+                                     conflict_cols=conflict_cols if conflict_cols else [self.primary_key if self.primary_key else 'id'])
 
 
     ##
@@ -557,12 +652,116 @@ class Model:
     # @param {str}  group_by -- Optional GROUP BY statement (ex. 'country')
     # @param {int}  limit    -- Optional LIMIT statement (ex. "10")
     # @param {int}  offset   -- Optional OFFSET statement (ex. "10")
+    # @param {str}  after    -- Optional keyset pagination token -- the rows after it (ex. Read.token(), "" for the first page)
+    # @param {str}  before   -- Optional keyset pagination token -- the rows before it (ex. Read.token(before=True))
+    # @param {int}  cache    -- Optional result cache time to live (seconds)
+    # @param {list} prefetch -- Optional related models loaded with one batched IN query each (ex. ["Orders", "Users"])
+    #                           Child models are added to every row as a list, parent models as a dict (or None)
+    # @param {str}  key      -- Optional unique key of the keyset pagination (default: the model primary key)
     #
     # @return {class}
     ##
-    def read(self, cols:list=[], where:dict={}, order_by:dict={}, group_by:str=None, limit:int=None, offset:int=None):
-        return Database.read(self, table=self.table, cols=cols, where=where, order_by=order_by, group_by=group_by, 
-                              limit=limit, offset=offset)
+    def read(self, cols:list=[], where:dict={}, order_by:dict={}, group_by:str=None, limit:int=None, offset:int=None, 
+             after:str=None, before:str=None, cache:int=None, prefetch:list=None, key:str=None):
+        result = Database.read(self, table=self.table, cols=cols, where=where, order_by=order_by, group_by=group_by, 
+                              limit=limit, offset=offset, after=after, before=before, cache=cache, key=key)
+
+        # Load the related rows after fetching
+        if result and prefetch:
+            result.prefetch = functools.partial(Model._prefetch, self, prefetch)
+
+        return result
+
+
+    ##
+    # @desc Loads the related rows of the given rows (one batched IN query per related model)
+    #       The relationships come from the foreign keys recorded by the last migration (see Relations).
+    #
+    # @param {list} models -- Required related models (ex. ["Orders", "Users"])
+    # @param {list} rows   -- Required rows of the model
+    #
+    # @var {dict} related -- The related rows by the joined column value
+    #
+    # @return {list}
+    ##
+    def _prefetch(self, models:list, rows:list):
+        # Nothing to load
+        if not rows:
+            return rows
+
+        # The relationship registry
+        relations = Relations.current(self)
+
+        # Main model info
+        m_model = relations.model(self.model)
+
+        for model in models:
+            f_model = relations.model(model)
+
+            # Child model (its foreign key references the main model)
+            children = [(key, value) for key, value in f_model['foreign_key'].items() if value['r_table'] == m_model['table']] if f_model and m_model else []
+
+            # Parent model (the main model foreign key references it)
+            parents = [(key, value) for key, value in m_model['foreign_key'].items() if value['r_table'] == f_model['table']] if f_model and m_model else []
+
+            if children:
+                local, remote, many = children[0][1]['r_column'], children[0][0], True
+
+            elif parents:
+                local, remote, many = parents[0][0], parents[0][1]['r_column'], False
+
+            # A model is missing from the last migration
+            if not m_model or not f_model:
+                err = f'''Cannot prefetch '{model}': the '{self.model if not m_model else model}' model is not in the last migration!'''
+
+            # No relationship
+            elif not children and not parents:
+                err = f'''Cannot prefetch '{model}': there is no foreign key between the '{self.model}' and '{model}' models!'''
+
+            # The joined column is not selected
+            elif not local in rows[0]:
+                err = f'''Cannot prefetch '{model}': the '{local}' column must be selected!'''
+
+            else:
+                err = None
+
+            if err:
+                # Developer mode
+                if self.debug:
+                    # Raise error
+                    raise Exception(err)
+
+                # Production mode
+                else:
+                    print(err)
+                    continue
+
+            # The joined column values (unique)
+            values = list(dict.fromkeys([row[local] for row in rows if row[local] != None]))
+
+            # Fetch the related rows in batches
+            related = {}
+
+            for i in range(0, len(values), 512):
+                batch = values[i:i + 512]
+
+                # Pad the batch to a power of two (a few IN statement shapes instead of one per batch length)
+                size = 8
+                while size < len(batch):
+                    size *= 2
+
+                batch = batch + [batch[-1]] * (size - len(batch))
+
+                for row in Database.read(self, table=f_model['table'], where={f'{remote}--in': batch}).fetch():
+                    related.setdefault(row[remote], []).append(row)
+
+            # Stitch the related rows
+            for row in rows:
+                matches = related.get(row[local], [])
+                row[model] = matches if many else (matches[0] if matches else None)
+
+        # Return the result
+        return rows
 
 
     ##
@@ -582,6 +781,7 @@ class Model:
     # @param {str}  group_by -- Optional GROUP BY statement (ex. 'table.country')
     # @param {int}  limit    -- Optional LIMIT statement (ex. "10")
     # @param {int}  offset   -- Optional OFFSET statement (ex. "10")
+    # @param {int}  cache    -- Optional result cache time to live (seconds)
     #
     # @var {str}  sql: str     -- The sql statement
     # @var {list} data_bind    -- Data binding against SQL Injection
@@ -592,76 +792,30 @@ class Model:
     #
     # @return {class}
     ##
-    def join(self, models:list, cols:list=[], join_stmt:str='INNER JOIN', where:dict={}, order_by:dict={}, group_by:str=None, limit:int=None, offset:int=None):
-        # Find last last migration
-        migration = Database.read(self, '_migrations').last()
-
-        # Migration module
-        module = importlib.import_module(f'_migrations.{migration["version"]}')
-
-        # Main model info
-        m_model = getattr(module, self.model)
-        m_foreign_key = m_model['foreign_key']
+    def join(self, models:list, cols:list=[], join_stmt:str='INNER JOIN', where:dict={}, order_by:dict={}, group_by:str=None, limit:int=None, offset:int=None, 
+             cache:int=None):
+        # The relationship registry
+        relations = Relations.current(self)
 
         # Foreign tables data
-        f_tables = []
-        p_keys = []
-        f_keys = []
-
-        # Find foreign models info
-        for i in range(len(models)):
-            f_model = getattr(module, models[i])
-
-            # Update foreign tables data
-            f_tables.append(f_model['table'])
-            p_keys.append(f_model['primary_key'])
-
-            # Find main model f_keys
-            for key, value in m_foreign_key.items():
-                if value['r_table'] == f_model['table']:
-                    f_keys.append(key)
+        f_tables, p_keys, f_keys = relations.join(self.model, tuple(models))
 
         # Refine cols
-        r_col = []
-        for x in cols:
-            try:
-                r_col.append(getattr(module, x.split('.')[0])['table'] + '.' + x.split('.')[1])
-            except:
-                r_col.append(x)
+        r_col = [relations.col(x) for x in cols]
 
         # Refine where
-        r_where = {}
-        for key, value in where.items():
-            try:
-                if len(key.split('.')[0].split('--')) > 1:
-                    r_where[key.split('.')[0].split('--')[0] + '--' + getattr(module, key.split('.')[0].split('--')[1])['table'] + '.' + key.split('.')[1]] = value
-                    pass
-                else:
-                    r_where[getattr(module, key.split('.')[0])['table'] + '.' + key.split('.')[1]] = value
-            except:
-                r_where[key] = value
+        r_where = {relations.key(key): value for key, value in where.items()}
 
         # Refine order_by
-        r_order_by = {}
-        for key, value in order_by.items():
-            try:
-                if len(key.split('.')[0].split('--')) > 1:
-                    r_order_by[key.split('.')[0].split('--')[0] + '--' + getattr(module, key.split('.')[0].split('--')[1])['table'] + '.' + key.split('.')[1]] = value
-                    pass
-                else:
-                    r_order_by[getattr(module, key.split('.')[0])['table'] + '.' + key.split('.')[1]] = value
-            except:
-                r_order_by[key] = value
+        r_order_by = {relations.key(key): value for key, value in order_by.items()}
 
         # Refine group_by
-        try:
-            group_by = getattr(module, group_by.split('.')[0])['table'] + '.' + group_by.split('.')[1]
-        except:
-            pass
-                
+        if group_by:
+            group_by = relations.col(group_by)
+
         # Return the results
         return Database.join(self, table=self.table, f_keys=f_keys, f_tables=f_tables, p_keys=p_keys, cols=r_col, join_stmt=join_stmt, 
-                             where=r_where, order_by=r_order_by, group_by=group_by, limit=limit, offset=offset)
+                             where=r_where, order_by=r_order_by, group_by=group_by, limit=limit, offset=offset, cache=cache)
 
 
     ##
@@ -679,6 +833,18 @@ class Model:
         return Database.update(self, table=self.table, data=data, where=where, confirm=confirm)
 
 
+    ##
+    # @desc Updates multi rows with per-row values (bulk update)
+    #
+    # @param {list} rows -- Required rows including the key (ex. [{"id": 1, "name": "John"}, {"id": 2, "name": "Jane"}])
+    # @param {str}  key  -- Optional key column to match the rows (the primary key by default)
+    #
+    # @return {bool}
+    ##
+    def update_multi(self, rows:list, key:str=None):
+        return Database.update_multi(self, table=self.table, rows=rows, key=key if key else (self.primary_key if self.primary_key else 'id'))
+
+
     ##
     # *WARNING! If you ignore the 'where' parameter, it will deletes all the records inside your table! (must confirm)
     #
@@ -692,3 +858,190 @@ class Model:
     def delete(self, where:dict={}, confirm:dict=False):
         return Database.delete(self, table=self.table, where=where, confirm=confirm)
 
+
+###################
+# Relations Class #
+###################
+##
+# @desc Relationship registry of the models -- Built once from the last migration module, and shared by the
+#       connection pool (in its schema catalog). A new migration or a DDL method clears it.
+#       The last migration version is checked again every DB_CONFIG['relations_ttl'] seconds (default: 5),
+#       so a migration applied by another process (ex. manage.py) is seen without a restart.
+##
+class Relations:
+    ##
+    # @desc Constructor method
+    #
+    # @param {str} version -- Required migration version
+    #
+    # @property {str}    version -- The migration version
+    # @property {float}  checked -- The last time the migration version was checked (monotonic)
+    # @property {module} module  -- The migration module
+    # @property {dict}   joins   -- The resolved joins -- {(model, models): (f_tables, p_keys, f_keys)}
+    # @property {dict}   cols    -- The refined column keys -- {key: refined key}
+    # @property {dict}   keys    -- The refined where and order_by keys -- {key: refined key}
+    ##
+    def __init__(self, version:str):
+        self.version = version
+        self.checked = time.monotonic()
+        self.module = importlib.import_module(f'_migrations.{version}')
+        self.joins = {}
+        self.cols = {}
+        self.keys = {}
+
+
+    ##
+    # @desc Finds (or builds) the relationship registry of a model's database
+    #
+    # @param {object} db -- Required Model (or Database) instance
+    #
+    # @var {float} ttl -- The DB_CONFIG['relations_ttl'] attribute of the config module (seconds)
+    #
+    # @return {object}
+    ##
+    @staticmethod
+    def current(db):
+        catalog = db.pool.catalog if db.pool else None
+        relations = catalog.relations if catalog else None
+        ttl = getattr(db.config, 'DB_CONFIG').get('relations_ttl', 5)
+
+        # The shared registry (checked recently)
+        if relations and time.monotonic() - relations.checked < ttl:
+            return relations
+
+        # Find last migration
+        migration = Database.read(db, '_migrations', cols=['version']).last()
+
+        # The migration version has not changed
+        if relations and relations.version == migration['version']:
+            relations.checked = time.monotonic()
+            return relations
+
+        # A migration module created after the start of the process
+        if relations:
+            importlib.invalidate_caches()
+
+        relations = Relations(migration['version'])
+
+        # Share the registry
+        if catalog:
+            catalog.relations = relations
+
+        return relations
+
+
+    ##
+    # @desc Finds the migration info of a model
+    #
+    # @param {str} name -- Required model name
+    #
+    # @return {dict|None}
+    ##
+    def model(self, name:str):
+        return getattr(self.module, name, None)
+
+
+    ##
+    # @desc Resolves the foreign tables, their primary keys and the foreign keys of a join
+    #
+    # @param {str}   name   -- Required main model name
+    # @param {tuple} models -- Required foreign model names
+    #
+    # @return {tuple} -- (f_tables, p_keys, f_keys)
+    ##
+    def join(self, name:str, models:tuple):
+        result = self.joins.get((name, models))
+
+        if result:
+            return result
+
+        # Main model info
+        m_foreign_key = getattr(self.module, name)['foreign_key']
+
+        # Foreign tables data
+        f_tables = []
+        p_keys = []
+        f_keys = []
+
+        # Find foreign models info
+        for model in models:
+            f_model = getattr(self.module, model)
+
+            # Update foreign tables data
+            f_tables.append(f_model['table'])
+            p_keys.append(f_model['primary_key'])
+
+            # Find main model f_keys
+            for key, value in m_foreign_key.items():
+                if value['r_table'] == f_model['table']:
+                    f_keys.append(key)
+
+        result = self.joins[(name, models)] = (f_tables, p_keys, f_keys)
+
+        return result
+
+
+    ##
+    # @desc Refines a column key (ex. "Users.name" -> "users.name")
+    #
+    # @param {str} col -- Required column key
+    #
+    # @return {str}
+    ##
+    def col(self, col:str):
+        result = self.cols.get(col)
+
+        if result:
+            return result
+
+        try:
+            result = getattr(self.module, col.split('.')[0])['table'] + '.' + col.split('.')[1]
+        except:
+            result = col
+
+        self.cols[col] = result
+
+        return result
+
+
+    ##
+    # @desc Refines a where or order_by key (ex. "Users.id--gt" -> "users.id--gt")
+    #
+    # @param {str} key -- Required key
+    #
+    # @return {str}
+    ##
+    def key(self, key:str):
+        result = self.keys.get(key)
+
+        if result:
+            return result
+
+        try:
+            if len(key.split('.')[0].split('--')) > 1:
+                result = key.split('.')[0].split('--')[0] + '--' + getattr(self.module, key.split('.')[0].split('--')[1])['table'] + '.' + key.split('.')[1]
+            else:
+                result = getattr(self.module, key.split('.')[0])['table'] + '.' + key.split('.')[1]
+        except:
+            result = key
+
+        self.keys[key] = result
+
+        return result
+
+
+####################
+# AsyncModel Class #
+####################
+##
+# @desc Awaitable Model methods (ex. users = await AsyncModel(Users).read(where={...}))
+#       Every call instantiates the model in a worker thread of the AsyncDatabase executor.
+##
+class AsyncModel(AsyncDatabase):
+    ##
+    # @desc Constructor method
+    #
+    # @param {class} model -- Required model class (ex. Users)
+    ##
+    def __init__(self, model):
+        AsyncDatabase.__init__(self, factory=model)
@@ -3,10 +3,110 @@
 ################
 import os
 import re
+import time
 import platform
 import importlib
+import threading
+import functools
+import itertools
+import collections
+import base64
+import io
+import json
+import asyncio
+import concurrent.futures
+from flask import g, has_app_context
 from .connector import DatabaseAPI, DatabaseError
-from .helpers import dict_factory, real_dict, check_file, delete_chars, clean_key, delete_file
+from .helpers import dict_factory, check_file, delete_chars, clean_key, delete_file
+
+
+##
+# @desc Decorator for the DDL methods -- Invalidates the schema catalog after the method runs
+#
+# @param {function} method -- The DDL method
+#
+# @return {function}
+##
+def ddl(method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+
+        finally:
+            Database._clear_catalog(self)
+            Results.clear()
+
+    return wrapper
+
+
+##
+# @desc Decorator for the write methods -- Invalidates the cached results of the written table
+#       and records the write (the following reads go to the primary, see Database._replica)
+#
+# @param {function} method -- The write method (with the table as the first parameter)
+#
+# @return {function}
+##
+def writes(method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+
+        finally:
+            table = kwargs['table'] if 'table' in kwargs else args[0] if args else None
+
+            Results.invalidate(table)
+            Database._wrote(self)
+
+            # A new migration version
+            if table == '_migrations':
+                Database._clear_catalog(self)
+
+    return wrapper
+
+
+# WHERE clause operators -- {key suffix: (sql operator, bind type)}
+where_operators = {
+    'equal':         ('=', 'value'),
+    'e':             ('=', 'value'),
+    'not-equal':     ('<>', 'value'),
+    'ne':            ('<>', 'value'),
+    'greater-than':  ('>', 'value'),
+    'gt':            ('>', 'value'),
+    'greater-equal': ('>=', 'value'),
+    'ge':            ('>=', 'value'),
+    'less-than':     ('<', 'value'),
+    'lt':            ('<', 'value'),
+    'less-equal':    ('<=', 'value'),
+    'le':            ('<=', 'value'),
+    'like':          (' LIKE ', 'value'),
+    'l':             (' LIKE ', 'value'),
+    'not-like':      (' NOT LIKE ', 'value'),
+    'nl':            (' NOT LIKE ', 'value'),
+    'between':       (' BETWEEN ', 'pair'),
+    'b':             (' BETWEEN ', 'pair'),
+    'not-between':   (' NOT BETWEEN ', 'pair'),
+    'nb':            (' NOT BETWEEN ', 'pair'),
+    'in':            (' IN ', 'list'),
+    'i':             (' IN ', 'list'),
+    'not-in':        (' NOT IN ', 'list'),
+    'ni':            (' NOT IN ', 'list'),
+}
+
+
+# SQLite pragma profiles -- DB_CONFIG['pragmas'] = 'performance' | {pragma: value}
+sqlite_profiles = {
+    'performance': {
+        'journal_mode': 'WAL',          # Readers do not block the writer
+        'synchronous':  'NORMAL',       # Safe with WAL, far fewer fsyncs
+        'busy_timeout': 5000,           # Wait (ms) for the lock instead of "database is locked"
+        'cache_size':   -64000,         # 64 MB page cache (negative: KiB)
+        'mmap_size':    268435456,      # 256 MB memory-mapped I/O
+        'temp_store':   'MEMORY',       # Temporary tables and indices in memory
+    },
+}
 
 
 ##################
@@ -27,10 +127,16 @@ class Database:
     # @param {str}  database - Required database name (file -- SQLite)
     # @param {bool} debug    - Optional debug mode
     #
-    # @property {object} conn   - SQLite connection
-    # @property {object} cur    - connection cursor
-    # @property {str}    debug  - The debug mode
-    # @property {module} config - the app config module
+    # @property {object} conn    - SQLite connection
+    # @property {object} cur     - connection cursor
+    # @property {object} pool    - The connection pool of the database (the connection is checked out on the first query)
+    # @property {object} session - The request session sharing the connection
+    # @property {tuple}  replica - The checked out read replica (pool, conn, cur)
+    # @property {bool}   written - The instance wrote to the primary (reads go to the primary)
+    # @property {float}  slow_query - The slow query threshold (DB_CONFIG['slow_query'] seconds)
+    # @property {bool}   autocommit - The autocommit mode (DB_CONFIG['autocommit'])
+    # @property {str}    debug   - The debug mode
+    # @property {module} config  - the app config module
     ##
     def __init__(self, error:bool = True):
 
@@ -40,10 +146,16 @@ class Database:
         # Public properties
         self.conn = None
         self.cur = None
+        self.pool = None
+        self.session = None
+        self.replica = None
+        self.written = False
         self.sp_char = None
         self.development = getattr(self.config, "DEVELOPMENT")
         self.debug = getattr(self.config, 'DEBUG') if error else False
         self.db_system = getattr(self.config, 'DB_SYSTEM')
+        self.autocommit = bool(getattr(self.config, 'DB_CONFIG').get('autocommit', False))
+        self.slow_query = getattr(self.config, 'DB_CONFIG').get('slow_query')
         self.app_path = getattr(self.config, "ROOT_PATH")
 
         # Check platform system
@@ -90,20 +202,6 @@ class Database:
                     else:
                         return False
 
-                # Database exists
-                if self._exist_database(database=self.database):
-                    # Create a database connection
-                    self.conn = DatabaseAPI.connect(self.database)
-
-                    # Convert rows to list of dictionaries
-                    self.conn.row_factory = dict_factory   # dict_factory | sqlite3.Row (needs query(...).keys() for keys)
-                    
-                    # Create the connection cursor
-                    self.cur = self.conn.cursor()
-
-                    # For test
-                    # print("Database Connection Created!")
-
             # Catch error
             except DatabaseError as err:
                 print(err)
@@ -119,37 +217,6 @@ class Database:
             self.password = getattr(self.config, "DB_CONFIG")['password']
             self.database = getattr(self.config, "DB_CONFIG")['database']
 
-            # Try to create a database Connection
-            try:
-                # Database exists
-                if self._exist_database(database=self.database):
-                    # Create a database connection
-                    self.conn = DatabaseAPI.connect(
-                        host=self.host,
-                        user=self.user,
-                        password=self.password,
-                        database=self.database
-                    )
-
-                # Database not exists
-                else:
-                    # Create a root database connection
-                    self.conn = DatabaseAPI.connect(
-                        host=self.host,
-                        user=self.user,
-                        password=self.password
-                    )
-                
-                # Create the connection cursor
-                self.cur = self.conn.cursor(dictionary=True, buffered=True)
-
-                # For test
-                # print("Database Connection Created!")
-
-            # Catch error
-            except DatabaseError as err:
-                print(err)
-
         # Postgres
         elif  self.db_system == 'Postgres':
             # The special character
@@ -162,57 +229,113 @@ class Database:
             self.database = getattr(self.config, "DB_CONFIG")['database']
             self.port = getattr(self.config, "DB_CONFIG")['port']
 
-            # Try to create a database Connection
-            try:
-                # Database exists
-                if self._exist_database(database=self.database):
-                    # Create a database connection
+        # The connection pool (the connection is checked out on the first query)
+        self.pool = Database._pool(self)
+
+
+    ##
+    # @desc Connects to the database on the first query (lazy connection)
+    #       Checks out a pooled connection, or creates a root connection if the database does not exist (development)
+    #
+    # @return {object} -- The connection (None if the connection failed)
+    ##
+    def _connect(self):
+        # Already connected
+        if self.cur:
+            return self.conn
+
+        # Try to create a database Connection
+        try:
+            # Database exists (always True outside development)
+            if self._exist_database(database=self.database):
+                # Check out a pooled database connection
+                Database._checkout(self)
+
+            # Database not exists
+            else:
+                self.pool = None
+
+                # SQLite (the database file is created by _create_database)
+                if self.db_system == 'SQLite':
+                    return self.conn
+
+                # Create a root database connection
+                # MySQL
+                elif self.db_system == 'MySQL':
                     self.conn = DatabaseAPI.connect(
                         host=self.host,
-                        port=self.port,
                         user=self.user,
-                        password=self.password,
-                        database=self.database,
+                        password=self.password
                     )
 
-                # Database not exists
-                else:
-                    # Create a root database connection
+                # Postgres
+                elif self.db_system == 'Postgres':
                     self.conn = DatabaseAPI.connect(
                         host=self.host,
                         port=self.port,
                         user=self.user,
                         password=self.password,
                     )
-                
-                # Create the connection cursor
-                from .connector import DatabaseDict
-                self.cur = self.conn.cursor(cursor_factory=DatabaseDict.DictCursor)     # DictCursor | RealDictCursor | NamedTupleCursor
 
-                # For test
-                # print("Database Connection Created!")
+            # Create the connection cursor
+            # SQLite
+            if self.db_system == 'SQLite':
+                self.cur = self.conn.cursor()
 
-            # Catch error
-            except DatabaseError as err:
-            # except NameError as err:
-                print(err)
+            # MySQL
+            elif self.db_system == 'MySQL':
+                self.cur = self.conn.cursor(dictionary=True, buffered=True)
+
+            # Postgres
+            elif self.db_system == 'Postgres':
+                from .connector import DictRowsCursor
+                self.cur = self.conn.cursor(cursor_factory=DictRowsCursor)     # Plain dict rows (no second copy per row)
+
+            # For test
+            # print("Database Connection Created!")
+
+        # Catch error
+        except DatabaseError as err:
+            print(err)
+
+        return self.conn
 
 
     ##
     # @desc Destructor method
     ##
     def __del__(self):
+        # Return the read replica connection
+        Database._release_replica(self)
+
+        # The request session owns the connection
+        if self.session:
+            self.session = None
+            self.conn = None
+            self.cur = None
+
         # Check the database connection
         if self.conn:
             try:
                 # Commit query result
                 self.conn.commit()
 
+                # Return the connection to the pool
+                if self.pool:
+                    self.pool.checkin(self.conn)
+
                 # Close the connection
-                self.conn.close()
+                else:
+                    self.conn.close()
 
             except:
-                pass
+                # Discard the broken connection
+                if self.pool:
+                    self.pool.checkin(self.conn, discard=True)
+
+            # Release the connection
+            self.conn = None
+            self.cur = None
 
         # For test
         # print("Database Connection Closed!")
@@ -235,15 +358,15 @@ class Database:
 
 
     ##
-    # @desc close method to close the connection manually
+    # @desc rollback method to discard the changes manually
     ##
-    def close(self):
+    def rollback(self):
         # Check the database connection
         if self.conn:
             try:
-                # Close the connection
-                self.conn.close()
-                
+                # Roll back the uncommitted changes
+                self.conn.rollback()
+
                 return True
 
             except:
@@ -251,685 +374,3158 @@ class Database:
 
 
     ##
-    # @desc query method
-    #
-    # @param {str}  sql       -- Required SQL statement (ex. "SELECT * FROM users")
-    # @param {list} data_bind -- Optional data to bind to the sql safely
-    #
-    # @var result: object -- Database query
+    # @desc Starts a transaction (a savepoint if a transaction is already open on the connection)
+    #       Commits (or releases the savepoint) on success, rolls back on exceptions.
+    #       ex. with db.transaction(): db.create(...); db.update(...)
     #
-    # @return {any}
+    # @return {object} -- The Transaction context manager
     ##
-    def query(self, sql:str, data_bind:list=[]):
+    def transaction(self):
+        return Transaction(self)
 
-        # Check required params
-        if not sql:
-            # Developer mode
-            if self.debug:
-                # Raise error
-                raise Exception("You must provide the required parameters: ['sql']")
 
-            # Production mode
-            else:
-                print("You must provide the required parameters: ['sql']")
-                return False
+    ##
+    # @desc close method to close the connection manually
+    ##
+    def close(self):
+        # Return the read replica connection
+        Database._release_replica(self)
 
-        # Try to query to the database
-        try:
-            # Return the query result
-            self.cur.execute(sql, data_bind)
+        # The request session owns the connection (released on teardown)
+        if self.session:
+            self.session = None
+            self.conn = None
+            self.cur = None
 
-            return self.cur
+            return True
 
-        # Catch error
-        except DatabaseError as err:
-            # Developer mode
-            if self.debug:
-                # Raise error
-                raise Exception(err)
+        # Check the database connection
+        if self.conn:
+            try:
+                # Return the connection to the pool
+                if self.pool:
+                    self.pool.checkin(self.conn)
 
-            # Production mode
-            else:
-                print(err)
+                # Close the connection
+                else:
+                    self.conn.close()
+
+                # Release the connection
+                self.conn = None
+                self.cur = None
+                
+                return True
+
+            except:
                 return False
 
 
-    #################
-    # Exist Methods #
-    #################
     ##
-    # CAUTION! Use this methods only in development.
-    #
-    # @desc Checks if a column is a foreign key
-    #
-    # @param {str} table -- Required table name
-    # @param {str} col   -- Required column name
-    # 
-    # @var {str} sql       -- The sql statement
-    # @var {dict} fk_fetch -- The query for SQLite
-    #
-    # @return {bool}
+    # @desc Checks out a connection from the pool, or shares the request session connection
     ##
-    def _exist_fk(self, table:str, column:str):
+    def _checkout(self):
+        # The connection pool
+        self.pool = Database._pool(self)
 
-        # Check development
-        if not self.development:
-            return True
+        # The request session (inside a Flask app context)
+        self.session = Session.current(self.pool)
 
-        # Check required params
-        if not table or not column:
-            # Developer mode
-            if self.debug:
-                # Raise error
-                raise Exception("You must provide the required parameters: ['table', 'column']")
+        # Share the request session connection
+        if self.session:
+            self.conn = self.session.conn
 
-            # Production mode
-            else:
-                print("You must provide the required parameters: ['table', 'column']")
-                return False
+        # Check out a private connection
+        else:
+            self.conn = self.pool.checkout()
 
-        # Prepare sql statements
+
+    ##
+    # @desc Finds (or creates) the process-wide connection pool of the database (or of a read replica)
+    #
+    # @param {dict} replica -- Optional read replica connection parameters (ex. {'host': 'replica-1'})
+    #
+    # @var {dict}  db_config -- The DB_CONFIG attribute of the config module
+    # @var {dict}  params    -- The connection parameters
+    # @var {tuple} key       -- The pool key
+    #
+    # @return {object}
+    ##
+    def _pool(self, replica:dict=None):
+        # Database config
+        db_config = getattr(self.config, "DB_CONFIG")
+
+        # Connection parameters
         # SQLite
         if self.db_system == 'SQLite':
-            # Prepare sql
-            sql = f'''PRAGMA foreign_key_list('{table}');'''
-
-            # Check foreign key
-            fk_fetch = self.query(sql).fetchall()
-            for x in fk_fetch:
-                # Foreign key exists
-                if column == x['from']:
-                    return True
+            params = {
+                'database': self.database,
+            }
 
-            # Foreign key not exists
-            return False
-        
         # MySQL
         elif self.db_system == 'MySQL':
-            # Prepare sql
-            sql = f'''
-            SELECT 
-                TABLE_SCHEMA,
-                TABLE_NAME,
-                COLUMN_NAME,
-                CONSTRAINT_NAME,
-                REFERENCED_TABLE_NAME,
-                REFERENCED_COLUMN_NAME
-            FROM
-                INFORMATION_SCHEMA.KEY_COLUMN_USAGE
-            where 
-                TABLE_SCHEMA = '{self.database}'
-                AND TABLE_NAME = '{table}'
-                AND COLUMN_NAME = '{column}'
-                AND REFERENCED_TABLE_NAME IS NOT NULL;
-            '''
+            params = {
+                'host': self.host,
+                'user': self.user,
+                'password': self.password,
+                'database': self.database,
+            }
 
         # Postgres
         elif self.db_system == 'Postgres':
-            sql = f'''
-                SELECT
-                    tc.table_schema, 
-                    tc.constraint_name, 
-                    tc.table_name, 
-                    kcu.column_name, 
-                    ccu.table_schema AS foreign_table_schema,
-                    ccu.table_name AS foreign_table_name,
-                    ccu.column_name AS foreign_column_name 
-                FROM 
-                    information_schema.table_constraints AS tc 
-                    JOIN information_schema.key_column_usage AS kcu
-                    ON tc.constraint_name = kcu.constraint_name
-                    AND tc.table_schema = kcu.table_schema
-                    JOIN information_schema.constraint_column_usage AS ccu
-                    ON ccu.constraint_name = tc.constraint_name
-                    AND ccu.table_schema = tc.table_schema
-                WHERE 
-                    tc.constraint_type = 'FOREIGN KEY' AND tc.table_name='{table}' AND kcu.column_name='{column}';
-            '''
+            params = {
+                'host': self.host,
+                'port': self.port,
+                'user': self.user,
+                'password': self.password,
+                'database': self.database,
+            }
 
-        # Check foreign key (Postgres and MySQL)
-        # Foreign key exists
-        if self.query(sql).fetchone():
-            return True
-        
-        # Foreign key not exists
-        else:
-            return False
+        # Read replica (overrides the primary connection parameters)
+        if replica:
+            params.update({x: replica[x] for x in params if x in replica})
+
+        # The pool key
+        key = (self.db_system, params.get('host'), params.get('port'), params.get('user'), params['database'])
+
+        # Return the pool
+        return Pool.get(key, functools.partial(Database._connection, self.db_system, params, self.autocommit, Database._pragmas(self)), **db_config.get('pool', {}))
 
 
     ##
-    # CAUTION! Use this methods only in development.
+    # @desc Finds (or creates) the pools of the read replicas (DB_CONFIG['replicas'])
     #
-    # @desc Checks if a column exists
+    # @return {list}
+    ##
+    def _replica_pools(self):
+        if self.pool.replicas == None:
+            self.pool.replicas = [Database._pool(self, replica) for replica in getattr(self.config, "DB_CONFIG").get('replicas', [])]
+
+        return self.pool.replicas
+
+
+    ##
+    # @desc Checks out a read replica for the read queries, or None to read from the primary
+    #       The primary serves the reads inside a transaction, after a write of the instance or the request session,
+    #       for DB_CONFIG['replica_window'] seconds after any write of the process (the replication lag), and when the
+    #       replica pool is exhausted (no waiting for a free replica connection).
+    #       The replica is chosen by DB_CONFIG['replica_policy'] -- round-robin (default) | least-loaded
     #
-    # @param {str} table  -- Required table name
-    # @param {str} column -- Required column name
-    # 
-    # @var {str} sql -- The sql statement
+    # @var {dict} db_config -- The DB_CONFIG attribute of the config module
     #
-    # @return {bool}
+    # @return {tuple|None} -- (pool, conn, cur)
     ##
-    def _exist_column(self, table:str, column:str):
+    def _replica(self):
+        db_config = getattr(self.config, "DB_CONFIG")
 
-        # Check development
-        if not self.development:
-            return True
+        # No replicas (or no pooled primary)
+        if not db_config.get('replicas') or not self.pool:
+            return None
 
-        # Check required params
-        if not table or not column:
-            # Developer mode
-            if self.debug:
-                # Raise error
-                raise Exception("You must provide the required parameters: ['table', 'column']")
+        # Inside a transaction
+        if Transaction.depths.get(id(self.conn)):
+            return None
 
-            # Production mode
-            else:
-                print("You must provide the required parameters: ['table', 'column']")
-                return False
+        # Read your writes (the instance or the request session wrote)
+        session = self.session or (g.get('_aurora_sessions', {}).get(self.pool) if has_app_context() else None)
 
-        # Prepare sql
-        # SQLite
-        if self.db_system == 'SQLite':
-            # Prepare sql
-            sql = f'''SELECT COUNT(*) AS '{column}' FROM pragma_table_info('{table}') WHERE name='{column}';'''
-            
-            # Return result (SQLite)
-            # Column exists
-            if self.query(sql).fetchone()[column]:
-                return True
+        if self.written or (session and session.written):
+            return None
 
-            # Column not exists
-            else:
-                return False
+        # The replication lag window
+        window = db_config.get('replica_window', 0)
 
-        # MySQL
-        elif self.db_system == 'MySQL':
-            # Prepare sql
-            sql = f'''SHOW COLUMNS FROM `{table}` LIKE '{column}';'''
+        if window and self.pool.written and time.monotonic() - self.pool.written < window:
+            return None
 
-        # Postgres
-        elif self.db_system == 'Postgres':
-            sql = f'''SELECT column_name FROM information_schema.columns WHERE table_name='{table}' and column_name='{column}';'''
-            
-        # Return result (Postgres and MySQL)
-        # Column exists
-        if self.query(sql).fetchone():
-            return True
+        # The checked out replica
+        if self.replica:
+            return self.replica
+
+        # Choose a replica
+        pools = Database._replica_pools(self)
+
+        # Least loaded (the fewest checked out connections)
+        if db_config.get('replica_policy') == 'least-loaded':
+            pool = min(pools, key=lambda x: x.size - len(x.idle))
 
-        # Column not exists
+        # Round robin
         else:
-            return False
+            pool = pools[next(self.pool.turn) % len(pools)]
 
+        # The replica pool is exhausted (read from the primary instead of waiting)
+        if not pool.idle and pool.size >= pool.max_size:
+            return None
 
-    ##
-    # CAUTION! Use this methods only in development.
-    #
-    # @desc Checks if a table exist
-    #
-    # @param {str} table -- Required table name
-    # 
-    # @var {str}    sql -- The sql statement
-    # @var {object} cur - The custom connection cursor for Postgres
+        # Check out a replica connection (no waiting)
+        try:
+            conn = pool.checkout(timeout=0)
+
+            # Create the connection cursor
+            # SQLite
+            if self.db_system == 'SQLite':
+                cur = conn.cursor()
+
+            # MySQL
+            elif self.db_system == 'MySQL':
+                cur = conn.cursor(dictionary=True, buffered=True)
+
+            # Postgres
+            elif self.db_system == 'Postgres':
+                from .connector import DictRowsCursor
+                cur = conn.cursor(cursor_factory=DictRowsCursor)
+
+        # Read from the primary
+        except Exception as err:
+            print(err)
+            return None
+
+        self.replica = (pool, conn, cur)
+
+        return self.replica
+
+
+    ##
+    # @desc Returns the read replica connection to its pool
     #
-    # @return {bool}
+    # @param {bool} discard -- Optional discard the (broken) connection
     ##
-    def _exist_table(self, table:str):
+    def _release_replica(self, discard:bool=False):
+        if getattr(self, 'replica', None):
+            pool, conn, cur = self.replica
+            self.replica = None
 
-        # Check development
-        if not self.development:
-            return True
-        
-        # Check required params
-        if not table:
-            # Developer mode
-            if self.debug:
-                # Raise error
-                raise Exception("You must provide the required parameters: ['table']")
+            pool.checkin(conn, discard=discard)
 
-            # Production mode
-            else:
-                print("You must provide the required parameters: ['table']")
-                return False
 
-        # Prepare sql
-        # SQLite
-        if self.db_system == 'SQLite':
-            # Prepare sql
-            sql = f'''SELECT name FROM sqlite_master WHERE type='table' AND name='{table}';'''
+    ##
+    # @desc Records a write -- The following reads of the instance and the request session go to the primary
+    ##
+    def _wrote(self):
+        self.written = True
 
-            # Table exists
-            if self.query(sql).fetchone():
-                return True
-        
-            # Table not exists
-            else:
-                return False
+        if self.session:
+            self.session.written = True
 
-        # MySQL
-        elif self.db_system == 'MySQL':
-            # Prepare sql
-            sql = f'''SHOW TABLES LIKE '{table}';'''
+        if self.pool:
+            self.pool.written = time.monotonic()
 
-            # Table exists
-            if self.query(sql=sql).fetchall():
-                return True
-        
-            # Table not exists
-            else:
-                return False
-        
-        # Postgres 
-        elif self.db_system == 'Postgres':
-            sql = f'''SELECT EXISTS(SELECT * FROM information_schema.tables WHERE table_name='{table}');'''
 
-            cur = self.conn.cursor()
+    ##
+    # @desc Runs a read query on a read replica (or on the primary)
+    #
+    # @param {str}  sql       -- Required SQL statement
+    # @param {list} data_bind -- Optional data to bind to the sql safely
+    #
+    # @return {any}
+    ##
+    def _read_query(self, sql:str, data_bind:list=[]):
+        replica = Database._replica(self)
 
-            # Excecute the query
-            cur.execute(sql)
+        # Primary
+        if not replica:
+            return Database.query(self, sql, data_bind)
 
-            # Check Table existence
-            for x in cur:
-                # Table exists
-                if x[0]:
-                    return True
-            
-                # Table not exists
-                else:
-                    return False
+        # Replica
+        try:
+            start = time.perf_counter()
+            replica[2].execute(sql, data_bind)
+
+            # Record the query
+            Queries.record(self, replica[2], sql, data_bind, time.perf_counter() - start, replica=True)
+
+            return replica[2]
+
+        # Retry on the primary
+        except DatabaseError:
+            Database._release_replica(self, discard=True)
+
+            return Database.query(self, sql, data_bind)
 
 
     ##
-    # CAUTION! Use this methods only in development.
+    # @desc Finds the connection of the read queries (a read replica or the primary)
     #
-    # @desc Checks if a database (file - SQLite) exists
+    # @return {object}
+    ##
+    def _read_conn(self):
+        replica = Database._replica(self)
+
+        return replica[1] if replica else Database._connect(self)
+
+
+    ##
+    # @desc Resolves the SQLite pragmas of DB_CONFIG['pragmas'] (a profile name or a dictionary)
     #
-    # @param {str} database -- Required database name (file - SQLite)
-    # 
-    # @var {str} sql     -- The sql statement
-    # @var {object} conn -- The custom database connection for MySQL and Postgres
-    # @var {object} cur  -- The custom connection cursor for MySQL and Postgres
+    # @var {str|dict} pragmas -- The pragmas config
     #
-    # @return {bool}
+    # @return {dict}
     ##
-    def _exist_database(self, database:str=None):
+    def _pragmas(self):
+        pragmas = getattr(self.config, "DB_CONFIG").get('pragmas')
 
-        # Check development
-        if not self.development:
-            return True
+        # Not SQLite or no pragmas
+        if self.db_system != 'SQLite' or not pragmas:
+            return {}
 
-        # Check the required params
-        if not database:
-            # Developer mode
-            if self.debug:
-                # Raise error
-                raise Exception("You must provide the required parameters: ['database']")
+        # Profile
+        if isinstance(pragmas, str):
+            if pragmas not in sqlite_profiles:
+                err = f'''Invalid SQLite pragma profile: '{pragmas}'!\n'''
+                err += f'''Valid Profiles: {', '.join(sqlite_profiles)}'''
 
-            # Production mode
-            else:
-                print("You must provide the required parameters: ['database']")
-                return False
+                # Developer mode
+                if self.debug:
+                    # Raise error
+                    raise Exception(err)
 
-        # SQLite
-        if self.db_system == 'SQLite':
+                # Production mode
+                else:
+                    print(err)
+                    return {}
 
-            # Database exists
-            if os.path.isfile(self.app_path + self.sep + database):
-                return True
+            pragmas = sqlite_profiles[pragmas]
 
-            # Database not exists
-            else:
-                return False
-        
-        # MySQL
-        elif self.db_system == 'MySQL':
+        # Validate the names and values (pragmas cannot be bound)
+        for name, value in pragmas.items():
+            if not re.match(r'^[a-z_]+$', name) or not re.match(r'^-?\w+$', str(value)):
+                err = f'''Invalid SQLite pragma: '{name}={value}'!'''
 
-            # Create a database connection
-            conn = DatabaseAPI.connect(
-                host=self.host,
-                user=self.user,
-                password=self.password,
-            )
-            
-            # Create the connection cursor
-            cur = conn.cursor()
+                # Developer mode
+                if self.debug:
+                    # Raise error
+                    raise Exception(err)
 
-            # Prepare sql
-            sql = f'''SELECT EXISTS(SELECT SCHEMA_NAME FROM INFORMATION_SCHEMA.SCHEMATA WHERE SCHEMA_NAME='{database}');'''
+                # Production mode
+                else:
+                    print(err)
+                    return {}
 
-            # Excecute the query
-            cur.execute(sql)
+        # Return result
+        return dict(pragmas)
 
-            # Check database existence
-            for x in cur:
-                # Database exists
-                if x[0]:
-                    return True
-            
-                # Database not exists
-                else:
-                    return False
-        
-        # Postgres
-        elif self.db_system == 'Postgres':
 
-            # Create a database connection
-            conn = DatabaseAPI.connect(
-                host=self.host,
-                port=self.port,
-                user=self.user,
-                password=self.password,
-            )
-            
-            # Create the connection cursor
-            cur = conn.cursor()
+    ##
+    # @desc Reads the current values of the configured SQLite pragmas (on the checked out connection)
+    #
+    # @return {dict} -- {pragma: value}
+    ##
+    def _pragma_values(self):
+        result = {}
 
-            # Prepare sql
-            sql = f'''SELECT EXISTS(SELECT datname FROM pg_catalog.pg_database WHERE datname='{database}');'''
+        for name in Database._pragmas(self):
+            row = self.query(f'PRAGMA {name};').fetchone()
+            result[name] = list(row.values())[0] if row else None
 
-            # Excecute the query
-            cur.execute(sql)
+        # Return result
+        return result
 
-            # Check database existence
-            for x in cur:
-                # Database exists
-                if x[0]:
-                    return True
-            
-                # Database not exists
-                else:
-                    return False
+
+    ##
+    # @desc Creates a new database connection (the connection factory of the pools)
+    #
+    # @param {str}  db_system  -- Required database system
+    # @param {dict} params     -- Required connection parameters
+    # @param {bool} autocommit -- Optional autocommit mode (every statement is committed immediately)
+    # @param {dict} pragmas    -- Optional SQLite pragmas (applied once per new connection)
+    #
+    # @return {object}
+    ##
+    @staticmethod
+    def _connection(db_system:str, params:dict, autocommit:bool=False, pragmas:dict={}):
+        # SQLite
+        if db_system == 'SQLite':
+            # Create a database connection (pooled connections may be used by several threads, one at a time)
+            conn = DatabaseAPI.connect(params['database'], check_same_thread=False)
+
+            # Convert rows to list of dictionaries
+            conn.row_factory = dict_factory   # dict_factory | sqlite3.Row (needs query(...).keys() for keys)
+
+            # Autocommit mode
+            if autocommit:
+                conn.isolation_level = None
+
+            # Pragmas
+            for name, value in pragmas.items():
+                conn.execute(f'PRAGMA {name}={value};')
+
+        # MySQL and Postgres
+        else:
+            # Create a database connection
+            conn = DatabaseAPI.connect(**params)
+
+            # Autocommit mode
+            if autocommit:
+                conn.autocommit = True
+
+        # Return the connection
+        return conn
 
 
-    ##################
-    # Create Methods #
-    ##################
     ##
-    # @desc Inserts a single row into a table
+    # @desc query method
     #
-    # @param {str}  table -- Required Table name (ex. "users")
-    # @param {dict} data  -- Required data (ex. {"username": "john-doe", "password": "123456"})
+    # @param {str}  sql       -- Required SQL statement (ex. "SELECT * FROM users")
+    # @param {list} data_bind -- Optional data to bind to the sql safely
     #
-    # @var {str}  sql          -- The sql statement
-    # @var {list} data_bind    -- Data binding against SQL Injection
-    # @var {list} data_key
-    # @var {list} data_value
-    # @var {str}  sql_inserted -- SQL statement for the last inserted id
+    # @var result: object -- Database query
     #
-    # @return {int|bool} -- Last inserted id on success | False on error
+    # @return {any}
     ##
-    def create(self, table:str, data:dict):
+    def query(self, sql:str, data_bind:list=[]):
+
         # Check required params
-        if not table or not data:
+        if not sql:
             # Developer mode
             if self.debug:
                 # Raise error
-                raise Exception("You must provide the required parameters: ['table', 'data']")
+                raise Exception("You must provide the required parameters: ['sql']")
 
             # Production mode
             else:
-                print("You must provide the required parameters: ['table', 'data']")
+                print("You must provide the required parameters: ['sql']")
                 return False
 
-        # Default variables
-        data_bind = []
-        data_key = []
-        data_value = []
+        # Connect on the first query
+        if not self.cur:
+            Database._connect(self)
 
-        # Prepare sql statement
-        # SQLite
-        if self.db_system == 'SQLite':
-            # Prepare data
-            for key, value in data.items():
-                data_key.append(f"'{key}'")
-                data_value.append(self.sp_char)
-                data_bind.append(value)
+        # Try to query to the database
+        try:
+            start = time.perf_counter()
+            self.cur.execute(sql, data_bind)
 
-            data_key = ', '.join(data_key)
-            data_value = ', '.join(data_value)
+            # Record the query
+            Queries.record(self, self.cur, sql, data_bind, time.perf_counter() - start)
 
-            sql = f'''INSERT INTO '{table}' ({data_key}) VALUES({data_value});'''
-        
-        # MySQL
-        elif self.db_system == 'MySQL':
-            # Prepare data
-            for key, value in data.items():
-                data_key.append(f'`{key}`')
-                data_value.append(self.sp_char)
-                data_bind.append(value)
+            # Return the query result
+            return self.cur
 
-            data_key = ', '.join(data_key)
-            data_value = ', '.join(data_value)
+        # Catch error
+        except DatabaseError as err:
+            # Developer mode
+            if self.debug:
+                # Raise error
+                raise Exception(err)
+
+            # Production mode
+            else:
+                print(err)
+                return False
+
+
+    ###################
+    # Catalog Methods #
+    ###################
+    ##
+    # @desc Finds the schema catalog (loaded once per connection pool)
+    #
+    # @param {str} table -- Optional table -- the catalog is loaded again if the table is missing (ex. created by another process)
+    #
+    # @return {dict} -- {table: {"columns": [...], "primary_key": [...], "foreign_keys": {column: (r_table, r_column)}}}
+    ##
+    def _catalog(self, table:str=None):
+        # Pooled connections share the catalog of the pool
+        if self.pool:
+            return self.pool.catalog.tables(self, table)
+
+        # Return result (not cached)
+        return Database._load_catalog(self)
+
+
+    ##
+    # @desc Loads the schema catalog (tables, columns, primary keys and foreign keys)
+    #
+    # @var {dict} tables -- The schema catalog
+    #
+    # @return {dict}
+    ##
+    def _load_catalog(self):
+        tables = {}
+
+        # SQLite
+        if self.db_system == 'SQLite':
+            for x in self.query('''SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%';''').fetchall():
+                tables[x['name']] = {'columns': [], 'primary_key': [], 'foreign_keys': {}}
+
+            for table in tables:
+                # Columns and primary key
+                for x in self.query(f'''PRAGMA table_info("{table}");''').fetchall():
+                    tables[table]['columns'].append(x['name'])
+
+                    if x['pk']:
+                        tables[table]['primary_key'].append(x['name'])
+
+                # Foreign keys
+                for x in self.query(f'''PRAGMA foreign_key_list("{table}");''').fetchall():
+                    tables[table]['foreign_keys'][x['from']] = (x['table'], x['to'])
+
+            # Return result
+            return tables
+
+        # MySQL
+        elif self.db_system == 'MySQL':
+            columns_sql = f'''SELECT TABLE_NAME AS t, COLUMN_NAME AS c, COLUMN_KEY AS k FROM INFORMATION_SCHEMA.COLUMNS WHERE TABLE_SCHEMA={self.sp_char} ORDER BY ORDINAL_POSITION;'''
+            fk_sql = f'''SELECT TABLE_NAME AS t, COLUMN_NAME AS c, REFERENCED_TABLE_NAME AS rt, REFERENCED_COLUMN_NAME AS rc FROM INFORMATION_SCHEMA.KEY_COLUMN_USAGE 
+                         WHERE TABLE_SCHEMA={self.sp_char} AND REFERENCED_TABLE_NAME IS NOT NULL;'''
+            bind = [self.database]
 
-            sql = f'''INSERT INTO `{table}` ({data_key}) VALUES({data_value});'''
-        
         # Postgres
         elif self.db_system == 'Postgres':
-            # Prepare data
-            for key, value in data.items():
-                data_key.append(f'"{key}"')
-                data_value.append(self.sp_char)
-                data_bind.append(value)
+            columns_sql = '''
+                SELECT 
+                    c.table_name AS t, 
+                    c.column_name AS c, 
+                    CASE WHEN EXISTS(
+                        SELECT 1 FROM information_schema.table_constraints AS tc 
+                        JOIN information_schema.key_column_usage AS kcu 
+                        ON tc.constraint_name = kcu.constraint_name AND tc.table_schema = kcu.table_schema
+                        WHERE tc.constraint_type = 'PRIMARY KEY' AND tc.table_name = c.table_name AND tc.table_schema = c.table_schema AND kcu.column_name = c.column_name
+                    ) THEN 'PRI' ELSE '' END AS k
+                FROM 
+                    information_schema.columns AS c
+                WHERE 
+                    c.table_schema NOT IN ('pg_catalog', 'information_schema')
+                ORDER BY 
+                    c.ordinal_position;
+            '''
+            fk_sql = '''
+                SELECT
+                    tc.table_name AS t, 
+                    kcu.column_name AS c, 
+                    ccu.table_name AS rt,
+                    ccu.column_name AS rc 
+                FROM 
+                    information_schema.table_constraints AS tc 
+                    JOIN information_schema.key_column_usage AS kcu
+                    ON tc.constraint_name = kcu.constraint_name
+                    AND tc.table_schema = kcu.table_schema
+                    JOIN information_schema.constraint_column_usage AS ccu
+                    ON ccu.constraint_name = tc.constraint_name
+                    AND ccu.table_schema = tc.table_schema
+                WHERE 
+                    tc.constraint_type = 'FOREIGN KEY';
+            '''
+            bind = []
 
-            data_key = ', '.join(data_key)
-            data_value = ', '.join(data_value)
+        # Columns and primary keys (MySQL and Postgres)
+        for x in self.query(columns_sql, bind).fetchall():
+            table = tables.setdefault(x['t'], {'columns': [], 'primary_key': [], 'foreign_keys': {}})
+            table['columns'].append(x['c'])
+
+            if x['k'] == 'PRI':
+                table['primary_key'].append(x['c'])
 
-            sql = f'''INSERT INTO "{table}" ({data_key}) VALUES({data_value}) RETURNING id;'''
+        # Foreign keys (MySQL and Postgres)
+        for x in self.query(fk_sql, bind).fetchall():
+            if x['t'] in tables:
+                tables[x['t']]['foreign_keys'][x['c']] = (x['rt'], x['rc'])
 
         # Return result
-        if self.query(sql, data_bind):
-            # Last inserted id sql
-            # SQLite
-            if self.db_system == 'SQLite':
-                return self.cur.lastrowid
-            
-            # Postgres
-            elif self.db_system == 'Postgres':
-                result = self.cur.fetchone()
+        return tables
 
-                # Check 'id' existence
-                if self._exist_column(table=table, column='id'):
-                    return result['id']
-                else:
-                    return result
-            
-            # MySQL
-            elif self.db_system == 'MySQL':
-                return self.cur.lastrowid
 
-        else:
-            return False
+    ##
+    # @desc Invalidates the schema catalog (after the DDL methods)
+    ##
+    def _clear_catalog(self):
+        if self.pool:
+            self.pool.catalog.clear()
 
 
+    #################
+    # Exist Methods #
+    #################
     ##
-    # @desc Inserts multi rows
+    # CAUTION! Use this methods only in development.
     #
-    # @param {str}  table -- Required Table name (ex. "users")
-    # @param {list} data  -- Required data (ex. [{...}, {...}, ...])
+    # @desc Checks if a column is a foreign key
+    #
+    # @param {str} table -- Required table name
+    # @param {str} col   -- Required column name
     # 
-    # @return {int} -- Last inserted id
+    # @var {dict} tables -- The schema catalog
+    #
+    # @return {bool}
     ##
-    def create_multi(self, table:str, data:list):
+    def _exist_fk(self, table:str, column:str):
+
+        # Check development
+        if not self.development:
+            return True
+
         # Check required params
-        if not table or not data:
+        if not table or not column:
             # Developer mode
             if self.debug:
                 # Raise error
-                raise Exception("You must provide the required parameters: ['table', 'data']")
+                raise Exception("You must provide the required parameters: ['table', 'column']")
 
             # Production mode
             else:
-                print("You must provide the required parameters: ['table', 'data']")
+                print("You must provide the required parameters: ['table', 'column']")
                 return False
 
-        # Loop data
-        i = 1
-        for x in data:
-            # Excecute the create query and return last inserted id
-            if i == len(data):
-                return self.create(table=table, data=x)
+        # Check the schema catalog
+        tables = Database._catalog(self)
 
-            # Excecute the create query
-            else:
-                self.create(table=table, data=x)
-
-            i += 1
+        # Return result
+        return table in tables and column in tables[table]['foreign_keys']
 
 
     ##
     # CAUTION! Use this methods only in development.
     #
-    # @desc Adds a foreign key to an existing column (MySQL and Postgres)
+    # @desc Checks if a column exists
     #
-    # @param {str} table     -- Required table name
-    # @param {str} column    -- Required column name
-    # @param {str} r_table   -- Required reference table name
-    # @param {str} r_column  -- Required reference column name
-    # @param {str} fk_symbol -- Optional foreign key symbol
-    # @param {str} on_update -- Optional ON UPDATE statement
-    # @param {str} on_delete -- Optional ON DELETE statement
+    # @param {str} table  -- Required table name
+    # @param {str} column -- Required column name
     # 
-    # @var {str} sql -- The sql statement
+    # @var {dict} tables -- The schema catalog
     #
     # @return {bool}
     ##
-    def _create_fk(self, table:str, column:str, r_table:str, r_column:str, fk_symbol:str=None, on_update:str='CASCADE', on_delete:str='CASCADE'):
-        
+    def _exist_column(self, table:str, column:str):
+
         # Check development
         if not self.development:
             return True
 
-        # Check the development
-        if not self.development:
-            alert = '''----------------------------------------------------------\n'''
-            alert += '''INFO!\n'''
-            alert += '''This method is only available in development!\n'''
-            alert += '''----------------------------------------------------------'''
-
-            # Alert the user
-            print(alert)
-
-            # Exit the program
-            exit()
-
-        # Check the database system
-        if not self.db_system == 'Postgres' and not self.db_system == 'MySQL':
+        # Check required params
+        if not table or not column:
             # Developer mode
             if self.debug:
                 # Raise error
-                raise Exception('The "create_fk" method only works with MySQL and Postgres!')
+                raise Exception("You must provide the required parameters: ['table', 'column']")
 
             # Production mode
             else:
-                print('The "create_fk" method only works with MySQL and Postgres!')
+                print("You must provide the required parameters: ['table', 'column']")
                 return False
 
+        # Check the schema catalog
+        tables = Database._catalog(self)
+
+        # Return result
+        return table in tables and column in tables[table]['columns']
+
+
+    ##
+    # CAUTION! Use this methods only in development.
+    #
+    # @desc Checks if a table exist
+    #
+    # @param {str} table -- Required table name
+    # 
+    # @return {bool}
+    ##
+    def _exist_table(self, table:str):
+
+        # Check development
+        if not self.development:
+            return True
+        
         # Check required params
-        if not table or not column or not r_table or not r_column:
+        if not table:
             # Developer mode
             if self.debug:
                 # Raise error
-                raise Exception("You must provide the required parameters: ['table', 'column', 'r_table', 'r_column']")
+                raise Exception("You must provide the required parameters: ['table']")
 
             # Production mode
             else:
-                print("You must provide the required parameters: ['table', 'column', 'r_table', 'r_column']")
+                print("You must provide the required parameters: ['table']")
                 return False
 
-        # Tables not exist
-        if not self._exist_table(table) and self._exist_table(r_table):
-            # Developer mode
-            if self.debug:
-                # Raise error
-                raise Exception(f'Tables "{table}" and/or "{r_table}" do not exist!')
+        # Check the schema catalog
+        return table in Database._catalog(self)
 
-            # Production mode
-            else:
-                print(f'Tables "{table}" and/or "{r_table}" do not exist!')
-                return False
 
-        # Columns not exists
-        if not self._exist_column(table, column) or not self._exist_column(r_table, r_column):
+    ##
+    # CAUTION! Use this methods only in development.
+    #
+    # @desc Checks if a database (file - SQLite) exists
+    #
+    # @param {str} database -- Required database name (file - SQLite)
+    # 
+    # @var {str} sql     -- The sql statement
+    # @var {object} conn -- The custom database connection for MySQL and Postgres
+    # @var {object} cur  -- The custom connection cursor for MySQL and Postgres
+    #
+    # @return {bool}
+    ##
+    def _exist_database(self, database:str=None):
+
+        # Check development
+        if not self.development:
+            return True
+
+        # Check the required params
+        if not database:
             # Developer mode
             if self.debug:
                 # Raise error
-                raise Exception(f'Columns "{column}" and/or "{r_column}" do not exist!')
+                raise Exception("You must provide the required parameters: ['database']")
 
             # Production mode
             else:
-                print(f'Columns "{column}" and/or "{r_column}" do not exist!')
+                print("You must provide the required parameters: ['database']")
                 return False
 
-        # Foreign key already exists
-        if self._exist_fk(table, column):
-            # Developer mode
-            if self.debug:
-                # Raise error
-                raise Exception('The foreign key already exists!')
+        # SQLite
+        if self.db_system == 'SQLite':
 
-            # Production mode
+            # Database exists
+            if os.path.isfile(self.app_path + self.sep + database):
+                return True
+
+            # Database not exists
             else:
-                print('The foreign key already exists!')
                 return False
+        
+        # MySQL
+        elif self.db_system == 'MySQL':
 
-        # Check on_update & on_delete
-        if on_update or on_delete:
-            valid_rel = ['RESTRICT', 'CASCADE', 'SET NULL', 'NO ACTION', 'SET DEFAULT']
+            # Create a database connection
+            conn = DatabaseAPI.connect(
+                host=self.host,
+                user=self.user,
+                password=self.password,
+            )
+            
+            # Create the connection cursor
+            cur = conn.cursor()
 
-            if not on_update.upper() in valid_rel or not on_delete.upper() in valid_rel:
-                # Prepare the alert message
-                alert = f'''The "on_update" and/or "on_delete" parameters are invalid!\n'''
-                alert += f'Valid characters are: {valid_rel}'
-                
-                # Developer mode
-                if self.debug:
-                    # Raise error
-                    raise TypeError(alert)
+            # Prepare sql
+            sql = f'''SELECT EXISTS(SELECT SCHEMA_NAME FROM INFORMATION_SCHEMA.SCHEMATA WHERE SCHEMA_NAME='{database}');'''
 
-                # Production mode
+            # Excecute the query
+            cur.execute(sql)
+
+            # Check database existence
+            for x in cur:
+                # Database exists
+                if x[0]:
+                    return True
+            
+                # Database not exists
                 else:
-                    print(alert)
                     return False
+        
+        # Postgres
+        elif self.db_system == 'Postgres':
 
-        # Everything is OK
-        # Foreign key symbol
-        if not fk_symbol:
-            fk_symbol = f'fk_{table}_{r_table}'
-
-        # ON UPDATE statement
+            # Create a database connection
+            conn = DatabaseAPI.connect(
+                host=self.host,
+                port=self.port,
+                user=self.user,
+                password=self.password,
+            )
+            
+            # Create the connection cursor
+            cur = conn.cursor()
+
+            # Prepare sql
+            sql = f'''SELECT EXISTS(SELECT datname FROM pg_catalog.pg_database WHERE datname='{database}');'''
+
+            # Excecute the query
+            cur.execute(sql)
+
+            # Check database existence
+            for x in cur:
+                # Database exists
+                if x[0]:
+                    return True
+            
+                # Database not exists
+                else:
+                    return False
+
+
+    ##################
+    # Create Methods #
+    ##################
+    ##
+    # @desc Inserts a single row into a table
+    #
+    # @param {str}  table -- Required Table name (ex. "users")
+    # @param {dict} data  -- Required data (ex. {"username": "john-doe", "password": "123456"})
+    #
+    # @var {str}  sql          -- The sql statement
+    # @var {list} data_bind    -- Data binding against SQL Injection
+    # @var {list} data_key
+    # @var {list} data_value
+    # @var {str}  sql_inserted -- SQL statement for the last inserted id
+    #
+    # @return {int|bool} -- Last inserted id on success | False on error
+    ##
+    @writes
+    def create(self, table:str, data:dict):
+        # Check required params
+        if not table or not data:
+            # Developer mode
+            if self.debug:
+                # Raise error
+                raise Exception("You must provide the required parameters: ['table', 'data']")
+
+            # Production mode
+            else:
+                print("You must provide the required parameters: ['table', 'data']")
+                return False
+
+        # Default variables
+        data_bind = []
+        data_key = []
+        data_value = []
+
+        # Prepare sql statement
+        # SQLite
+        if self.db_system == 'SQLite':
+            # Prepare data
+            for key, value in data.items():
+                data_key.append(f"'{key}'")
+                data_value.append(self.sp_char)
+                data_bind.append(value)
+
+            data_key = ', '.join(data_key)
+            data_value = ', '.join(data_value)
+
+            sql = f'''INSERT INTO '{table}' ({data_key}) VALUES({data_value});'''
+        
+        # MySQL
+        elif self.db_system == 'MySQL':
+            # Prepare data
+            for key, value in data.items():
+                data_key.append(f'`{key}`')
+                data_value.append(self.sp_char)
+                data_bind.append(value)
+
+            data_key = ', '.join(data_key)
+            data_value = ', '.join(data_value)
+
+            sql = f'''INSERT INTO `{table}` ({data_key}) VALUES({data_value});'''
+        
+        # Postgres
+        elif self.db_system == 'Postgres':
+            # Prepare data
+            for key, value in data.items():
+                data_key.append(f'"{key}"')
+                data_value.append(self.sp_char)
+                data_bind.append(value)
+
+            data_key = ', '.join(data_key)
+            data_value = ', '.join(data_value)
+
+            # The primary key (from the schema catalog, loaded again for a new table)
+            tables = Database._catalog(self, table)
+            primary_key = tables[table]['primary_key'][0] if table in tables and tables[table]['primary_key'] else None
+
+            sql = f'''INSERT INTO "{table}" ({data_key}) VALUES({data_value}){f' RETURNING "{primary_key}"' if primary_key else ''};'''
+
+        # Return result
+        if self.query(sql, data_bind):
+            # Last inserted id sql
+            # SQLite
+            if self.db_system == 'SQLite':
+                return self.cur.lastrowid
+            
+            # Postgres
+            elif self.db_system == 'Postgres':
+                # No primary key
+                if not primary_key:
+                    return True
+
+                return self.cur.fetchone()[primary_key]
+            
+            # MySQL
+            elif self.db_system == 'MySQL':
+                return self.cur.lastrowid
+
+        else:
+            return False
+
+
+    ##
+    # @desc Inserts multi rows (bulk insert)
+    #       SQLite and MySQL: executemany, Postgres: COPY FROM STDIN
+    #       returning: multi-row VALUES batches with RETURNING (SQLite 3.35+ and Postgres), single inserts (MySQL)
+    #
+    # @param {str}  table     -- Required Table name (ex. "users")
+    # @param {list} data      -- Required data (ex. [{...}, {...}, ...])
+    # @param {bool} returning -- Optional return the inserted ids
+    #
+    # @var {list} groups -- The consecutive rows with the same columns
+    # 
+    # @return {int|list|bool} -- The number of inserted rows | The inserted ids (returning) | False on error
+    ##
+    @writes
+    def create_multi(self, table:str, data:list, returning:bool=False):
+        # Check required params
+        if not table or not data:
+            # Developer mode
+            if self.debug:
+                # Raise error
+                raise Exception("You must provide the required parameters: ['table', 'data']")
+
+            # Production mode
+            else:
+                print("You must provide the required parameters: ['table', 'data']")
+                return False
+
+        # Group the consecutive rows with the same columns
+        groups = []
+        for row in data:
+            if groups and tuple(row) == groups[-1][0]:
+                groups[-1][1].append(row)
+            else:
+                groups.append((tuple(row), [row]))
+
+        ids = []
+        count = 0
+
+        for cols, rows in groups:
+            # The inserted ids
+            if returning:
+                result = Database._insert_returning(self, table, cols, rows)
+
+            # Postgres
+            elif self.db_system == 'Postgres':
+                result = Database._insert_copy(self, table, cols, rows)
+
+            # SQLite or MySQL
+            else:
+                result = Database._insert_many(self, table, cols, rows)
+
+            # Insert failed
+            if result == False:
+                return False
+
+            # Collect the result
+            if returning:
+                ids.extend(result)
+            else:
+                count += len(rows)
+
+        # Return result
+        return ids if returning else count
+
+
+    ##
+    # @desc Inserts the rows with executemany (SQLite and MySQL)
+    #
+    # @param {str}   table -- Required Table name
+    # @param {tuple} cols  -- Required columns
+    # @param {list}  rows  -- Required rows
+    #
+    # @return {bool}
+    ##
+    def _insert_many(self, table:str, cols:tuple, rows:list):
+        # Prepare the sql statement
+        cols_sql = ', '.join([Database._quote(self, col) for col in cols])
+        values_sql = ', '.join([self.sp_char] * len(cols))
+
+        sql = f'''INSERT INTO {Database._quote(self, table)} ({cols_sql}) VALUES({values_sql});'''
+
+        # Return result
+        return Database._query_many(self, sql, [[row[col] for col in cols] for row in rows])
+
+
+    ##
+    # @desc Inserts the rows with COPY FROM STDIN (Postgres)
+    #
+    # @param {str}   table -- Required Table name
+    # @param {tuple} cols  -- Required columns
+    # @param {list}  rows  -- Required rows
+    #
+    # @var {list} lines -- The COPY text format lines (tab separated, \N for NULL)
+    #
+    # @return {bool}
+    ##
+    def _insert_copy(self, table:str, cols:tuple, rows:list):
+        # Prepare the sql statement
+        cols_sql = ', '.join([Database._quote(self, col) for col in cols])
+
+        sql = f'''COPY {Database._quote(self, table)} ({cols_sql}) FROM STDIN;'''
+
+        # Connect on the first query
+        if not self.cur:
+            Database._connect(self)
+
+        # Copy the rows in chunks
+        try:
+            for i in range(0, len(rows), 10000):
+                lines = ['\t'.join([Database._copy_value(row[col]) for col in cols]) for row in rows[i:i + 10000]]
+
+                start = time.perf_counter()
+                self.cur.copy_expert(sql, io.StringIO('\n'.join(lines) + '\n'))
+
+                # Record the chunk (COPY can not be explained)
+                Queries.record(self, self.cur, sql, [], time.perf_counter() - start, explain=False, params=len(lines) * len(cols))
+
+            return True
+
+        # Catch error
+        except DatabaseError as err:
+            # Developer mode
+            if self.debug:
+                # Raise error
+                raise Exception(err)
+
+            # Production mode
+            else:
+                print(err)
+                return False
+
+
+    ##
+    # @desc Converts a value into the COPY text format
+    #       Booleans as t/f, dicts as JSON and lists as Postgres array literals (as psycopg2 adapts a list)
+    #
+    # @param {any} value -- Required value
+    #
+    # @return {str}
+    ##
+    @staticmethod
+    def _copy_value(value):
+        # NULL
+        if value is None:
+            return '\\N'
+
+        # Binary data
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return '\\\\x' + bytes(value).hex()
+
+        # Boolean
+        if isinstance(value, bool):
+            return 't' if value else 'f'
+
+        # JSON
+        if isinstance(value, dict):
+            value = json.dumps(value, default=str)
+
+        # Array
+        elif isinstance(value, (list, tuple)):
+            value = Database._array_value(value)
+
+        # Escape the special characters
+        value = str(value)
+        value = value.replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r')
+
+        # Return result
+        return value
+
+
+    ##
+    # @desc Converts a list into a Postgres array literal (ex. [1, None, "a b"] -> {1,NULL,"a b"})
+    #
+    # @param {list} value -- Required list
+    #
+    # @return {str}
+    ##
+    @staticmethod
+    def _array_value(value):
+        items = []
+
+        for item in value:
+            # NULL
+            if item is None:
+                items.append('NULL')
+
+            # Nested array
+            elif isinstance(item, (list, tuple)):
+                items.append(Database._array_value(item))
+
+            # Boolean
+            elif isinstance(item, bool):
+                items.append('t' if item else 'f')
+
+            # Number
+            elif isinstance(item, (int, float)):
+                items.append(str(item))
+
+            # Text (quoted), JSON
+            else:
+                item = json.dumps(item, default=str) if isinstance(item, dict) else str(item)
+                items.append('"' + item.replace('\\', '\\\\').replace('"', '\\"') + '"')
+
+        # Return result
+        return '{' + ','.join(items) + '}'
+
+
+    ##
+    # @desc Inserts the rows and returns the inserted ids
+    #       SQLite (3.35+) and Postgres: multi-row VALUES batches (sized to the driver parameter limit) with RETURNING
+    #       MySQL and older SQLite: single inserts
+    #
+    # @param {str}   table -- Required Table name
+    # @param {tuple} cols  -- Required columns
+    # @param {list}  rows  -- Required rows
+    #
+    # @return {list|bool}
+    ##
+    def _insert_returning(self, table:str, cols:tuple, rows:list):
+        ids = []
+
+        # Single inserts (no RETURNING support)
+        if self.db_system == 'MySQL' or (self.db_system == 'SQLite' and DatabaseAPI.sqlite_version_info < (3, 35, 0)):
+            # Prepare the sql statement
+            cols_sql = ', '.join([Database._quote(self, col) for col in cols])
+            values_sql = ', '.join([self.sp_char] * len(cols))
+
+            sql = f'''INSERT INTO {Database._quote(self, table)} ({cols_sql}) VALUES({values_sql});'''
+
+            for row in rows:
+                # Insert failed
+                if not self.query(sql, [row[col] for col in cols]):
+                    return False
+
+                ids.append(self.cur.lastrowid)
+
+            return ids
+
+        # The primary key
+        primary_key = Database._primary_key(self, table) or 'id'
+
+        # The maximum number of rows per statement (driver parameter limit)
+        limit = 32766 if self.db_system == 'SQLite' and DatabaseAPI.sqlite_version_info >= (3, 32, 0) else 999 if self.db_system == 'SQLite' else 65535
+        size = max(1, min(1000, limit // max(1, len(cols))))
+
+        cols_sql = ', '.join([Database._quote(self, col) for col in cols])
+        values_sql = '(' + ', '.join([self.sp_char] * len(cols)) + ')'
+
+        for i in range(0, len(rows), size):
+            batch = rows[i:i + size]
+
+            # Prepare the sql statement
+            sql = f'''INSERT INTO {Database._quote(self, table)} ({cols_sql}) VALUES {', '.join([values_sql] * len(batch))} RETURNING {Database._quote(self, primary_key)};'''
+            data_bind = [row[col] for row in batch for col in cols]
+
+            # Insert failed
+            if not self.query(sql, data_bind):
+                return False
+
+            ids.extend([x[primary_key] for x in self.cur.fetchall()])
+
+        # Return result
+        return ids
+
+
+    ##
+    # @desc Inserts a row or updates it on conflict (upsert) in one statement
+    #       SQLite and Postgres: ON CONFLICT DO UPDATE, MySQL: ON DUPLICATE KEY UPDATE
+    #
+    # @param {str}  table         -- Required Table name (ex. "users")
+    # @param {dict} data          -- Required data (ex. {"email": "john@doe.com", "name": "John"})
+    # @param {list} conflict_cols -- Required unique columns (ex. ["email"]) (MySQL uses the table unique keys)
+    # @param {list} update_cols   -- Optional columns to update on conflict (all the other data columns by default)
+    #
+    # @return {bool}
+    ##
+    def upsert(self, table:str, data:dict, conflict_cols:list, update_cols:list=None):
+        return Database.upsert_multi(self, table=table, data=[data], conflict_cols=conflict_cols, update_cols=update_cols)
+
+
+    ##
+    # @desc Inserts multi rows or updates them on conflict (bulk upsert) in multi-row VALUES batches
+    #
+    # @param {str}  table         -- Required Table name (ex. "users")
+    # @param {list} data          -- Required data (ex. [{...}, {...}, ...])
+    # @param {list} conflict_cols -- Required unique columns (ex. ["email"]) (MySQL uses the table unique keys)
+    # @param {list} update_cols   -- Optional columns to update on conflict (all the other data columns by default)
+    #
+    # @var {list} groups -- The consecutive rows with the same columns
+    #
+    # @return {bool}
+    ##
+    @writes
+    def upsert_multi(self, table:str, data:list, conflict_cols:list, update_cols:list=None):
+        # Check required params
+        if not table or not data or not conflict_cols:
+            # Developer mode
+            if self.debug:
+                # Raise error
+                raise Exception("You must provide the required parameters: ['table', 'data', 'conflict_cols']")
+
+            # Production mode
+            else:
+                print("You must provide the required parameters: ['table', 'data', 'conflict_cols']")
+                return False
+
+        # Group the consecutive rows with the same columns
+        groups = []
+        for row in data:
+            if groups and tuple(row) == groups[-1][0]:
+                groups[-1][1].append(row)
+            else:
+                groups.append((tuple(row), [row]))
+
+        for cols, rows in groups:
+            # The columns to update
+            if update_cols == None:
+                u_cols = [col for col in cols if not col in conflict_cols]
+            else:
+                u_cols = update_cols
+
+            # Prepare the conflict clause
+            # MySQL
+            if self.db_system == 'MySQL':
+                # Nothing to update (no-op update)
+                if not u_cols:
+                    conflict_sql = f' ON DUPLICATE KEY UPDATE {Database._quote(self, conflict_cols[0])}={Database._quote(self, conflict_cols[0])}'
+                else:
+                    conflict_sql = ' ON DUPLICATE KEY UPDATE ' + ', '.join([f'{Database._quote(self, col)}=VALUES({Database._quote(self, col)})' for col in u_cols])
+
+            # SQLite and Postgres
+            else:
+                target_sql = ', '.join([Database._quote(self, col) for col in conflict_cols])
+
+                # Nothing to update
+                if not u_cols:
+                    conflict_sql = f' ON CONFLICT ({target_sql}) DO NOTHING'
+                else:
+                    conflict_sql = f' ON CONFLICT ({target_sql}) DO UPDATE SET ' + ', '.join([f'{Database._quote(self, col)}=excluded.{Database._quote(self, col)}' for col in u_cols])
+
+            # The maximum number of rows per statement (driver parameter limit)
+            limit = 999 if self.db_system == 'SQLite' and DatabaseAPI.sqlite_version_info < (3, 32, 0) else 32766 if self.db_system == 'SQLite' else 65535
+            size = max(1, min(1000, limit // len(cols)))
+
+            cols_sql = ', '.join([Database._quote(self, col) for col in cols])
+            values_sql = '(' + ', '.join([self.sp_char] * len(cols)) + ')'
+
+            for i in range(0, len(rows), size):
+                batch = rows[i:i + size]
+
+                # Prepare the sql statement
+                sql = f'''INSERT INTO {Database._quote(self, table)} ({cols_sql}) VALUES {', '.join([values_sql] * len(batch))}{conflict_sql};'''
+                data_bind = [row[col] for row in batch for col in cols]
+
+                # Upsert failed
+                if not self.query(sql, data_bind):
+                    return False
+
+        # Return result
+        return True
+
+
+    ##
+    # @desc Executes a sql statement against all the data binds (executemany)
+    #
+    # @param {str}  sql        -- Required sql statement
+    # @param {list} data_binds -- Required data binds (a list per execution)
+    #
+    # @return {bool}
+    ##
+    def _query_many(self, sql:str, data_binds:list):
+        # Connect on the first query
+        if not self.cur:
+            Database._connect(self)
+
+        # Try to query to the database
+        try:
+            start = time.perf_counter()
+            self.cur.executemany(sql, data_binds)
+
+            # Record the query (EXPLAIN with the first data bind)
+            Queries.record(self, self.cur, sql, data_binds[0] if data_binds else [], time.perf_counter() - start,
+                           params=sum([len(x) for x in data_binds]))
+
+            return True
+
+        # Catch error
+        except DatabaseError as err:
+            # Developer mode
+            if self.debug:
+                # Raise error
+                raise Exception(err)
+
+            # Production mode
+            else:
+                print(err)
+                return False
+
+
+    ##
+    # CAUTION! Use this methods only in development.
+    #
+    # @desc Adds a foreign key to an existing column (MySQL and Postgres)
+    #
+    # @param {str} table     -- Required table name
+    # @param {str} column    -- Required column name
+    # @param {str} r_table   -- Required reference table name
+    # @param {str} r_column  -- Required reference column name
+    # @param {str} fk_symbol -- Optional foreign key symbol
+    # @param {str} on_update -- Optional ON UPDATE statement
+    # @param {str} on_delete -- Optional ON DELETE statement
+    # 
+    # @var {str} sql -- The sql statement
+    #
+    # @return {bool}
+    ##
+    @ddl
+    def _create_fk(self, table:str, column:str, r_table:str, r_column:str, fk_symbol:str=None, on_update:str='CASCADE', on_delete:str='CASCADE'):
+        
+        # Check development
+        if not self.development:
+            return True
+
+        # Check the development
+        if not self.development:
+            alert = '''----------------------------------------------------------\n'''
+            alert += '''INFO!\n'''
+            alert += '''This method is only available in development!\n'''
+            alert += '''----------------------------------------------------------'''
+
+            # Alert the user
+            print(alert)
+
+            # Exit the program
+            exit()
+
+        # Check the database system
+        if not self.db_system == 'Postgres' and not self.db_system == 'MySQL':
+            # Developer mode
+            if self.debug:
+                # Raise error
+                raise Exception('The "create_fk" method only works with MySQL and Postgres!')
+
+            # Production mode
+            else:
+                print('The "create_fk" method only works with MySQL and Postgres!')
+                return False
+
+        # Check required params
+        if not table or not column or not r_table or not r_column:
+            # Developer mode
+            if self.debug:
+                # Raise error
+                raise Exception("You must provide the required parameters: ['table', 'column', 'r_table', 'r_column']")
+
+            # Production mode
+            else:
+                print("You must provide the required parameters: ['table', 'column', 'r_table', 'r_column']")
+                return False
+
+        # Tables not exist
+        if not self._exist_table(table) and self._exist_table(r_table):
+            # Developer mode
+            if self.debug:
+                # Raise error
+                raise Exception(f'Tables "{table}" and/or "{r_table}" do not exist!')
+
+            # Production mode
+            else:
+                print(f'Tables "{table}" and/or "{r_table}" do not exist!')
+                return False
+
+        # Columns not exists
+        if not self._exist_column(table, column) or not self._exist_column(r_table, r_column):
+            # Developer mode
+            if self.debug:
+                # Raise error
+                raise Exception(f'Columns "{column}" and/or "{r_column}" do not exist!')
+
+            # Production mode
+            else:
+                print(f'Columns "{column}" and/or "{r_column}" do not exist!')
+                return False
+
+        # Foreign key already exists
+        if self._exist_fk(table, column):
+            # Developer mode
+            if self.debug:
+                # Raise error
+                raise Exception('The foreign key already exists!')
+
+            # Production mode
+            else:
+                print('The foreign key already exists!')
+                return False
+
+        # Check on_update & on_delete
+        if on_update or on_delete:
+            valid_rel = ['RESTRICT', 'CASCADE', 'SET NULL', 'NO ACTION', 'SET DEFAULT']
+
+            if not on_update.upper() in valid_rel or not on_delete.upper() in valid_rel:
+                # Prepare the alert message
+                alert = f'''The "on_update" and/or "on_delete" parameters are invalid!\n'''
+                alert += f'Valid characters are: {valid_rel}'
+                
+                # Developer mode
+                if self.debug:
+                    # Raise error
+                    raise TypeError(alert)
+
+                # Production mode
+                else:
+                    print(alert)
+                    return False
+
+        # Everything is OK
+        # Foreign key symbol
+        if not fk_symbol:
+            fk_symbol = f'fk_{table}_{r_table}'
+
+        # ON UPDATE statement
         if on_update:
             on_update = f' ON UPDATE {on_update}'
         else:
-            on_update = ''
+            on_update = ''
+
+        # ON DELETE statement
+        if on_delete:
+            on_delete = f' ON DELETE {on_delete}'
+        else:
+            on_delete = ''
+
+        # MySQL
+        if self.db_system == 'MySQL':
+            sql = f'''
+                ALTER TABLE `{table}`
+                ADD CONSTRAINT `{fk_symbol}`
+                FOREIGN KEY (`{column}`)
+                REFERENCES `{r_table}`(`{r_column}`)
+                {on_update + on_delete};
+            '''
+
+        # Postgres
+        elif self.db_system == 'Postgres':
+            sql = f'''
+                ALTER TABLE "{table}"
+                ADD CONSTRAINT "{fk_symbol}"
+                FOREIGN KEY ("{column}")
+                REFERENCES "{r_table}"("{r_column}")
+                {on_update + on_delete};
+            '''
+
+        # Attempt to add the foreign key
+        try:
+            # Add the foreign key
+            self.query(sql)
+
+            # Return the result
+            return True
+
+        # Handle errors
+        except NameError as err:
+            # Developer mode
+            if self.debug:
+                # Raise error
+                raise Exception(err)
+
+            # Production mode
+            else:
+                print(err)
+                return False
+
+
+    ##
+    # CAUTION! Use this methods only in development.
+    #
+    # @desc Adds a new column
+    #
+    # @param {str} table       -- Required table name
+    # @param {str} col_data    -- Required column and it's data
+    # @param {str} datatype    -- Required datatype of the column
+    # @param {str} constraints -- Optional column constraints 
+    #
+    # @var {str} sql             -- The sql statement
+    # @var {str} table_existance -- SQL statement for sqlite_master
+    #
+    # @return {bool}
+    ##
+    @ddl
+    def _create_column(self, table:str, column:str, datatype:str, constraints:str=None):
+
+        # Check development
+        if not self.development:
+            return True
+
+        # Check the development
+        if not self.development:
+            alert = '''----------------------------------------------------------\n'''
+            alert += '''INFO!\n'''
+            alert += '''This method is only available in development!\n'''
+            alert += '''----------------------------------------------------------'''
+
+            # Alert the user
+            print(alert)
+
+            # Exit the program
+            exit()
+
+        # Check required params
+        if not table or not column or not datatype:
+            # Developer mode
+            if self.debug:
+                # Raise error
+                raise Exception("You must provide the required parameters: ['table', 'column', 'datatype']")
+
+            # Production mode
+            else:
+                print("You must provide the required parameters: ['table', 'column', 'datatype']")
+                return False
+
+        # Check constraints
+        if constraints:
+            constraints = f' {constraints}'
+        else:
+            constraints = ''
+
+        # Prepare sql statements
+        # SQLite
+        if self.db_system == 'SQLite':
+            sql = f'''
+                ALTER TABLE '{table}'
+                ADD '{column}' {datatype + constraints};
+            '''
+        # MySQL
+        elif self.db_system == 'MySQL':
+            sql = f'''
+                ALTER TABLE `{table}`
+                ADD `{column}` {datatype + constraints};
+            '''
+        # Postgres
+        elif self.db_system == 'Postgres':
+            sql = f'''
+                ALTER TABLE "{table}"
+                ADD "{column}" {datatype + constraints};
+            '''
+
+        # Table exists
+        if self._exist_table(table):
+
+            # Column not exists
+            if not self._exist_column(table, column):
+                # Add the column
+                self.query(sql)
+
+                # Return the result
+                return True
+
+            # Table exists
+            else:
+                # Developer mode
+                if self.debug:
+                    # Raise error
+                    raise Exception(f'Column "{column}" already exists!')
+
+                # Production mode
+                else:
+                    print(f'Column "{column}" already exists!')
+                    return False
+
+        # Table not exists
+        else:
+            # Developer mode
+            if self.debug:
+                # Raise error
+                raise Exception(f'Table "{table}" doesn\'t exist!')
+
+            # Production mode
+            else:
+                print(f'Table "{table}" doesn\'t exist!')
+                return False
+
+
+    ##
+    # CAUTION! Use this methods only in development.
+    #
+    # @desc Creates a table if not exists.
+    #
+    # @Syntax:
+    # foreign_key = {
+    #   'user_id': {
+    #       'r_table':   'users',
+    #       'r_column':  'id',
+    #       'on_update': RESTRICT | CASCADE | SET NULL | NO ACTION | SET DEFAULT,
+    #       'on_delete': RESTRICT | CASCADE | SET NULL | NO ACTION | SET DEFAULT,
+    #   },
+    # }
+    #
+    # @param {str}  table       -- Required table name
+    # @param {dict} col_type    -- Required column names and datatypes
+    # @param {str}  primary_key -- Optional PRIMARY KEY column
+    # @param {list} unique      -- Optional UNIQUE Constraint columns
+    # @param {list} not_null    -- Optional NOT NULL Constraint columns
+    # @param {dict} default     -- Optional DEFAULT Constraint columns
+    # @param {dict} check       -- Optional CHECK Constraint for the table
+    # @param {dict} foreign_key -- Optional FOREIGN KEY Constraints
+    #
+    # @var {str}  sql             -- The sql statement
+    # @var {list} data_list       -- SQL data as list
+    # @var {str}  data_sql        -- The sql data
+    # @var {str}  table_existance -- SQL statement for sqlite_master
+    # @var {str}  pk_col          -- The PRIMARY KEY sql statement
+    # @var {str}  unique_col      -- The UNIQUE sql statement
+    # @var {str}  null_col        -- The NOT NULL sql statement
+    # @var {str}  default_col     -- The DEFAULT sql statement
+    # @var {str}  check_col       -- The CHECK sql statement
+    # @var {str}  auto_increment  -- The AUTO_INCREMENT sql statement for MySQL
+    # @var {str}  r_table         -- The reference table name for the foreign key
+    # @var {str}  r_column        -- The reference column name for the foreign key
+    # @var {str}  fk_symbol       -- The foreign key symbol for Postgres and MySQL
+    # @var {str}  on_update       -- ON UPDATE statement for the foreign key
+    # @var {str}  on_delete       -- ON DELETE statement for the foreign key
+    #
+    # @return {bool}
+    ##
+    @ddl
+    def _create_table(self, table:str, col_type:dict, primary_key:str=None, unique:list=[], not_null:list=[], 
+        default:dict={}, check:dict={}, foreign_key:dict={}):
+
+        # Check development
+        if not self.development:
+            return True
+
+        # Check the development
+        if not self.development:
+            alert = '''----------------------------------------------------------\n'''
+            alert += '''INFO!\n'''
+            alert += '''This method is only available in development!\n'''
+            alert += '''----------------------------------------------------------'''
+
+            # Alert the user
+            print(alert)
+
+            # Exit the program
+            exit()
+
+        # Placeholders
+        data_list = []
+        data_sql = ''
+        
+        # Check required params
+        if not table or not col_type:
+            # Developer mode
+            if self.debug:
+                # Raise error
+                raise Exception("You must provide the required parameters: ['table', 'col_type']")
+
+            # Production mode
+            else:
+                print("You must provide the required parameters: ['table', 'col_type']")
+                return False
+
+        # Columns and datatypes
+        for key, value in col_type.items():
+            pk_col = ' PRIMARY KEY' if key == primary_key else ''
+            unique_col = ' UNIQUE' if key in unique else ''
+            null_col = ' NOT NULL' if key in not_null else ''
+            default_col = f' DEFAULT {default[key]}' if key in default else ''
+            check_col = f' CHECK ({check[key]})' if key in check else ''
+
+            # MySQL AUTO_INCREMENT
+            if self.db_system == 'MySQL' and pk_col:
+                pk_col += ' AUTO_INCREMENT'
+
+            # Postgres AUTO_INCREMENT
+            if self.db_system == 'Postgres' and pk_col:
+                # data_list.append(f'{key} SERIAL')
+                if not value.upper() in ['SMALLSERIAL', 'SERIAL', 'BIGSERIAL']:
+                    value = 'SERIAL'
+
+            # SQLite
+            if self.db_system == 'SQLite':
+                data_list.append(f''''{key}' {value.upper() + pk_col + unique_col + null_col + default_col + check_col}''')
+
+            # MySQL
+            elif self.db_system == 'MySQL':
+                data_list.append(f'''`{key}` {value.upper() + pk_col + unique_col + null_col + default_col + check_col}''')
+
+            # Postgres
+            elif self.db_system == 'Postgres':
+                data_list.append(f'''"{key}" {value.upper() + pk_col + unique_col + null_col + default_col + check_col}''')
+
+        # FOREIGN KEY
+        if foreign_key:
+            for key, value in foreign_key.items():
+                
+                # Reference table and column
+                r_table = value['r_table']
+                r_column = value['r_column']
+
+                # Foreign key symbol
+                fk_symbol = f'fk_{table}_{r_table}'
+
+                # Foreign key on update and delete
+                try:
+                    on_update = value['on_update']
+                    on_delete = value['on_delete']
+                except:
+                    on_update = None
+                    on_delete = None
+
+                on_update = f' ON UPDATE {on_update}' if on_update else ''
+                on_delete = f' ON DELETE {on_delete}' if on_delete else ''
+                
+                # SQLite
+                if self.db_system == 'SQLite':
+                    data_list.append(f'''FOREIGN KEY ('{key}') REFERENCES '{r_table}'('{r_column}'){on_update + on_delete}''')
+
+                # MySQL
+                elif self.db_system == 'MySQL':
+                    data_list.append(f'''CONSTRAINT {fk_symbol} FOREIGN KEY (`{key}`) REFERENCES `{r_table}`(`{r_column}`){on_update + on_delete}''')
+
+                # Postgres
+                elif self.db_system == 'Postgres':
+                    data_list.append(f'''CONSTRAINT {fk_symbol} FOREIGN KEY ("{key}") REFERENCES "{r_table}"("{r_column}"){on_update + on_delete}''')
+
+        # Prepare sql data
+        data_sql = ',\n    '.join(data_list)
+
+        # Prepare final sql statements
+        # SQLite
+        if self.db_system == 'SQLite':
+            sql = f'''CREATE TABLE '{table}' (\n    '''
+            sql += data_sql
+            sql += '''\n);'''
+
+        # MySQL
+        elif self.db_system == 'MySQL':
+            sql = f'''CREATE TABLE `{table}` (\n    '''
+            sql += data_sql
+            sql += '''\n);'''
+
+        # Postgres
+        elif self.db_system == 'Postgres':
+            sql = f'''CREATE TABLE "{table}" (\n    '''
+            sql += data_sql
+            sql += '''\n);'''
+
+        # Table not exists
+        if not self._exist_table(table):
+            # Create the table
+            self.query(sql)
+
+            # Return the result
+            return True
+            
+        # Table already exists
+        else:
+            # Developer mode
+            if self.debug:
+                # Raise error
+                raise Exception(f'Table "{table}" already exists!')
+
+            # Production mode
+            else:
+                print(f'Table "{table}" already exists!')
+                return False
+
+
+    ##
+    # CAUTION! Use this methods only in development.
+    #
+    # @desc Creates a new database (file - SQLite)
+    #
+    # @param {str} database -- Required database name (file - SQLite)
+    # 
+    # @var {str}    sql   -- The sql statement
+    # @var {str}    err   -- The error message for SQLite
+    # @var {object} conn  -- The custom database connection for Postgres and MySQL
+    # @var {object} cur:  -- The custom connection cursor for Postgres and MySQL
+    #
+    # @return {bool}
+    ##
+    @ddl
+    def _create_database(self, database:str=None):
+
+        # Check development
+        if not self.development:
+            return True
+
+        # Check the development
+        if not self.development:
+            alert = '''----------------------------------------------------------\n'''
+            alert += '''INFO!\n'''
+            alert += '''This method is only available in development!\n'''
+            alert += '''----------------------------------------------------------'''
+
+            # Alert the user
+            print(alert)
+
+            # Exit the program
+            exit()
+
+        # Check the required params
+        if not database:
+            # Developer mode
+            if self.debug:
+                # Raise error
+                raise Exception("You must provide the required parameters: ['database']")
+
+            # Production mode
+            else:
+                print("You must provide the required parameters: ['database']")
+                return False
+
+        # Database already exists
+        if self._exist_database(database=database):
+            # Developer mode
+            if self.debug:
+                # Raise error
+                raise Exception(f'Database "{database}" already exists!')
+
+            # Production mode
+            else:
+                print(f'Database "{database}" already exists!')
+                return False
+
+        # Database not exists
+        else:
+            # SQLite
+            if self.db_system == 'SQLite':
+            
+                # Check database file name and extension
+                if not check_file(database, '.db') and not check_file(database, '.sqlite') and not check_file(database, '.sqlite3'):
+
+                    # Prepare error message
+                    err = '''Database file name and/or extension is invalid!\n'''
+                    err += '''Valid Names: A-Z, a-z, _\n'''
+                    err += '''Valid Extensions: .sqlite3, .sqlite, .db'''
+
+                    # Check debug mode
+                    if self.debug:
+                        # Raise error
+                        raise Exception(err)
+
+                    # Return the result
+                    else:
+                        return False
+                
+                # Everything is fine
+                else:
+                    # Attempt the process
+                    try:
+                        # Create the database
+                        self.conn = DatabaseAPI.connect(database)
+
+                        # Return the result
+                        return True
+
+                    # Handle the errors
+                    except NameError:
+                        # Developer mode
+                        if self.debug:
+                            # Raise error
+                            raise Exception('Cannot create the database!')
+
+                        # Production mode
+                        else:
+                            print('Cannot create the database!')
+                            return False
+
+            # MySQL
+            elif self.db_system == 'MySQL':
+                # Create a database connection
+                conn = DatabaseAPI.connect(
+                    host=self.host,
+                    user=self.user,
+                    password=self.password,
+                )
+
+                # Attempt the process
+                try:
+                    # Prepare sql
+                    sql = f'''CREATE DATABASE `{database}`;'''
+                    
+                    # Create the connection cursor
+                    cur = conn.cursor()
+
+                    # Excecute the sql
+                    cur.execute(sql)
+
+                    # Close the current connection
+                    conn.close()
+
+                    # Return the result
+                    return True
+
+                # Handle the errors
+                except NameError as err:
+                    # Developer mode
+                    if self.debug:
+                        # Raise error
+                        raise Exception(err)
+
+                    # Production mode
+                    else:
+                        print(err)
+                        return False
+
+            # Postgres
+            elif self.db_system == 'Postgres':
+                # Close the global connection
+                if self.conn:
+                    self.conn.close()
+
+                # Create a database connection
+                conn = DatabaseAPI.connect(
+                    host=self.host,
+                    port=self.port,
+                    user=self.user,
+                    password=self.password,
+                )
+
+                # Attempt the process
+                try:
+                    # Prepare sql
+                    sql = f'''CREATE DATABASE "{database}";'''
+
+                    # Set the transaction to autocommit
+                    conn.autocommit = True
+                    
+                    # Create the connection cursor
+                    cur = conn.cursor()
+
+                    # Excecute the sql
+                    cur.execute(sql)
+
+                    # Close the current connection
+                    conn.close()
+
+                    # Return the result
+                    return True
+
+                # Handle the errors
+                except NameError as err:
+                    # Developer mode
+                    if self.debug:
+                        # Raise error
+                        raise Exception(err)
+
+                    # Production mode
+                    else:
+                        print(err)
+                        return False
+
+
+    ##################
+    # Clause Methods #
+    ##################
+    ##
+    # @desc Quotes an identifier for the database system
+    #
+    # @param {str}  name   -- Required identifier (table or column)
+    # @param {bool} dotted -- Optional leave the dotted identifiers (ex. "users.id") as they are
+    #
+    # @return {str}
+    ##
+    def _quote(self, name:str, dotted:bool=False):
+        # Dotted identifier
+        if dotted and '.' in name:
+            return name
+
+        # MySQL
+        if self.db_system == 'MySQL':
+            return f'`{name}`'
+
+        # SQLite and Postgres
+        else:
+            return f'"{name}"'
+
+
+    ##
+    # @desc Parses a WHERE clause key (ex. "or--age--greater-than#2")
+    #
+    # @param {str} key -- Required WHERE clause key
+    #
+    # @return {tuple} -- (prefix, column, operator)
+    ##
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _parse_key(key:str):
+        prefix = None
+        operator = 'equal'
+
+        # Remove the ineffective characters (#)
+        key = delete_chars(key, '#')
+
+        # Check the operator suffix
+        if '--' in key and key.rsplit('--', 1)[1] in where_operators:
+            key, operator = key.rsplit('--', 1)
+
+        # Check the column prefixes (and/or)
+        for x, name in (('or--', 'OR'), ('o--', 'OR'), ('and--', 'AND'), ('a--', 'AND')):
+            if key.startswith(x):
+                key = key[len(x):]
+                prefix = name
+                break
+
+        # Return the result
+        return (prefix, key, operator)
+
+
+    ##
+    # @desc Produces the shape of a WHERE clause (its keys and the number of the IN values)
+    #
+    # @param {dict} where -- Required WHERE statement
+    #
+    # @return {tuple}
+    ##
+    def _shape(self, where:dict):
+        shape = []
+
+        for key, value in where.items():
+            # The bind type of the key
+            kind = where_operators[Database._parse_key(key)[2]][1]
+
+            # The number of the IN values changes the sql statement
+            shape.append((key, len(value) if kind == 'list' else None))
+
+        # Return the result
+        return tuple(shape)
+
+
+    ##
+    # @desc Prepares the columns of a SELECT statement
+    #
+    # @param {list} cols   -- Required columns
+    # @param {bool} dotted -- Optional leave the dotted columns as they are
+    #
+    # @return {str}
+    ##
+    def _cols(self, cols:list, dotted:bool=False):
+        # All columns
+        if not cols or cols == ['*']:
+            return '*'
+
+        # Return the result
+        return ', '.join([Database._quote(self, col, dotted) for col in cols])
+
+
+    ##
+    # @desc Prepares the WHERE clause
+    #
+    # @param {dict} where  -- Required WHERE statement (ex. {"id": "2", "or--username--like": "%admin%"})
+    # @param {bool} dotted -- Optional leave the dotted keys as they are
+    #
+    # @var {list} where_sql -- A placeholder for the WHERE clause
+    # @var {list} kinds     -- The bind types of the values (value, pair, list)
+    #
+    # @return {tuple} -- (sql, kinds)
+    ##
+    def _where(self, where:dict, dotted:bool=False):
+        # Check where
+        if not where:
+            return ('', [])
+
+        where_sql = []
+        kinds = []
+
+        for key, value in where.items():
+            # Parse the key
+            prefix, column, operator = Database._parse_key(key)
+            sign, kind = where_operators[operator]
+            column = Database._quote(self, column, dotted)
+
+            # BETWEEN, NOT BETWEEN
+            if kind == 'pair':
+                sql = f'{column}{sign}{self.sp_char} AND {self.sp_char}'
+
+            # IN, NOT IN
+            elif kind == 'list':
+                sql = f"{column}{sign}({','.join([self.sp_char] * len(value))})"
+
+            # Other operators
+            else:
+                sql = f'{column}{sign}{self.sp_char}'
+
+            # Check column prefixes (and/or)
+            if where_sql:
+                sql = f"{prefix if prefix else 'AND'} {sql}"
+
+            where_sql.append(sql)
+            kinds.append(kind)
+
+        # Return the result
+        return (' WHERE ' + ' '.join(where_sql), kinds)
+
+
+    ##
+    # @desc Binds the WHERE clause values (and the LIMIT and OFFSET values)
+    #
+    # @param {dict} where  -- Required WHERE statement
+    # @param {list} kinds  -- Required bind types of the values
+    # @param {int}  limit  -- Optional LIMIT value
+    # @param {int}  offset -- Optional OFFSET value
+    # @param {list} seek   -- Optional keyset pagination values (ex. Database._seek_bind())
+    #
+    # @return {list}
+    ##
+    def _bind(self, where:dict, kinds:list, limit:int=None, offset:int=None, seek:list=None):
+        data_bind = []
+
+        for value, kind in zip(where.values(), kinds):
+            # BETWEEN, NOT BETWEEN
+            if kind == 'pair':
+                data_bind.append(value[0])
+                data_bind.append(value[1])
+
+            # IN, NOT IN
+            elif kind == 'list':
+                data_bind.extend(value)
+
+            # Other operators
+            else:
+                data_bind.append(value)
+
+        # Keyset pagination
+        if seek:
+            data_bind.extend(seek)
+
+        # LIMIT and OFFSET
+        if limit:
+            data_bind.append(int(limit))
+
+        if offset:
+            data_bind.append(int(offset))
+
+        # Return the result
+        return data_bind
+
+
+    ##
+    # @desc Prepares the ORDER BY clause
+    #
+    # @param {dict} order_by -- Required ORDER BY statement (ex. {"id": "ASC", "date": "DESC"})
+    # @param {bool} dotted   -- Optional leave the dotted keys as they are
+    # @param {bool} reverse  -- Optional reverse the directions (ASC <-> DESC)
+    #
+    # @return {str}
+    ##
+    def _order_by(self, order_by:dict, dotted:bool=False, reverse:bool=False):
+        # Check order_by
+        if not order_by:
+            return ''
+
+        order_by_sql = []
+
+        for key, value in order_by.items():
+            value = value.upper()
+
+            # Reverse the direction
+            if reverse:
+                value = 'ASC' if value == 'DESC' else 'DESC'
+
+            order_by_sql.append(f'{Database._quote(self, key, dotted)} {value}')
+
+        # Return the result
+        return ' ORDER BY ' + ', '.join(order_by_sql)
+
+
+    ##
+    # @desc Finds the primary key of the model table (the Model instances only)
+    #
+    # @param {str} table -- Required table name
+    #
+    # @return {str|None}
+    ##
+    def _primary_key(self, table:str):
+        # Not a model or another table
+        if not hasattr(self, 'primary_key') or getattr(self, 'table', None) != table:
+            return None
+
+        # Return the result (id by default)
+        return self.primary_key if self.primary_key else 'id'
+
+
+    ##
+    # @desc Prepares the reversed ORDER BY clause (for fetching the last row)
+    #
+    # @param {dict} order_by    -- Required ORDER BY statement
+    # @param {str}  group_by    -- Required GROUP BY statement
+    # @param {str}  primary_key -- Required primary key (or None)
+    # @param {bool} dotted      -- Optional leave the dotted keys as they are
+    #
+    # @return {str} -- Empty if the order cannot be reversed
+    ##
+    def _reverse(self, order_by:dict, group_by:str, primary_key:str, dotted:bool=False):
+        # Reverse the ORDER BY statement
+        if order_by:
+            return Database._order_by(self, order_by, dotted, reverse=True)
+
+        # Reverse the primary key order (the natural order)
+        elif primary_key and not group_by:
+            return Database._order_by(self, {primary_key: 'ASC'}, dotted, reverse=True)
+
+        # Cannot be reversed
+        else:
+            return ''
+
+
+    ##
+    # @desc Prepares the keyset pagination order (order_by + the primary key as the tie-breaker)
+    #
+    # @param {dict} order_by    -- Required ORDER BY statement
+    # @param {str}  primary_key -- Required primary key (or None)
+    #
+    # @return {dict} -- Empty if there is no order
+    ##
+    def _keyset(self, order_by:dict, primary_key:str):
+        keyset = {key: value.upper() for key, value in order_by.items()}
+
+        # Add the primary key (unique rows order)
+        if primary_key and not primary_key in keyset:
+            keyset[primary_key] = 'ASC'
+
+        # Return the result
+        return keyset
+
+
+    ##
+    # @desc Checks if NULL comes first in a keyset pagination order
+    #       SQLite and MySQL sort NULL as the smallest value, Postgres as the largest value
+    #
+    # @param {str}  direction -- Required order direction (ASC, DESC)
+    # @param {bool} reverse   -- Optional the rows before the token (the reversed order)
+    #
+    # @return {bool}
+    ##
+    def _nulls_first(self, direction:str, reverse:bool=False):
+        return ((direction == 'ASC') != reverse) != (self.db_system == 'Postgres')
+
+
+    ##
+    # @desc Prepares the keyset pagination condition
+    #       ex. ("a" > ?) OR ("a" = ? AND "b" < ?) for {"a": "ASC", "b": "DESC"}
+    #       A NULL token value is compared with IS NULL / IS NOT NULL, in the NULL order of the database system
+    #
+    # @param {dict}  keyset  -- Required keyset pagination order
+    # @param {tuple} nulls   -- Required the NULL token values -- (bool, ...)
+    # @param {bool}  reverse -- Optional the rows before the token
+    #
+    # @return {str}
+    ##
+    def _seek(self, keyset:dict, nulls:tuple, reverse:bool=False):
+        keys = list(keyset)
+        seek_sql = []
+
+        for i in range(len(keys)):
+            nulls_first = Database._nulls_first(self, keyset[keys[i]], reverse)
+
+            # Nothing is after a NULL that comes last
+            if nulls[i] and not nulls_first:
+                continue
+
+            # The previous keys are equal
+            terms = [f'{Database._quote(self, key)} IS NULL' if nulls[j] else f'{Database._quote(self, key)}={self.sp_char}' for j, key in enumerate(keys[:i])]
+
+            col = Database._quote(self, keys[i])
+
+            # Every value is after a NULL that comes first
+            if nulls[i]:
+                terms.append(f'{col} IS NOT NULL')
+
+            # The current key is after (or before) the token (and NULL when it comes last)
+            else:
+                sign = '>' if (keyset[keys[i]] == 'DESC') == reverse else '<'
+                terms.append(f'{col}{sign}{self.sp_char}' if nulls_first else f'({col}{sign}{self.sp_char} OR {col} IS NULL)')
+
+            seek_sql.append('(' + ' AND '.join(terms) + ')')
+
+        # No rows after the token
+        if not seek_sql:
+            return '(1=0)'
+
+        # Return the result
+        return '(' + ' OR '.join(seek_sql) + ')'
+
+
+    ##
+    # @desc Binds the keyset pagination values (in the order of the keyset pagination condition)
+    #
+    # @param {dict} keyset  -- Required keyset pagination order
+    # @param {list} values  -- Required token values
+    # @param {bool} reverse -- Optional the rows before the token
+    #
+    # @return {list}
+    ##
+    def _seek_bind(self, keyset:dict, values:list, reverse:bool=False):
+        keys = list(keyset)
+        data_bind = []
+
+        for i in range(len(values)):
+            # The skipped condition (a NULL that comes last)
+            if values[i] == None and not Database._nulls_first(self, keyset[keys[i]], reverse):
+                continue
+
+            data_bind.extend([x for x in values[:i + 1] if x != None])
+
+        # Return the result
+        return data_bind
+
+
+    ##
+    # @desc Prepares the GROUP BY clause
+    #
+    # @param {str}  group_by -- Required GROUP BY column
+    # @param {bool} dotted   -- Optional leave the dotted column as it is
+    #
+    # @return {str}
+    ##
+    def _group_by(self, group_by:str, dotted:bool=False):
+        # Check group_by
+        if not group_by:
+            return ''
+
+        # Return the result
+        return f' GROUP BY {Database._quote(self, group_by, dotted)}'
+
+
+    ################
+    # Read Methods #
+    ################
+    ##
+    # @desc Selects rows
+    #
+    # @param {str}  table    -- Required Table name (ex. "users")
+    # @param {list} cols     -- Optional Columns (ex. ["id", "first_name", "last_name"])
+    # @param {dict} where    -- Optional WHERE statement (ex. {"id": "2", "username": "admin"})
+    # @param {dict} order_by -- Optional ORDER BY statement (ex. {"id": "ASC", "date": "DESC"})
+    # @param {str}  group_by -- Optional GROUP BY statement (ex. 'country')
+    # @param {int}  limit    -- Optional LIMIT statement (ex. "10")
+    # @param {int}  offset   -- Optional OFFSET statement (ex. "10")
+    # @param {str}  after    -- Optional keyset pagination token -- the rows after it (ex. Read.token(), "" for the first page)
+    # @param {str}  before   -- Optional keyset pagination token -- the rows before it (ex. Read.token(before=True))
+    # @param {int}  cache    -- Optional result cache time to live (seconds)
+    # @param {str}  key      -- Optional unique key of the keyset pagination (default: the model primary key)
+    #
+    # @var {tuple} shape     -- The statement shape (the compiled statements cache key)
+    # @var {dict}  keyset    -- The keyset pagination order (order_by + the unique key)
+    # @var {str}   seek      -- The keyset pagination direction (after, before)
+    # @var {bool}  paginate  -- The keyset pagination is requested (after or before, "" for the first page)
+    # @var {str}   sql       -- The sql statement
+    # @var {list}  kinds     -- The bind types of the WHERE clause values
+    # @var {list}  data_bind -- Data binding against SQL Injection
+    #
+    # @return {class}
+    ##
+    def read(self, table:str, cols:list=[], where:dict={}, order_by:dict={}, group_by:str=None, limit:int=None, offset:int=None, 
+             after:str=None, before:str=None, cache:int=None, key:str=None):
+
+        # Check required params
+        if not table:
+            # Developer mode
+            if self.debug:
+                # Raise error
+                raise Exception("You must provide the required parameters: ['table']")
+
+            # Production mode
+            else:
+                print("You must provide the required parameters: ['table']")
+                return False
+
+        # The primary key (for reversing the order)
+        primary_key = Database._primary_key(self, table)
+
+        # The unique key of the keyset pagination
+        key = key if key else primary_key
+
+        # The keyset pagination order
+        keyset = Database._keyset(self, order_by, key)
+        seek = 'after' if after else 'before' if before else None
+        paginate = after != None or before != None
+
+        # Check the keyset pagination
+        if paginate:
+            values = Read.decode(after if after else before) if seek else []
+
+            if not key or group_by or (seek and (not values or len(values) != len(keyset))):
+                err = 'Keyset pagination needs a valid token and a unique key (key or a model primary key) without group_by!'
+
+                # Developer mode
+                if self.debug:
+                    # Raise error
+                    raise Exception(err)
+
+                # Production mode
+                else:
+                    print(err)
+                    return False
+
+            # Paginate by the keyset order (unique rows order)
+            order_by = keyset
+
+        # The order is already unique (order_by has the unique key)
+        elif key and order_by and not group_by and len(keyset) == len(order_by):
+            paginate = True
+
+        # The statement shape
+        shape = ('read', self.db_system, table, tuple(cols), Database._shape(self, where), tuple(order_by.items()), group_by, bool(limit), bool(offset), primary_key, seek, 
+                 tuple([x == None for x in values]) if seek else None)
+
+        # Find the compiled statement
+        statement = Statements.get(shape)
+
+        # Compile the statement
+        if not statement:
+            # Prepare the clauses
+            cols_sql = Database._cols(self, cols)
+            where_sql, kinds = Database._where(self, where)
+            group_by_sql = Database._group_by(self, group_by)
+            order_by_sql = Database._order_by(self, order_by, reverse=(seek == 'before'))
+            limit_sql = f' LIMIT {self.sp_char}' if limit else ''
+            offset_sql = f' OFFSET {self.sp_char}' if offset else ''
+
+            # Keyset pagination
+            if seek:
+                seek_sql = Database._seek(self, order_by, tuple([x == None for x in values]), reverse=(seek == 'before'))
+                where_sql = f' WHERE ({where_sql[7:]}) AND {seek_sql}' if where_sql else f' WHERE {seek_sql}'
+
+            # The sql statement parts (for the pushed down count, first and last)
+            parts = {
+                'select': f'SELECT {cols_sql}',
+                'from': f' FROM {Database._quote(self, table)}{where_sql + group_by_sql}',
+                'order_by': order_by_sql,
+                'reverse': Database._reverse(self, order_by, group_by, primary_key),
+                'group_by': bool(group_by),
+            }
+
+            # Prepare the sql statement
+            sql = f'''{parts['select'] + parts['from'] + order_by_sql + limit_sql + offset_sql};'''
+
+            # Cache the compiled statement
+            statement = Statements.set(shape, (sql, kinds, parts))
+
+        # Bind the data
+        sql, kinds, parts = statement
+        data_bind = Database._bind(self, where, kinds, limit, offset, Database._seek_bind(self, order_by, values, reverse=(seek == 'before')) if seek else None)
+
+        # The rows before the token are fetched in the reversed order (no pushed down count, first and last)
+        if seek == 'before':
+            parts = None
+        else:
+            parts = dict(parts, limit=limit, offset=offset)
+
+        # Return result
+        return Read(self, sql, data_bind, parts, {'keys': list(keyset), 'limit': limit, 'before': seek == 'before'} if paginate else None, 
+                    {'ttl': cache, 'tables': [table]} if cache else None)
+
+
+    ##
+    # @desc Joins related tables
+    #
+    # @param {str}  table     -- Required main Table (ex. "table_1")
+    # @param {list} f_keys    -- Required foreign keys (ex. ["user_id", "flight_id"])
+    # @param {list} f_tables  -- Required foreign tables (ex. ["table_2", "table_3"])
+    # @param {list} p_keys    -- Required primary keys (ex. ["pk_2", "pk_3"])
+    # @param {list} cols      -- Optional Columns (ex. ["table.id", "table_2.name", "table_3.address"])
+    #
+    # @param {str}  join_stmt -- The join statement:
+    #        SQLite: INNER JOIN, LEFT JOIN, CROSS JOIN (Learn More: https://www.sqlitetutorial.net/sqlite-join/)
+    #        MySQL: INNER JOIN, LEFT JOIN, RIGHT JOIN, CROSS JOIN (Learn More: https://www.w3schools.com/mysql/mysql_join.asp)
+    #        Postgres: INNER JOIN, LEFT JOIN, RIGHT JOIN, FULL JOIN (Learn More: https://www.postgresqltutorial.com/postgresql-tutorial/postgresql-joins/)
+    #        JOIN vs INNER JOIN: https://stackoverflow.com/questions/565620/difference-between-join-and-inner-join
+    #
+    # @param {dict} where    -- Optional WHERE statement (ex. {"table.id": "2", "table_2.name": "John"})
+    # @param {dict} order_by -- Optional ORDER BY statement (ex. {"table.id": "ASC", "table.date": "DESC"})
+    # @param {str}  group_by -- Optional GROUP BY statement (ex. 'table.country')
+    # @param {int}  limit    -- Optional LIMIT statement (ex. "10")
+    # @param {int}  offset   -- Optional OFFSET statement (ex. "10")
+    # @param {int}  cache    -- Optional result cache time to live (seconds)
+    #
+    # @var {tuple} shape     -- The statement shape (the compiled statements cache key)
+    # @var {str}   sql       -- The sql statement
+    # @var {list}  kinds     -- The bind types of the WHERE clause values
+    # @var {list}  data_bind -- Data binding against SQL Injection
+    #
+    # @return {class}
+    ##
+    def join(self, table:str, f_keys:list, f_tables:list, p_keys:list, cols:list=[], join_stmt:str='INNER JOIN', where:dict={}, order_by:dict={}, group_by:str=None, limit:int=None, offset:int=None, 
+             cache:int=None):
+
+        # Check required params
+        if not table and not f_keys and not f_tables and not p_keys:
+            # Developer mode
+            if self.debug:
+                # Raise error
+                raise Exception("You must provide the required parameters: 'main_table', 'join_tables'")
+
+            # Production mode
+            else:
+                print("You must provide the required parameters: 'main_table', 'join_tables'")
+                return False
+
+        # The primary key (for reversing the order)
+        primary_key = Database._primary_key(self, table)
+
+        # The statement shape
+        shape = ('join', self.db_system, table, tuple(f_keys), tuple(f_tables), tuple(p_keys), tuple(cols), join_stmt, Database._shape(self, where), 
+                 tuple(order_by.items()), group_by, bool(limit), bool(offset), primary_key)
+
+        # Find the compiled statement
+        statement = Statements.get(shape)
+
+        # Compile the statement
+        if not statement:
+            # Prepare Join statement
+            join_sql = ''
+            for i in range(len(f_tables)):
+                fk = Database._quote(self, f_keys[i])
+                f_table = Database._quote(self, f_tables[i])
+                f_pk = Database._quote(self, p_keys[i])
+
+                join_sql += f' {join_stmt.upper()} {f_table} ON {Database._quote(self, table)}.{fk} = {f_table}.{f_pk} '
+
+            # Prepare the clauses (dotted keys are used as they are)
+            cols_sql = Database._cols(self, cols, dotted=True)
+            where_sql, kinds = Database._where(self, where, dotted=True)
+            group_by_sql = Database._group_by(self, group_by, dotted=True)
+            order_by_sql = Database._order_by(self, order_by, dotted=True)
+            limit_sql = f' LIMIT {self.sp_char}' if limit else ''
+            offset_sql = f' OFFSET {self.sp_char}' if offset else ''
+
+            # The sql statement parts (for the pushed down count, first and last)
+            parts = {
+                'select': f'SELECT {cols_sql}',
+                'from': f' FROM {Database._quote(self, table)}{join_sql + where_sql + group_by_sql}',
+                'order_by': order_by_sql,
+                'reverse': Database._reverse(self, order_by, group_by, primary_key and f'{table}.{primary_key}', dotted=True),
+                'group_by': bool(group_by),
+            }
+
+            # Prepare the sql statement
+            sql = f'''{parts['select'] + parts['from'] + order_by_sql + limit_sql + offset_sql};'''
+
+            # Cache the compiled statement
+            statement = Statements.set(shape, (sql, kinds, parts))
+
+        # Bind the data
+        sql, kinds, parts = statement
+        data_bind = Database._bind(self, where, kinds, limit, offset)
+
+        # Return result
+        return Join(self, sql, data_bind, dict(parts, limit=limit, offset=offset), cache={'ttl': cache, 'tables': [table] + list(f_tables)} if cache else None)
+
+
+    ##################
+    # Update Methods #
+    ##################
+    ##
+    # *CAUTION! If you ignore the 'where' parameter, it may updates the columns for all records! (must confirm)
+    #
+    # @desc Updates row(s)
+    #
+    # @param {str}  table   -- Required Table name (ex. "users")
+    # @param {dict} data    -- Required data (ex. {"first_name": "John", "last_name": "Doe"})
+    # @param {dict} where   -- Optional (*CAUTION!) WHERE statement (ex. {"id": "2", "username": "admin"})
+    # @param {bool} confirm -- Optional|Required confirm (if not where it will be Required)
+    #
+    # @var {tuple} shape     -- The statement shape (the compiled statements cache key)
+    # @var {str}   sql       -- The sql statement
+    # @var {list}  kinds     -- The bind types of the WHERE clause values
+    # @var {list}  data_bind -- Data binding against SQL Injection
+    #
+    # @return {bool}
+    ##
+    @writes
+    def update(self, table:str, data:dict={}, where:dict={}, confirm:bool=False):
+
+        # Check the confirm if the where clase not set
+        if not where and not confirm:
+            # Developer mode
+            if self.debug:
+                # Raise error
+                raise Exception('For update without the where clause you must confirm the command.')
+
+            # Production mode
+            else:
+                print('For update without the where clause you must confirm the command.')
+                return False
+
+        # Check required params
+        if not table or not data:
+            # Developer mode
+            if self.debug:
+                # Raise error
+                raise Exception("You must provide the required parameters: ['']")
+
+            # Production mode
+            else:
+                print("You must provide the required parameters: ['']")
+                return False
+
+        # The statement shape
+        shape = ('update', self.db_system, table, tuple(data), Database._shape(self, where))
+
+        # Find the compiled statement
+        statement = Statements.get(shape)
+
+        # Compile the statement
+        if not statement:
+            # Prepare the clauses
+            data_sql = ', '.join([f'{Database._quote(self, key)}={self.sp_char}' for key in data])
+            where_sql, kinds = Database._where(self, where)
+
+            # Prepare the sql statement
+            sql = f'''UPDATE {Database._quote(self, table)} SET {data_sql + where_sql};'''
+
+            # Cache the compiled statement
+            statement = Statements.set(shape, (sql, kinds))
+
+        # Bind the data
+        sql, kinds = statement
+        data_bind = list(data.values()) + Database._bind(self, where, kinds)
+
+        # Update was successfull
+        if self.query(sql, data_bind):
+            # Return result
+            return True
+
+        # Update failed
+        else:
+            # Return result
+            return False
+
+
+    ##
+    # @desc Updates multi rows with per-row values (bulk update)
+    #       SQLite: executemany, MySQL: CASE batches, Postgres: UPDATE ... FROM (VALUES ...) batches
+    #
+    # @param {str}  table -- Required Table name (ex. "users")
+    # @param {list} rows  -- Required rows including the key (ex. [{"id": 1, "name": "John"}, {"id": 2, "name": "Jane"}])
+    # @param {str}  key   -- Optional key column to match the rows (ex. "id")
+    #
+    # @var {list} groups -- The consecutive rows with the same columns
+    #
+    # @return {bool}
+    ##
+    @writes
+    def update_multi(self, table:str, rows:list, key:str='id'):
+        # Check required params
+        if not table or not rows or not all([key in row and len(row) > 1 for row in rows]):
+            err = f"You must provide the required parameters: ['table', 'rows'] (each row with the '{key}' key and data)"
+
+            # Developer mode
+            if self.debug:
+                # Raise error
+                raise Exception(err)
+
+            # Production mode
+            else:
+                print(err)
+                return False
+
+        # Group the consecutive rows with the same columns
+        groups = []
+        for row in rows:
+            cols = tuple([col for col in row if col != key])
+
+            if groups and cols == groups[-1][0]:
+                groups[-1][1].append(row)
+            else:
+                groups.append((cols, [row]))
+
+        for cols, group in groups:
+            # SQLite
+            if self.db_system == 'SQLite':
+                data_sql = ', '.join([f'{Database._quote(self, col)}={self.sp_char}' for col in cols])
+                sql = f'''UPDATE {Database._quote(self, table)} SET {data_sql} WHERE {Database._quote(self, key)}={self.sp_char};'''
+
+                result = Database._query_many(self, sql, [[row[col] for col in cols] + [row[key]] for row in group])
+
+            # MySQL
+            elif self.db_system == 'MySQL':
+                result = Database._multi_case(self, table, key, cols, group)
+
+            # Postgres
+            elif self.db_system == 'Postgres':
+                result = Database._multi_values(self, table, key, cols, group)
+
+            # Update failed
+            if not result:
+                return False
+
+        # Return result
+        return True
+
+
+    ##
+    # @desc Updates the rows with CASE batches (MySQL)
+    #       ex. UPDATE `t` SET `a`=CASE `id` WHEN %s THEN %s ... ELSE `a` END WHERE `id` IN (...)
+    #
+    # @param {str}   table -- Required Table name
+    # @param {str}   key   -- Required key column
+    # @param {tuple} cols  -- Required columns to update
+    # @param {list}  rows  -- Required rows
+    #
+    # @return {bool}
+    ##
+    def _multi_case(self, table:str, key:str, cols:tuple, rows:list):
+        # The maximum number of rows per statement (driver parameter limit)
+        size = max(1, min(1000, 65535 // (2 * len(cols) + 1)))
+
+        for i in range(0, len(rows), size):
+            batch = rows[i:i + size]
+            data_sql = []
+            data_bind = []
+
+            # Prepare the CASE clauses
+            for col in cols:
+                when_sql = ' '.join([f'WHEN {self.sp_char} THEN {self.sp_char}'] * len(batch))
+                data_sql.append(f'{Database._quote(self, col)}=CASE {Database._quote(self, key)} {when_sql} ELSE {Database._quote(self, col)} END')
+
+                for row in batch:
+                    data_bind.append(row[key])
+                    data_bind.append(row[col])
+
+            # Prepare the sql statement
+            in_sql = ','.join([self.sp_char] * len(batch))
+            sql = f'''UPDATE {Database._quote(self, table)} SET {', '.join(data_sql)} WHERE {Database._quote(self, key)} IN ({in_sql});'''
+            data_bind.extend([row[key] for row in batch])
+
+            # Update failed
+            if not self.query(sql, data_bind):
+                return False
+
+        # Return result
+        return True
+
+
+    ##
+    # @desc Updates the rows with UPDATE ... FROM (VALUES ...) batches (Postgres)
+    #       The values are cast to the column types (untyped values would be resolved as text)
+    #
+    # @param {str}   table -- Required Table name
+    # @param {str}   key   -- Required key column
+    # @param {tuple} cols  -- Required columns to update
+    # @param {list}  rows  -- Required rows
+    #
+    # @var {dict} types -- The column types
+    #
+    # @return {bool}
+    ##
+    def _multi_values(self, table:str, key:str, cols:tuple, rows:list):
+        # Find the column types
+        types = Database._column_types(self, table)
+
+        if types == False:
+            return False
+
+        # Prepare the sql statement parts
+        all_cols = (key,) + cols
+        values_sql = '(' + ', '.join([f'{self.sp_char}::{types[col]}' for col in all_cols]) + ')'
+        alias_sql = ', '.join([Database._quote(self, col) for col in all_cols])
+        data_sql = ', '.join([f'{Database._quote(self, col)}=v.{Database._quote(self, col)}' for col in cols])
+
+        for i in range(0, len(rows), 1000):
+            batch = rows[i:i + 1000]
+
+            # Prepare the sql statement
+            sql = f'''UPDATE {Database._quote(self, table)} AS t SET {data_sql} FROM (VALUES {', '.join([values_sql] * len(batch))}) AS v({alias_sql}) WHERE t.{Database._quote(self, key)}=v.{Database._quote(self, key)};'''
+            data_bind = [row[col] for row in batch for col in all_cols]
+
+            # Update failed
+            if not self.query(sql, data_bind):
+                return False
+
+        # Return result
+        return True
+
+
+    ##
+    # @desc Finds the column types of a table (Postgres)
+    #
+    # @param {str} table -- Required Table name
+    #
+    # @return {dict|bool} -- {column: type}
+    ##
+    def _column_types(self, table:str):
+        # The cached column types
+        if self.pool and table in self.pool.catalog.types:
+            return self.pool.catalog.types[table]
+
+        sql = f'''SELECT attname, format_type(atttypid, atttypmod) AS type FROM pg_attribute WHERE attrelid = {self.sp_char}::regclass AND attnum > 0 AND NOT attisdropped;'''
+
+        cur = self.query(sql, [Database._quote(self, table)])
+
+        # Query failed
+        if not cur:
+            return False
+
+        types = {row['attname']: row['type'] for row in cur.fetchall()}
+
+        # Cache the column types
+        if self.pool:
+            self.pool.catalog.types[table] = types
+
+        # Return result
+        return types
+
+
+    ##
+    # CAUTION! Use this methods only in development.
+    #
+    # @desc Updates a column
+    #
+    # @param {str} table       -- Required table name
+    # @param {str} old_col     -- Required old column name
+    # @param {str} new_col     -- Required new column name
+    # @param {str} datatype    -- Required new column data
+    # @param {str} constraints -- Optional new column constraints
+    # 
+    # @var {str}  sql             -- The sql statement
+    # @var {str}  table_existance -- SQL statement for sqlite_master
+    # @var {bool} recursion       -- For recursion the method
+    #
+    # @return {bool}
+    ##
+    @ddl
+    def _update_column(self, table:str, old_col:str, new_col:str, datatype:str, constraints:str=None):
+
+        # Check development
+        if not self.development:
+            return True
+
+        # Check the development
+        if not self.development:
+            alert = '''----------------------------------------------------------\n'''
+            alert += '''INFO!\n'''
+            alert += '''This method is only available in development!\n'''
+            alert += '''----------------------------------------------------------'''
+
+            # Alert the user
+            print(alert)
+
+            # Exit the program
+            exit()
+
+        # Check required params
+        if not table  or not old_col or not new_col or not datatype:
+            # Developer mode
+            if self.debug:
+                # Raise error
+                raise Exception("You must provide the required parameters: ['table', 'old_col', 'new_col', 'datatype']")
+
+            # Production mode
+            else:
+                print("You must provide the required parameters: ['table', 'old_col', 'new_col', 'datatype']")
+                return False
+
+        # Check the FOREIGN KEY
+        if self._exist_fk(table=table, column=old_col):
+            # Developer mode
+            if self.debug:
+                # Raise error
+                raise Exception('You cannot change a foreign key with "_update_column" method!')
+
+            # Production mode
+            else:
+                print('You cannot change a foreign key with "_update_column" method!')
+                return False
+
+        # Check the column names
+        if old_col == new_col:
+            recursion = True
+            new_col += '__temp'
+        else:
+            recursion = False
+
+        # Fetch the old column data
+        old_data = self.read(table=table, cols=[old_col]).all()
+
+        # Table exists
+        if self._exist_table(table):
+            # Add the new column
+            self._create_column(table=table, column=new_col, datatype=datatype, constraints=constraints)
+
+            # Update new column data
+            for x in old_data:
+                self.update(table=table, data={new_col:x[old_col]}, where={old_col:x[old_col]})
+
+            # Commit the changes so far
+            self.conn.commit()
+
+            # Drop the old column
+            self._delete_column(table=table, column=old_col, confirm=True)
+
+            # Check the column names
+            if recursion:
+                # Recursion
+                return self._update_column(table, old_col=new_col, new_col=old_col, datatype=datatype, constraints=constraints)
+
+            # Return the result
+            return True
+
+        # Table not exists
+        else:
+            # Developer mode
+            if self.debug:
+                # Raise error
+                raise Exception(f'Table "{table}" doesn\'t exist')
+
+            # Production mode
+            else:
+                print(f'Table "{table}" doesn\'t exist')
+                return False
+
+
+    ##
+    # CAUTION! Use this methods only in development.
+    #
+    # @desc Renames a table if exists
+    #
+    # @param {str} old_table -- Required table old name
+    # @param {str} new_table -- Required table new name
+    #
+    # @var {str} sql             -- The sql statement
+    # @var {str} table_existance -- SQL statement for sqlite_master
+    #
+    # @return {bool}
+    ##
+    @ddl
+    def _update_table(self, old_table:str, new_table:str):
+
+        # Check development
+        if not self.development:
+            return True
+
+        # Check the development
+        if not self.development:
+            alert = '''----------------------------------------------------------\n'''
+            alert += '''INFO!\n'''
+            alert += '''This method is only available in development!\n'''
+            alert += '''----------------------------------------------------------'''
+
+            # Alert the user
+            print(alert)
+
+            # Exit the program
+            exit()
+
+        # Check required params
+        if not old_table or not new_table:
+            # Developer mode
+            if self.debug:
+                # Raise error
+                raise Exception("You must provide the required parameters: ['old_table', 'new_table']")
+
+            # Production mode
+            else:
+                print("You must provide the required parameters: ['old_table', 'new_table']")
+                return False
+
+        # Table exists
+        if self._exist_table(old_table):
+            # Prepare sql statements
+            # SQLite
+            if self.db_system == 'SQLite':
+                sql = f'''
+                    ALTER TABLE '{old_table}'
+                    RENAME TO '{new_table}';
+                '''
+
+            # MySQL
+            elif self.db_system == 'MySQL':
+                sql = f'''
+                    ALTER TABLE `{old_table}`
+                    RENAME TO `{new_table}`;
+                '''
+                
+            # Postgres
+            elif self.db_system == 'Postgres':
+                sql = f'''
+                    ALTER TABLE "{old_table}"
+                    RENAME TO "{new_table}";
+                '''
+
+            # Alter the table
+            self.query(sql)
+
+            # Return the result
+            return True
+
+        # Table not exists
+        else:
+            # Developer mode
+            if self.debug:
+                # Raise error
+                raise Exception(f'Table "{old_table}" doesn\'t exist')
+
+            # Production mode
+            else:
+                print(f'Table "{old_table}" doesn\'t exist')
+                return False
+
+
+    ##################
+    # Delete Methods #
+    ##################
+    ##
+    # *WARNING! If you ignore the 'where' parameter, it will deletes all the records inside your table! (must confirm)
+    #
+    # @desc Deletes row(s)
+    #
+    # @param {str}  table   -- Required Table name (ex. "users")
+    # @param {dict} where   -- Optional (*WARNING!) WHERE statement (ex. {"id": "2", "username": "admin"})
+    # @param {bool} confirm -- Optional|Required confirm (if not where it will be Required)
+    #
+    # @var {tuple} shape     -- The statement shape (the compiled statements cache key)
+    # @var {str}   sql       -- The sql statement
+    # @var {list}  kinds     -- The bind types of the WHERE clause values
+    # @var {list}  data_bind -- Data binding against SQL Injection
+    #
+    # @return {bool}
+    ##
+    @writes
+    def delete(self, table:str, where:dict={}, confirm:bool=False):
+        
+        # Check the confirm if the where clase not set
+        if not where and not confirm:
+            # Developer mode
+            if self.debug:
+                # Raise error
+                raise Exception('For delete without the where clause you must confirm the command.')
+
+            # Production mode
+            else:
+                print('For delete without the where clause you must confirm the command.')
+                return False
+
+        # Check required params
+        if not table:
+            # Developer mode
+            if self.debug:
+                # Raise error
+                raise Exception("You must provide the required parameters: ['table']")
+
+            # Production mode
+            else:
+                print("You must provide the required parameters: ['table']")
+                return False
+        
+        # The statement shape
+        shape = ('delete', self.db_system, table, Database._shape(self, where))
+
+        # Find the compiled statement
+        statement = Statements.get(shape)
+
+        # Compile the statement
+        if not statement:
+            # Prepare the where clause
+            where_sql, kinds = Database._where(self, where)
+
+            # Prepare the sql statement
+            sql = f'''DELETE FROM {Database._quote(self, table)}{where_sql};'''
+
+            # Cache the compiled statement
+            statement = Statements.set(shape, (sql, kinds))
+
+        # Bind the data
+        sql, kinds = statement
+        data_bind = Database._bind(self, where, kinds)
+
+        # Deletion was successfull
+        if self.query(sql, data_bind):
+            # Return result
+            return True
+
+        # Deletion failed
+        else:
+            # Return result
+            return False
+
+
+    ##
+    # CAUTION! Use this methods only in development.
+    #
+    # @desc Drops a foreign key from an existing table (MySQL and Postgres)
+    #
+    # @param {str} table     -- Required table name
+    # @param {str} table     -- Required column name
+    # @param {str} fk_symbol -- Required foreign key symbol
+    # 
+    # @var {str} sql -- The sql statement
+    #
+    # @return {bool}
+    ##
+    @ddl
+    def _delete_fk(self, table:str, column:str, fk_symbol:str, confirm:bool=False):
+
+        # Check development
+        if not self.development:
+            return True
+
+        # Check the development
+        if not self.development:
+            alert = '''----------------------------------------------------------\n'''
+            alert += '''INFO!\n'''
+            alert += '''This method is only available in development!\n'''
+            alert += '''----------------------------------------------------------'''
+
+            # Alert the user
+            print(alert)
+
+            # Exit the program
+            exit()
 
-        # ON DELETE statement
-        if on_delete:
-            on_delete = f' ON DELETE {on_delete}'
-        else:
-            on_delete = ''
+        # Check the database system
+        if not self.db_system == 'Postgres' and not self.db_system == 'MySQL':
+            # Developer mode
+            if self.debug:
+                # Raise error
+                raise Exception('The "delete_fk" method only works with MySQL and Postgres!')
+
+            # Production mode
+            else:
+                print('The "delete_fk" method only works with MySQL and Postgres!')
+                return False
+
+        # Check required params
+        if not table or not column or not fk_symbol or not confirm:
+            # Developer mode
+            if self.debug:
+                # Raise error
+                raise Exception("You must provide the required parameters: ['table', 'column', 'fk_symbol', 'confirm']")
+
+            # Production mode
+            else:
+                print("You must provide the required parameters: ['table', 'column', 'fk_symbol', 'confirm']")
+                return False
+
+        # Tables not exist
+        if not self._exist_table(table):
+            # Developer mode
+            if self.debug:
+                # Raise error
+                raise Exception(f'Table "{table}" doesn\'t exist!')
+
+            # Production mode
+            else:
+                print(f'Table "{table}" doesn\'t exist!')
+                return False
+
+        # Foreign key not exists
+        if not self._exist_fk(table, column):
+            # Developer mode
+            if self.debug:
+                # Raise error
+                raise Exception(f'The foreign key not exists!')
+
+            # Production mode
+            else:
+                print(f'The foreign key not exists!')
+                return False
 
+        # Everything is OK
         # MySQL
         if self.db_system == 'MySQL':
             sql = f'''
                 ALTER TABLE `{table}`
-                ADD CONSTRAINT `{fk_symbol}`
-                FOREIGN KEY (`{column}`)
-                REFERENCES `{r_table}`(`{r_column}`)
-                {on_update + on_delete};
+                DROP FOREIGN KEY `{fk_symbol}`;
             '''
 
         # Postgres
         elif self.db_system == 'Postgres':
             sql = f'''
                 ALTER TABLE "{table}"
-                ADD CONSTRAINT "{fk_symbol}"
-                FOREIGN KEY ("{column}")
-                REFERENCES "{r_table}"("{r_column}")
-                {on_update + on_delete};
+                DROP CONSTRAINT "{fk_symbol}";
             '''
 
-        # Attempt to add the foreign key
+        # Attempt to drop the foreign key
         try:
-            # Add the foreign key
+            # Drop the foreign key
             self.query(sql)
 
             # Return the result
@@ -949,21 +3545,23 @@ class Database:
 
 
     ##
-    # CAUTION! Use this methods only in development.
+    # DANGER! Be super careful. This method drops your column permanently.
     #
-    # @desc Adds a new column
+    # CAUTION! Use this methods only in development.
     #
-    # @param {str} table       -- Required table name
-    # @param {str} col_data    -- Required column and it's data
-    # @param {str} datatype    -- Required datatype of the column
-    # @param {str} constraints -- Optional column constraints 
+    # @desc Drops a column from a table
     #
+    # @param {str}  table   -- Required table name
+    # @param {str}  column  -- Required column name
+    # @param {bool} confirm -- Required confirmation
+    # 
     # @var {str} sql             -- The sql statement
     # @var {str} table_existance -- SQL statement for sqlite_master
     #
     # @return {bool}
     ##
-    def _create_column(self, table:str, column:str, datatype:str, constraints:str=None):
+    @ddl
+    def _delete_column(self, table:str, column:str, confirm:bool=False):
 
         # Check development
         if not self.development:
@@ -983,64 +3581,73 @@ class Database:
             exit()
 
         # Check required params
-        if not table or not column or not datatype:
+        if not table or not column or not confirm:
             # Developer mode
             if self.debug:
                 # Raise error
-                raise Exception("You must provide the required parameters: ['table', 'column', 'datatype']")
+                raise Exception("You must provide the required parameters: ['table', 'column', 'confirm']")
 
             # Production mode
             else:
-                print("You must provide the required parameters: ['table', 'column', 'datatype']")
+                print("You must provide the required parameters: ['table', 'column', 'confirm']")
                 return False
 
-        # Check constraints
-        if constraints:
-            constraints = f' {constraints}'
-        else:
-            constraints = ''
+
+        # Check the FOREIGN KEY
+        if self._exist_fk(table=table, column=column):
+            # Developer mode
+            if self.debug:
+                # Raise error
+                raise Exception('You cannot drop a foreign key with "_delete_column" method!')
+
+            # Production mode
+            else:
+                print('You cannot drop a foreign key with "_delete_column" method!')
+                return False
 
         # Prepare sql statements
         # SQLite
         if self.db_system == 'SQLite':
             sql = f'''
                 ALTER TABLE '{table}'
-                ADD '{column}' {datatype + constraints};
+                DROP COLUMN '{column}';
             '''
+            
         # MySQL
         elif self.db_system == 'MySQL':
             sql = f'''
                 ALTER TABLE `{table}`
-                ADD `{column}` {datatype + constraints};
+                DROP COLUMN `{column}`;
             '''
+            
         # Postgres
         elif self.db_system == 'Postgres':
             sql = f'''
                 ALTER TABLE "{table}"
-                ADD "{column}" {datatype + constraints};
+                DROP COLUMN "{column}";
             '''
 
         # Table exists
         if self._exist_table(table):
 
-            # Column not exists
-            if not self._exist_column(table, column):
-                # Add the column
+            # Column exists
+            if self._exist_column(table, column):
+                # Drop the column
                 self.query(sql)
 
                 # Return the result
                 return True
 
-            # Table exists
+            # Column not exists
             else:
                 # Developer mode
                 if self.debug:
                     # Raise error
-                    raise Exception(f'Column "{column}" already exists!')
+                    raise Exception(f'Column "{column}" does\'nt exists!')
 
                 # Production mode
                 else:
-                    print(f'Column "{column}" already exists!')
+                    print(f'Column "{column}" does\'nt exists!')
                     return False
 
         # Table not exists
@@ -1048,58 +3655,31 @@ class Database:
             # Developer mode
             if self.debug:
                 # Raise error
-                raise Exception(f'Table "{table}" doesn\'t exist!')
+                raise Exception(f'Table "{table}" doesn\'t exist')
 
             # Production mode
             else:
-                print(f'Table "{table}" doesn\'t exist!')
+                print(f'Table "{table}" doesn\'t exist')
                 return False
 
 
     ##
-    # CAUTION! Use this methods only in development.
-    #
-    # @desc Creates a table if not exists.
+    # DANGER! Be super careful. This method drops your table permanently.
     #
-    # @Syntax:
-    # foreign_key = {
-    #   'user_id': {
-    #       'r_table':   'users',
-    #       'r_column':  'id',
-    #       'on_update': RESTRICT | CASCADE | SET NULL | NO ACTION | SET DEFAULT,
-    #       'on_delete': RESTRICT | CASCADE | SET NULL | NO ACTION | SET DEFAULT,
-    #   },
-    # }
+    # CAUTION! Use this methods only in development.
     #
-    # @param {str}  table       -- Required table name
-    # @param {dict} col_type    -- Required column names and datatypes
-    # @param {str}  primary_key -- Optional PRIMARY KEY column
-    # @param {list} unique      -- Optional UNIQUE Constraint columns
-    # @param {list} not_null    -- Optional NOT NULL Constraint columns
-    # @param {dict} default     -- Optional DEFAULT Constraint columns
-    # @param {dict} check       -- Optional CHECK Constraint for the table
-    # @param {dict} foreign_key -- Optional FOREIGN KEY Constraints
+    # @desc Drops a table if exists
     #
-    # @var {str}  sql             -- The sql statement
-    # @var {list} data_list       -- SQL data as list
-    # @var {str}  data_sql        -- The sql data
-    # @var {str}  table_existance -- SQL statement for sqlite_master
-    # @var {str}  pk_col          -- The PRIMARY KEY sql statement
-    # @var {str}  unique_col      -- The UNIQUE sql statement
-    # @var {str}  null_col        -- The NOT NULL sql statement
-    # @var {str}  default_col     -- The DEFAULT sql statement
-    # @var {str}  check_col       -- The CHECK sql statement
-    # @var {str}  auto_increment  -- The AUTO_INCREMENT sql statement for MySQL
-    # @var {str}  r_table         -- The reference table name for the foreign key
-    # @var {str}  r_column        -- The reference column name for the foreign key
-    # @var {str}  fk_symbol       -- The foreign key symbol for Postgres and MySQL
-    # @var {str}  on_update       -- ON UPDATE statement for the foreign key
-    # @var {str}  on_delete       -- ON DELETE statement for the foreign key
+    # @param {str}  table   -- Required table name
+    # @param {bool} confirm -- Required confirmation
+    # 
+    # @var {str} sql             -- The sql statement
+    # @var {str} table_existance -- SQL statement for sqlite_master
     #
     # @return {bool}
     ##
-    def _create_table(self, table:str, col_type:dict, primary_key:str=None, unique:list=[], not_null:list=[], 
-        default:dict={}, check:dict={}, foreign_key:dict={}):
+    @ddl
+    def _delete_table(self, table:str, confirm:bool=False):
 
         # Check development
         if not self.development:
@@ -1118,145 +3698,70 @@ class Database:
             # Exit the program
             exit()
 
-        # Placeholders
-        data_list = []
-        data_sql = ''
-        
         # Check required params
-        if not table or not col_type:
+        if not table or not confirm:
             # Developer mode
             if self.debug:
                 # Raise error
-                raise Exception("You must provide the required parameters: ['table', 'col_type']")
-
-            # Production mode
-            else:
-                print("You must provide the required parameters: ['table', 'col_type']")
-                return False
-
-        # Columns and datatypes
-        for key, value in col_type.items():
-            pk_col = ' PRIMARY KEY' if key == primary_key else ''
-            unique_col = ' UNIQUE' if key in unique else ''
-            null_col = ' NOT NULL' if key in not_null else ''
-            default_col = f' DEFAULT {default[key]}' if key in default else ''
-            check_col = f' CHECK ({check[key]})' if key in check else ''
-
-            # MySQL AUTO_INCREMENT
-            if self.db_system == 'MySQL' and pk_col:
-                pk_col += ' AUTO_INCREMENT'
-
-            # Postgres AUTO_INCREMENT
-            if self.db_system == 'Postgres' and pk_col:
-                # data_list.append(f'{key} SERIAL')
-                if not value.upper() in ['SMALLSERIAL', 'SERIAL', 'BIGSERIAL']:
-                    value = 'SERIAL'
-
-            # SQLite
-            if self.db_system == 'SQLite':
-                data_list.append(f''''{key}' {value.upper() + pk_col + unique_col + null_col + default_col + check_col}''')
-
-            # MySQL
-            elif self.db_system == 'MySQL':
-                data_list.append(f'''`{key}` {value.upper() + pk_col + unique_col + null_col + default_col + check_col}''')
-
-            # Postgres
-            elif self.db_system == 'Postgres':
-                data_list.append(f'''"{key}" {value.upper() + pk_col + unique_col + null_col + default_col + check_col}''')
-
-        # FOREIGN KEY
-        if foreign_key:
-            for key, value in foreign_key.items():
-                
-                # Reference table and column
-                r_table = value['r_table']
-                r_column = value['r_column']
-
-                # Foreign key symbol
-                fk_symbol = f'fk_{table}_{r_table}'
-
-                # Foreign key on update and delete
-                try:
-                    on_update = value['on_update']
-                    on_delete = value['on_delete']
-                except:
-                    on_update = None
-                    on_delete = None
-
-                on_update = f' ON UPDATE {on_update}' if on_update else ''
-                on_delete = f' ON DELETE {on_delete}' if on_delete else ''
-                
-                # SQLite
-                if self.db_system == 'SQLite':
-                    data_list.append(f'''FOREIGN KEY ('{key}') REFERENCES '{r_table}'('{r_column}'){on_update + on_delete}''')
-
-                # MySQL
-                elif self.db_system == 'MySQL':
-                    data_list.append(f'''CONSTRAINT {fk_symbol} FOREIGN KEY (`{key}`) REFERENCES `{r_table}`(`{r_column}`){on_update + on_delete}''')
-
-                # Postgres
-                elif self.db_system == 'Postgres':
-                    data_list.append(f'''CONSTRAINT {fk_symbol} FOREIGN KEY ("{key}") REFERENCES "{r_table}"("{r_column}"){on_update + on_delete}''')
+                raise Exception("You must provide the required parameters: ['table', 'confirm']")
 
-        # Prepare sql data
-        data_sql = ',\n    '.join(data_list)
+            # Production mode
+            else:
+                print("You must provide the required parameters: ['table', 'confirm']")
+                return False
 
-        # Prepare final sql statements
+        # Prepare sql statements
         # SQLite
         if self.db_system == 'SQLite':
-            sql = f'''CREATE TABLE '{table}' (\n    '''
-            sql += data_sql
-            sql += '''\n);'''
-
+            sql = f'''DROP TABLE '{table}';'''
+            
         # MySQL
         elif self.db_system == 'MySQL':
-            sql = f'''CREATE TABLE `{table}` (\n    '''
-            sql += data_sql
-            sql += '''\n);'''
-
+            sql = f'''DROP TABLE `{table}`;'''
+            
         # Postgres
         elif self.db_system == 'Postgres':
-            sql = f'''CREATE TABLE "{table}" (\n    '''
-            sql += data_sql
-            sql += '''\n);'''
+            sql = f'''DROP TABLE "{table}";'''
 
-        # Table not exists
-        if not self._exist_table(table):
-            # Create the table
+        # Table exists
+        if self._exist_table(table):
+            # Drop the table
             self.query(sql)
 
             # Return the result
             return True
             
-        # Table already exists
         else:
             # Developer mode
             if self.debug:
                 # Raise error
-                raise Exception(f'Table "{table}" already exists!')
+                raise Exception(f'Table "{table}" doesn\'t exist')
 
             # Production mode
             else:
-                print(f'Table "{table}" already exists!')
+                print(f'Table "{table}" doesn\'t exist')
                 return False
 
 
     ##
+    # DANGER! Be super careful. This method drops your database permanently.
+    #
     # CAUTION! Use this methods only in development.
     #
-    # @desc Creates a new database (file - SQLite)
+    # @desc Drops a database (Removes a database file for SQLite)
     #
-    # @param {str} database -- Required database name (file - SQLite)
+    # @param {str}  database -- Required database name (file -- SQLite)
+    # @param {bool} confirm  -- Required confirmation
     # 
-    # @var {str}    sql   -- The sql statement
-    # @var {str}    err   -- The error message for SQLite
-    # @var {object} conn  -- The custom database connection for Postgres and MySQL
-    # @var {object} cur:  -- The custom connection cursor for Postgres and MySQL
+    # @var {str}    sql  -- The sql statement
+    # @var {object} conn -- The custom database connection form Postgres and MySQL
+    # @var {object} cur  -- The custom connection cursor form Postgres and MySQL
     #
     # @return {bool}
     ##
-    def _create_database(self, database:str=None):
-
+    @ddl
+    def _delete_database(self, database:str=None, confirm:str=False):
+        
         # Check development
         if not self.development:
             return True
@@ -1275,72 +3780,60 @@ class Database:
             exit()
 
         # Check the required params
-        if not database:
+        if not database or not confirm:
             # Developer mode
             if self.debug:
                 # Raise error
-                raise Exception("You must provide the required parameters: ['database']")
+                raise Exception("You must provide the required parameters: ['database', 'confirm']")
 
             # Production mode
             else:
-                print("You must provide the required parameters: ['database']")
+                print("You must provide the required parameters: ['database', 'confirm']")
                 return False
 
-        # Database already exists
-        if self._exist_database(database=database):
+        # Database not exists
+        if not self._exist_database(database=database):
             # Developer mode
             if self.debug:
                 # Raise error
-                raise Exception(f'Database "{database}" already exists!')
+                raise Exception(f'Database "{database}" not exists!')
 
             # Production mode
             else:
-                print(f'Database "{database}" already exists!')
+                print(f'Database "{database}" not exists!')
                 return False
 
-        # Database not exists
+        # Database exists
         else:
+            # Close the database connection
+            if self.conn:
+                self.conn.close()
+
+            # Close the pooled connections of the database
+            if self.pool:
+                self.pool.clear()
+
             # SQLite
             if self.db_system == 'SQLite':
-            
-                # Check database file name and extension
-                if not check_file(database, '.db') and not check_file(database, '.sqlite') and not check_file(database, '.sqlite3'):
+                # Attempt the process
+                try:
+                    # Remove the database file
+                    delete_file(self.app_path + self.sep + database)
 
-                    # Prepare error message
-                    err = '''Database file name and/or extension is invalid!\n'''
-                    err += '''Valid Names: A-Z, a-z, _\n'''
-                    err += '''Valid Extensions: .sqlite3, .sqlite, .db'''
+                    # Return the result
+                    return True
 
-                    # Check debug mode
+                # Handle the errors
+                except NameError as err:
+                    # Developer mode
                     if self.debug:
                         # Raise error
                         raise Exception(err)
 
-                    # Return the result
+                    # Production mode
                     else:
+                        print(err)
                         return False
-                
-                # Everything is fine
-                else:
-                    # Attempt the process
-                    try:
-                        # Create the database
-                        self.conn = DatabaseAPI.connect(database)
-
-                        # Return the result
-                        return True
-
-                    # Handle the errors
-                    except NameError:
-                        # Developer mode
-                        if self.debug:
-                            # Raise error
-                            raise Exception('Cannot create the database!')
-
-                        # Production mode
-                        else:
-                            print('Cannot create the database!')
-                            return False
 
             # MySQL
             elif self.db_system == 'MySQL':
@@ -1354,7 +3847,7 @@ class Database:
                 # Attempt the process
                 try:
                     # Prepare sql
-                    sql = f'''CREATE DATABASE `{database}`;'''
+                    sql = f'''DROP DATABASE `{database}`;'''
                     
                     # Create the connection cursor
                     cur = conn.cursor()
@@ -1382,9 +3875,6 @@ class Database:
 
             # Postgres
             elif self.db_system == 'Postgres':
-                # Close the global connection
-                self.conn.close()
-
                 # Create a database connection
                 conn = DatabaseAPI.connect(
                     host=self.host,
@@ -1396,7 +3886,7 @@ class Database:
                 # Attempt the process
                 try:
                     # Prepare sql
-                    sql = f'''CREATE DATABASE "{database}";'''
+                    sql = f'''DROP DATABASE "{database}";'''
 
                     # Set the transaction to autocommit
                     conn.autocommit = True
@@ -1407,2495 +3897,2216 @@ class Database:
                     # Excecute the sql
                     cur.execute(sql)
 
-                    # Close the current connection
-                    conn.close()
-
-                    # Return the result
-                    return True
-
-                # Handle the errors
-                except NameError as err:
-                    # Developer mode
-                    if self.debug:
-                        # Raise error
-                        raise Exception(err)
-
-                    # Production mode
-                    else:
-                        print(err)
-                        return False
-
-
-    ################
-    # Read Methods #
-    ################
-    ##
-    # @desc Selects rows
-    #
-    # @param {str}  table    -- Required Table name (ex. "users")
-    # @param {list} cols     -- Optional Columns (ex. ["id", "first_name", "last_name"])
-    # @param {dict} where    -- Optional WHERE statement (ex. {"id": "2", "username": "admin"})
-    # @param {dict} order_by -- Optional ORDER BY statement (ex. {"id": "ASC", "date": "DESC"})
-    # @param {str}  group_by -- Optional GROUP BY statement (ex. 'country')
-    # @param {int}  limit    -- Optional LIMIT statement (ex. "10")
-    # @param {int}  offset   -- Optional OFFSET statement (ex. "10")
-    #
-    # @var {str}  sql: str     -- The sql statement
-    # @var {list} data_bind    -- Data binding against SQL Injection
-    # @var {list} where_sql    -- A placeholder for the WHERE clause
-    # @var {list} order_by_sql -- A placeholder for the ORDER BY clause
-    # @var {list} in_bind      -- A placeholder IN operator
-    # @var {str}  in_sql       -- The sql statement for IN operator
-    #
-    # @return {class}
-    ##
-    def read(self, table:str, cols:list=[], where:dict={}, order_by:dict={}, group_by:str=None, limit:int=None, offset:int=None):
-
-        # Check required params
-        if not table:
-            # Developer mode
-            if self.debug:
-                # Raise error
-                raise Exception("You must provide the required parameters: ['table']")
-
-            # Production mode
-            else:
-                print("You must provide the required parameters: ['table']")
-                return False
-
-        # The default variables
-        data_col = []
-        data_bind = []
-        where_sql = []
-        order_by_sql = []
-
-        # Check cols
-        if not cols or cols == ['*'] or cols == ["*"]:
-            cols = '*'
-        else:
-            # SQLite
-            if self.db_system == 'SQLite':
-                for col in cols:
-                    data_col.append(f'"{col}"')
-                    # data_col.append(f"'{col}'")
-
-                cols = ', '.join(data_col)
-
-            # MySQL
-            elif self.db_system == 'MySQL':
-                for col in cols:
-                    data_col.append(f'`{col}`')
-
-                cols = ', '.join(data_col)
-                
-            # Postgres
-            elif self.db_system == 'Postgres':
-                for col in cols:
-                    data_col.append(f'"{col}"')
-
-                cols = ', '.join(data_col)
-
-        # Check where
-        if where:
-            for key, value in where.items():
-                in_bind = []
-
-                # Remove the Ineffective characters (#)
-                key = delete_chars(key, '#')
-        
-                # Check patterns
-                # Equal to (strict)
-                if re.search('--equal$', key) or re.search('--e$', key):
-                    key = key.replace('--equal', '')
-                    key = key.replace('--e', '')
-
-                    # SQLite and Postgres
-                    if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                        where_sql.append(f'"{key}"={self.sp_char}')
-
-                    # MySQL
-                    elif self.db_system == 'MySQL':
-                        where_sql.append(f'`{key}`={self.sp_char}')
-
-                    data_bind.append(value)
-
-                # Not equal to
-                elif re.search('--not-equal$', key) or re.search('--ne$', key):
-                    key = key.replace('--not-equal', '')
-                    key = key.replace('--ne', '')
-
-                    # SQLite and Postgres
-                    if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                        where_sql.append(f'"{key}"<>{self.sp_char}')
-
-                    # MySQL
-                    elif self.db_system == 'MySQL':
-                        where_sql.append(f'`{key}`<>{self.sp_char}')
-
-                    data_bind.append(value)
-
-                # Greater than
-                elif re.search('--greater-than$', key) or re.search('--gt$', key):
-                    key = key.replace('--greater-than', '')
-                    key = key.replace('--gt', '')
-
-                    # SQLite and Postgres
-                    if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                        where_sql.append(f'"{key}">{self.sp_char}')
-
-                    # MySQL
-                    elif self.db_system == 'MySQL':
-                        where_sql.append(f'`{key}`>{self.sp_char}')
-                    
-                    data_bind.append(value)
-
-                # Greater than or equal to
-                elif re.search('--greater-equal$', key) or re.search('--ge$', key):
-                    key = key.replace('--greater-equal', '')
-                    key = key.replace('--ge', '')
-
-                    # SQLite and Postgres
-                    if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                        where_sql.append(f'"{key}">={self.sp_char}')
-
-                    # MySQL
-                    elif self.db_system == 'MySQL':
-                        where_sql.append(f'`{key}`>={self.sp_char}')
-
-                    data_bind.append(value)
-
-                # Less than
-                elif re.search('--less-than$', key) or re.search('--lt$', key):
-                    key = key.replace('--less-than', '')
-                    key = key.replace('--lt', '')
-
-                    # SQLite and Postgres
-                    if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                        where_sql.append(f'"{key}"<{self.sp_char}')
-
-                    # MySQL
-                    elif self.db_system == 'MySQL':
-                        where_sql.append(f'`{key}`<{self.sp_char}')
-
-                    data_bind.append(value)
-
-                # Less than or equal to
-                elif re.search('--less-equal$', key) or re.search('--le$', key):
-                    key = key.replace('--less-equal', '')
-                    key = key.replace('--le', '')
-
-                    # SQLite and Postgres
-                    if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                        where_sql.append(f'"{key}"<={self.sp_char}')
-
-                    # MySQL
-                    elif self.db_system == 'MySQL':
-                        where_sql.append(f'`{key}`<={self.sp_char}')
-                        
-                    data_bind.append(value)
-
-                # LIKE
-                elif re.search('--like$', key) or re.search('--l$', key):
-                    key = key.replace('--like', '')
-                    key = key.replace('--l', '')
-
-                    # SQLite and Postgres
-                    if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                        where_sql.append(f'"{key}" LIKE {self.sp_char}')
-
-                    # MySQL
-                    elif self.db_system == 'MySQL':
-                        where_sql.append(f'`{key}` LIKE {self.sp_char}')
-
-                    data_bind.append(value)
-                    
-                # NOT LIKE
-                elif re.search('--not-like$', key) or re.search('--nl$', key):
-                    key = key.replace('--not-like', '')
-                    key = key.replace('--nl', '')
-
-                    # SQLite and Postgres
-                    if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                        where_sql.append(f'"{key}" NOT LIKE {self.sp_char}')
-
-                    # MySQL
-                    elif self.db_system == 'MySQL':
-                        where_sql.append(f'`{key}`  NOT LIKE {self.sp_char}')
-
-                    data_bind.append(value)
-                
-                # BETWEEN
-                elif re.search('--between$', key) or re.search('--b$', key):
-                    key = key.replace('--between', '')
-                    key = key.replace('--b', '')
-
-                    # SQLite and Postgres
-                    if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                        where_sql.append(f'"{key}" BETWEEN {self.sp_char} AND {self.sp_char}')
-
-                    # MySQL
-                    elif self.db_system == 'MySQL':
-                        where_sql.append(f'`{key}` BETWEEN {self.sp_char} AND {self.sp_char}')
-
-                    data_bind.append(value[0])
-                    data_bind.append(value[1])
-                
-                # NOT BETWEEN
-                elif re.search('--not-between$', key) or re.search('--nb$', key):
-                    key = key.replace('--not-between', '')
-                    key = key.replace('--nb', '')
-
-                    # SQLite and Postgres
-                    if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                        where_sql.append(f'"{key}" NOT BETWEEN {self.sp_char} AND {self.sp_char}')
-
-                    # MySQL
-                    elif self.db_system == 'MySQL':
-                        where_sql.append(f'`{key}` NOT BETWEEN {self.sp_char} AND {self.sp_char}')
-                        
-                    data_bind.append(value[0])
-                    data_bind.append(value[1])
-                
-                # IN
-                elif re.search('--in$', key) or re.search('--i$', key):
-                    key = key.replace('--in', '')
-                    key = key.replace('--i', '')
-                    for x in value:
-                        in_bind.append(self.sp_char)
-                        data_bind.append(x)
-
-                    in_sql =','.join(in_bind)
-
-                    # SQLite and Postgres
-                    if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                        where_sql.append(f'"{key}" IN ({in_sql})')
-
-                    # MySQL
-                    elif self.db_system == 'MySQL':
-                        where_sql.append(f'`{key}` IN ({in_sql})')
-
-                # NOT IN
-                elif re.search('--not-in$', key) or re.search('--ni$', key):
-                    key = key.replace('--not-in', '')
-                    key = key.replace('--ni', '')
-                    for x in value:
-                        in_bind.append(self.sp_char)
-                        data_bind.append(x)
-
-                    in_sql =','.join(in_bind)
-
-                    # SQLite and Postgres
-                    if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                        where_sql.append(f'"{key}" NOT IN ({in_sql})')
-
-                    # MySQL
-                    elif self.db_system == 'MySQL':
-                        where_sql.append(f'`{key}` NOT IN ({in_sql})')
-
-                # Equal to (default)
-                else:
-                    # SQLite and Postgres
-                    if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                        where_sql.append(f'"{key}"={self.sp_char}')
-
-                    # MySQL
-                    elif self.db_system == 'MySQL':
-                        where_sql.append(f'`{key}`={self.sp_char}')
-
-                    data_bind.append(value)
-
-            # Prepare the where SQL
-            where = ' WHERE '
-
-            # Check column prefixes (and/or)
-            i = 0
-            for x in where_sql:
-                ch = ''
-
-                if re.search('^or--', clean_key(x)) or re.search('^o--', clean_key(x)):
-                    x = x.replace('or--', '')
-                    x = x.replace('o--', '')
-                    if i > 0:
-                        ch = 'OR '
-
-                    where_sql[i] = f'{ch + x}'
-                
-                elif re.search('^and--', clean_key(x)) or re.search('^a--', clean_key(x)):
-                    x = x.replace('and--', '')
-                    x = x.replace('a--', '')
-                    if i > 0:
-                        ch = 'AND '
-
-                    where_sql[i] = f'{ch + x}'
-                
-                else:
-                    if i > 0:
-                        ch = 'AND '
-
-                    where_sql[i] = f'{ch + x}'
-
-                i += 1
-
-            where += ' '.join(where_sql)
-
-        else:
-            where = ''
-
-        # Check order_by
-        if order_by:
-            for key, value in order_by.items():
-                # SQLite and Postgres
-                if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                    order_by_sql.append(f'"{key}" {value.upper()}')
-
-                # MySQL
-                elif self.db_system == 'MySQL':
-                    order_by_sql.append(f'`{key}` {value.upper()}')
-
-            order_by = ' ORDER BY ' + ', '.join(order_by_sql)
-
-        else:
-            order_by = ''
-
-        # Check group_by
-        if group_by:
-            # SQLite and Postgres
-            if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                group_by = f' GROUP BY "{group_by}"'
-
-            # MySQL
-            elif self.db_system == 'MySQL':
-                group_by = f' GROUP BY `{group_by}`'
+                    # Close the current connection
+                    conn.close()
 
-        else:
-            group_by = ''
+                    # Return the result
+                    return True
 
-        # Check limit
-        if limit:
-            limit = f' LIMIT {limit}'
-        else:
-            limit = ''
+                # Handle the errors
+                except NameError as err:
+                    # Developer mode
+                    if self.debug:
+                        # Raise error
+                        raise Exception(err)
 
-        # Check offset
-        if offset:
-            offset = f' OFFSET {offset}'
-        else:
-            offset = ''
+                    # Production mode
+                    else:
+                        print(err)
+                        return False
 
-        # Prepare the sql statement
-        # SQLite
-        if self.db_system == 'SQLite':
-            sql = f'''SELECT {cols} FROM '{table}'{where + order_by + group_by + limit + offset};'''
-            
-        # MySQL
-        elif self.db_system == 'MySQL':
-            sql = f'''SELECT {cols} FROM `{table}`{where + order_by + group_by + limit + offset};'''
-            
-        # Postgres
-        elif self.db_system == 'Postgres':
-            sql = f'''SELECT {cols} FROM "{table}"{where + order_by + group_by + limit + offset};'''
 
-        # Return result
-        return Read(self, sql, data_bind)
+##############
+# Read Class #
+##############
+##
+# @desc Provides several methods for the read method of the Database class
+##
+class Read:
+
+    # The counter of the named (server-side) cursors
+    names = itertools.count()
 
 
     ##
-    # @desc Joins related tables
-    #
-    # @param {str}  table     -- Required main Table (ex. "table_1")
-    # @param {list} f_keys    -- Required foreign keys (ex. ["user_id", "flight_id"])
-    # @param {list} f_tables  -- Required foreign tables (ex. ["table_2", "table_3"])
-    # @param {list} p_keys    -- Required primary keys (ex. ["pk_2", "pk_3"])
-    # @param {list} cols      -- Optional Columns (ex. ["table.id", "table_2.name", "table_3.address"])
-    #
-    # @param {str}  join_stmt -- The join statement:
-    #        SQLite: INNER JOIN, LEFT JOIN, CROSS JOIN (Learn More: https://www.sqlitetutorial.net/sqlite-join/)
-    #        MySQL: INNER JOIN, LEFT JOIN, RIGHT JOIN, CROSS JOIN (Learn More: https://www.w3schools.com/mysql/mysql_join.asp)
-    #        Postgres: INNER JOIN, LEFT JOIN, RIGHT JOIN, FULL JOIN (Learn More: https://www.postgresqltutorial.com/postgresql-tutorial/postgresql-joins/)
-    #        JOIN vs INNER JOIN: https://stackoverflow.com/questions/565620/difference-between-join-and-inner-join
+    # @desc Constructor method
     #
-    # @param {dict} where    -- Optional WHERE statement (ex. {"table.id": "2", "table_2.name": "John"})
-    # @param {dict} order_by -- Optional ORDER BY statement (ex. {"table.id": "ASC", "table.date": "DESC"})
-    # @param {str}  group_by -- Optional GROUP BY statement (ex. 'table.country')
-    # @param {int}  limit    -- Optional LIMIT statement (ex. "10")
-    # @param {int}  offset   -- Optional OFFSET statement (ex. "10")
+    # @param {class} parent    -- The Database Class
+    # @param {str}   sql       -- The sql query string
+    # @param {list}  data_bind -- The data to bind
+    # @param {dict}  parts     -- Optional sql statement parts (select, from, order_by, reverse, group_by, limit, offset)
+    # @param {dict}  keyset    -- Optional keyset pagination info (keys, limit, before)
+    # @param {dict}  cache     -- Optional result cache info (ttl, tables)
     #
-    # @var {str}  sql: str     -- The sql statement
-    # @var {list} data_bind    -- Data binding against SQL Injection
-    # @var {list} where_sql    -- A placeholder for the WHERE clause
-    # @var {list} order_by_sql -- A placeholder for the ORDER BY clause
-    # @var {list} in_bind      -- A placeholder IN operator
-    # @var {str}  in_sql       -- The sql statement for IN operator
+    # @property {str}    sql       -- the sql query string
+    # @property {object} data_bind -- the data to bind
+    # @property {class}  parent    -- the Database Class (for the streaming cursors)
+    # @property {method} query     -- the read query method of the Database class (a read replica or the primary)
+    # @property {str}    regex     -- the regular expression for the select statement
+    # @property {str}    col       -- the first column extracted from the match
+    # @property {list}   rows      -- the memoized rows (fetched once)
+    # @property {dict}   parts     -- the sql statement parts
+    # @property {list}   bind      -- the data to bind without the LIMIT and OFFSET values
+    # @property {dict}   keyset    -- the keyset pagination info
+    # @property {dict}   cache     -- the result cache info
+    # @property {object} conn      -- the connection of the last opened cursor (a read replica or the primary)
+    # @property {method} prefetch  -- the related rows loader (ex. Model.read(prefetch=[...])), called with the fetched dict rows
     #
-    # @return {class}
+    # @var {str}  regex -- the regular expression for the select statement
+    # @var {str}  match -- the regular expression match
+    # @var {list} cols  -- the columns list extracted from the match
     ##
-    def join(self, table:str, f_keys:list, f_tables:list, p_keys:list, cols:list=[], join_stmt:str='INNER JOIN', where:dict={}, order_by:dict={}, group_by:str=None, limit:int=None, offset:int=None):
+    def __init__(self, parent, sql, data_bind, parts=None, keyset=None, cache=None):
+        # Regular expression
+        regex = f'''SELECT.*?FROM'''
+        
+        # Find the match
+        match = re.search(regex, sql).group()
 
-        # Check required params
-        if not table and not f_keys and not f_tables and not p_keys:
-            # Developer mode
-            if self.debug:
-                # Raise error
-                raise Exception("You must provide the required parameters: 'main_table', 'join_tables'")
+        # Extract column from the match
+        cols = re.sub('SELECT ', '', match)
+        cols = re.sub(' FROM', '', cols)
+        cols = cols.split (',')
 
-            # Production mode
-            else:
-                print("You must provide the required parameters: 'main_table', 'join_tables'")
-                return False
+        # Class properties
+        self.sql = sql
+        self.data_bind = data_bind
+        self.parent = parent
+        self.query = functools.partial(Database._read_query, parent)
+        self.db_system = parent.db_system
+        self.sp_char = parent.sp_char
+        self.regex = regex
+        self.col = cols[0]
+        self.cols = cols
+        self.rows = None
+        self.parts = parts
+        self.bind = Read._bind(data_bind, parts)
+        self.keyset = keyset
+        self.cache = cache
+        self.conn = None
+        self.prefetch = None
 
-        # The default variables
-        data_col = []
-        data_bind = []
-        join_sql = ""
-        where_sql = []
-        order_by_sql = []
 
-        # Check cols
-        if not cols or cols == ['*'] or cols == ["*"]:
-            cols = '*'
-        else:
-            # SQLite
-            if self.db_system == 'SQLite':
-                for col in cols:
-                    # Check the key
-                    if not '.' in col:
-                        data_col.append(f'"{col}"')
-                    else:
-                        data_col.append(f'{col}')
+    ##
+    # @desc Removes the LIMIT and OFFSET values from the data to bind
+    #
+    # @param {list} data_bind -- The data to bind
+    # @param {dict} parts     -- The sql statement parts
+    #
+    # @return {list}
+    ##
+    @staticmethod
+    def _bind(data_bind, parts):
+        # No parts
+        if not parts:
+            return data_bind
 
-            # MySQL
-            elif self.db_system == 'MySQL':
-                for col in cols:
-                    # Check the key
-                    if not '.' in col:
-                        data_col.append(f'`{col}`')
-                    else:
-                        data_col.append(f'{col}')
+        # Return the result
+        return data_bind[:len(data_bind) - bool(parts['limit']) - bool(parts['offset'])]
 
-            # Postgres
-            elif self.db_system == 'Postgres':
-                for col in cols:
-                    # Check the key
-                    if not '.' in col:
-                        data_col.append(f'"{col}"')
-                    else:
-                        data_col.append(f'{col}')
 
-            cols = ', '.join(data_col)
+    ##
+    # @desc Fetches one row of a query
+    #
+    # @param {str}  sql       -- The sql query string
+    # @param {list} data_bind -- The data to bind
+    #
+    # @return {dict|bool}
+    ##
+    def _one(self, sql, data_bind):
+        row = self.query(sql, data_bind).fetchone()
 
-        # Prepare Join statement
-        for i in range(len(f_tables)):
-            fk = f_keys[i]
-            f_table = f_tables[i]
-            f_pk = p_keys[i]
+        # Return the result
+        return row if row else False
 
-            # SQLite and Postgres
-            if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                join_sql += f' {join_stmt.upper()} "{f_table}" ON "{table}"."{fk}" = "{f_table}"."{f_pk}" '
 
-            # MySQL
-            elif self.db_system == 'MySQL':
-                join_sql += f' {join_stmt.upper()} `{f_table}` ON `{table}`.`{fk}` = `{f_table}`.`{f_pk}` '
+    ##
+    # @desc Loads the related rows of a single row (see the prefetch property)
+    #
+    # @param {dict|bool} row -- The fetched row
+    #
+    # @return {dict|bool}
+    ##
+    def _prefetched(self, row):
+        if row and self.prefetch:
+            self.prefetch([row])
 
-        join = join_sql
+        return row
 
-        # Check where
-        if where:
-            for key, value in where.items():
-                in_bind = []
 
-                # Remove the Ineffective characters (#)
-                key = delete_chars(key, '#')
-        
-                # Check patterns
-                # Equal to (strict)
-                if re.search('--equal$', key) or re.search('--e$', key):
-                    key = key.replace('--equal', '')
-                    key = key.replace('--e', '')
-
-                    # Check the key
-                    if not '.' in key:
-                        # SQLite and Postgres
-                        if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                            where_sql.append(f'"{key}"={self.sp_char}')
-
-                        # MySQL
-                        elif self.db_system == 'MySQL':
-                            where_sql.append(f'`{key}`={self.sp_char}')
+    ##
+    # @desc Fetches the first row (LIMIT 1)
+    #
+    # @return {dict}
+    ##
+    def first(self):
+        # Memoized rows (or no sql statement parts, or cached results)
+        if self.rows != None or not self.parts or self.cache:
+            rows = self.fetch()
+            return rows[0] if rows else False
 
-                    else:
-                        where_sql.append(f'{key}={self.sp_char}')
+        # Prepare the sql query
+        sql = f'''{self.parts['select'] + self.parts['from'] + self.parts['order_by']} LIMIT {self.sp_char}'''
+        data_bind = self.bind + [1]
 
-                    data_bind.append(value)
+        # Keep the offset
+        if self.parts['offset']:
+            sql += f''' OFFSET {self.sp_char}'''
+            data_bind.append(int(self.parts['offset']))
 
-                # Not equal to
-                elif re.search('--not-equal$', key) or re.search('--ne$', key):
-                    key = key.replace('--not-equal', '')
-                    key = key.replace('--ne', '')
+        # Return the result
+        return self._prefetched(self._one(sql + ';', data_bind))
 
-                    # Check the key
-                    if not '.' in key:
-                        # SQLite and Postgres
-                        if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                            where_sql.append(f'"{key}"<>{self.sp_char}')
 
-                        # MySQL
-                        elif self.db_system == 'MySQL':
-                            where_sql.append(f'`{key}`<>{self.sp_char}')
-                    else:
-                        where_sql.append(f'{key}<>{self.sp_char}')
+    ##
+    # @desc Fetches the last row (reversed ORDER BY and LIMIT 1)
+    #
+    # @return {dict}
+    ##
+    def last(self):
+        # Memoized rows (or no sql statement parts, or cached results)
+        if self.rows != None or not self.parts or self.cache:
+            rows = self.fetch()
+            return rows[-1] if rows else False
 
-                    data_bind.append(value)
+        # Reverse the order
+        if self.parts['reverse'] and not self.parts['limit'] and not self.parts['offset']:
+            sql = f'''{self.parts['select'] + self.parts['from'] + self.parts['reverse']} LIMIT {self.sp_char};'''
 
-                # Greater than
-                elif re.search('--greater-than$', key) or re.search('--gt$', key):
-                    key = key.replace('--greater-than', '')
-                    key = key.replace('--gt', '')
+            # Return the result
+            return self._prefetched(self._one(sql, self.bind + [1]))
 
-                    # Check the key
-                    if not '.' in key:
-                        # SQLite and Postgres
-                        if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                            where_sql.append(f'"{key}">{self.sp_char}')
+        # Count the rows and skip to the last one
+        count = self.count()
 
-                        # MySQL
-                        elif self.db_system == 'MySQL':
-                            where_sql.append(f'`{key}`>{self.sp_char}')
-                    else:
-                        where_sql.append(f'{key}>{self.sp_char}')
-                    
-                    data_bind.append(value)
-
-                # Greater than or equal to
-                elif re.search('--greater-equal$', key) or re.search('--ge$', key):
-                    key = key.replace('--greater-equal', '')
-                    key = key.replace('--ge', '')
-
-                    # Check the key
-                    if not '.' in key:
-                        # SQLite and Postgres
-                        if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                            where_sql.append(f'"{key}">={self.sp_char}')
-
-                        # MySQL
-                        elif self.db_system == 'MySQL':
-                            where_sql.append(f'`{key}`>={self.sp_char}')
-                    else:
-                        where_sql.append(f'{key}>={self.sp_char}')
+        if not count:
+            return False
 
-                    data_bind.append(value)
+        offset = int(self.parts['offset']) if self.parts['offset'] else 0
 
-                # Less than
-                elif re.search('--less-than$', key) or re.search('--lt$', key):
-                    key = key.replace('--less-than', '')
-                    key = key.replace('--lt', '')
+        sql = f'''{self.parts['select'] + self.parts['from'] + self.parts['order_by']} LIMIT {self.sp_char} OFFSET {self.sp_char};'''
 
-                    # Check the key
-                    if not '.' in key:
-                        # SQLite and Postgres
-                        if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                            where_sql.append(f'"{key}"<{self.sp_char}')
+        # Return the result
+        return self._prefetched(self._one(sql, self.bind + [1, offset + count - 1]))
 
-                        # MySQL
-                        elif self.db_system == 'MySQL':
-                            where_sql.append(f'`{key}`<{self.sp_char}')
-                    else:
-                        where_sql.append(f'{key}<{self.sp_char}')
 
-                    data_bind.append(value)
+    ##
+    # @desc Fetches all the rows
+    #
+    # @param {str} mode -- Optional row mode -- dict (default), tuple, row (a namedtuple class with __slots__)
+    #
+    # @return {list}
+    ##
+    def all(self, mode:str='dict'):
+        # Check the row mode
+        if not self._check_mode(mode):
+            return False
 
-                # Less than or equal to
-                elif re.search('--less-equal$', key) or re.search('--le$', key):
-                    key = key.replace('--less-equal', '')
-                    key = key.replace('--le', '')
+        # Dicts (memoized)
+        if mode == 'dict':
+            return list(self.fetch())
 
-                    # Check the key
-                    if not '.' in key:
-                        # SQLite and Postgres
-                        if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                            where_sql.append(f'"{key}"<={self.sp_char}')
+        # Memoized rows (or the rows fetched in the reversed order, or cached results)
+        if self.rows != None or (self.keyset and self.keyset['before']) or self.cache:
+            return Read._from_dicts(self.fetch(), mode)
 
-                        # MySQL
-                        elif self.db_system == 'MySQL':
-                            where_sql.append(f'`{key}`<={self.sp_char}')
-                    else:
-                        where_sql.append(f'{key}<={self.sp_char}')
-                        
-                    data_bind.append(value)
-
-                # LIKE
-                elif re.search('--like$', key) or re.search('--l$', key):
-                    key = key.replace('--like', '')
-                    key = key.replace('--l', '')
-
-                    # Check the key
-                    if not '.' in key:
-                        # SQLite and Postgres
-                        if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                            where_sql.append(f'"{key}" LIKE {self.sp_char}')
-
-                        # MySQL
-                        elif self.db_system == 'MySQL':
-                            where_sql.append(f'`{key}` LIKE {self.sp_char}')
-                    else:
-                        where_sql.append(f'{key} LIKE {self.sp_char}')
+        # Fetch the compact rows
+        cur = self._cursor(mode)
 
-                    data_bind.append(value)
-                    
-                # NOT LIKE
-                elif re.search('--not-like$', key) or re.search('--nl$', key):
-                    key = key.replace('--not-like', '')
-                    key = key.replace('--nl', '')
-
-                    # Check the key
-                    if not '.' in key:
-                        # SQLite and Postgres
-                        if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                            where_sql.append(f'"{key}" NOT LIKE {self.sp_char}')
-
-                        # MySQL
-                        elif self.db_system == 'MySQL':
-                            where_sql.append(f'`{key}`  NOT LIKE {self.sp_char}')
-                    else:
-                        where_sql.append(f'{key}  NOT LIKE {self.sp_char}')
+        if not cur:
+            return False
 
-                    data_bind.append(value)
-                
-                # BETWEEN
-                elif re.search('--between$', key) or re.search('--b$', key):
-                    key = key.replace('--between', '')
-                    key = key.replace('--b', '')
-
-                    # Check the key
-                    if not '.' in key:
-                        # SQLite and Postgres
-                        if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                            where_sql.append(f'"{key}" BETWEEN {self.sp_char} AND {self.sp_char}')
-
-                        # MySQL
-                        elif self.db_system == 'MySQL':
-                            where_sql.append(f'`{key}` BETWEEN {self.sp_char} AND {self.sp_char}')
-                    else:
-                        where_sql.append(f'{key} BETWEEN {self.sp_char} AND {self.sp_char}')
+        try:
+            return self._convert(cur, cur.fetchall(), mode)
 
-                    data_bind.append(value[0])
-                    data_bind.append(value[1])
-                
-                # NOT BETWEEN
-                elif re.search('--not-between$', key) or re.search('--nb$', key):
-                    key = key.replace('--not-between', '')
-                    key = key.replace('--nb', '')
-
-                    # Check the key
-                    if not '.' in key:
-                        # SQLite and Postgres
-                        if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                            where_sql.append(f'"{key}" NOT BETWEEN {self.sp_char} AND {self.sp_char}')
-
-                        # MySQL
-                        elif self.db_system == 'MySQL':
-                            where_sql.append(f'`{key}` NOT BETWEEN {self.sp_char} AND {self.sp_char}')
-                    else:
-                        where_sql.append(f'{key} NOT BETWEEN {self.sp_char} AND {self.sp_char}')
-                        
-                    data_bind.append(value[0])
-                    data_bind.append(value[1])
-                
-                # IN
-                elif re.search('--in$', key) or re.search('--i$', key):
-                    key = key.replace('--in', '')
-                    key = key.replace('--i', '')
-                    for x in value:
-                        in_bind.append(self.sp_char)
-                        data_bind.append(x)
-
-                    in_sql =','.join(in_bind)
-
-                    # Check the key
-                    if not '.' in key:
-                        # SQLite and Postgres
-                        if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                            where_sql.append(f'"{key}" IN ({in_sql})')
-
-                        # MySQL
-                        elif self.db_system == 'MySQL':
-                            where_sql.append(f'`{key}` IN ({in_sql})')
-                    else:
-                        where_sql.append(f'{key} IN ({in_sql})')
-
-                # NOT IN
-                elif re.search('--not-in$', key) or re.search('--ni$', key):
-                    key = key.replace('--not-in', '')
-                    key = key.replace('--ni', '')
-                    for x in value:
-                        in_bind.append(self.sp_char)
-                        data_bind.append(x)
-
-                    in_sql =','.join(in_bind)
-
-                    # Check the key
-                    if not '.' in key:
-                        # SQLite and Postgres
-                        if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                            where_sql.append(f'"{key}" NOT IN ({in_sql})')
-
-                        # MySQL
-                        elif self.db_system == 'MySQL':
-                            where_sql.append(f'`{key}` NOT IN ({in_sql})')
-                    else:
-                        where_sql.append(f'{key} NOT IN ({in_sql})')
+        finally:
+            cur.close()
 
-                # Equal to (default)
-                else:
-                    # Check the key
-                    if not '.' in key:
-                        # SQLite and Postgres
-                        if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                            where_sql.append(f'"{key}"={self.sp_char}')
-
-                        # MySQL
-                        elif self.db_system == 'MySQL':
-                            where_sql.append(f'`{key}`={self.sp_char}')
-                    else:
-                        where_sql.append(f'{key}={self.sp_char}')
 
-                    data_bind.append(value)
+    ##
+    # @desc Counts the number of rows (SELECT COUNT(*))
+    #
+    # @return {int}
+    ##
+    def count(self):
+        # Memoized rows (or no sql statement parts, or cached results)
+        if self.rows != None or not self.parts or self.cache:
+            return len(self.fetch())
 
-            # Prepare the where SQL
-            where = ' WHERE '
+        # Count the groups or the limited rows
+        if self.parts['group_by'] or self.parts['limit'] or self.parts['offset']:
+            limit_sql = f''' LIMIT {self.sp_char}''' if self.parts['limit'] else ''
+            offset_sql = f''' OFFSET {self.sp_char}''' if self.parts['offset'] else ''
 
-            # Check column prefixes (and/or)
-            i = 0
-            for x in where_sql:
-                ch = ''
+            sql = f'''SELECT COUNT(*) AS total FROM (SELECT 1 AS one{self.parts['from'] + limit_sql + offset_sql}) AS counted;'''
+            data_bind = self.data_bind
 
-                if re.search('^or--', clean_key(x)) or re.search('^o--', clean_key(x)):
-                    x = x.replace('or--', '')
-                    x = x.replace('o--', '')
-                    if i > 0:
-                        ch = 'OR '
+        # Count the rows
+        else:
+            sql = f'''SELECT COUNT(*) AS total{self.parts['from']};'''
+            data_bind = self.bind
 
-                    where_sql[i] = f'{ch + x}'
-                
-                elif re.search('^and--', clean_key(x)) or re.search('^a--', clean_key(x)):
-                    x = x.replace('and--', '')
-                    x = x.replace('a--', '')
-                    if i > 0:
-                        ch = 'AND '
+        # Return the result
+        return self._one(sql, data_bind)['total']
 
-                    where_sql[i] = f'{ch + x}'
-                
-                else:
-                    if i > 0:
-                        ch = 'AND '
 
-                    where_sql[i] = f'{ch + x}'
+    ##
+    # @desc Executes the query once and memoizes the fetched rows
+    #
+    # @return {list}
+    ##
+    def fetch(self):
+        # Memoized rows
+        if self.rows != None:
+            return self.rows
 
-                i += 1
+        # The cached results
+        if self.cache:
+            key = Results.key(self.parent, self.sql, self.data_bind)
+            rows = Results.get(key) if key else None
 
-            where += ' '.join(where_sql)
+            if rows != None:
+                self.rows = rows
 
-        else:
-            where = ''
+                # Load the related rows
+                if self.prefetch:
+                    self.prefetch(self.rows)
 
-        # Check order_by
-        if order_by:
-            for key, value in order_by.items():
-                # Check the key
-                if not '.' in key:
-                    # SQLite and Postgres
-                    if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                        order_by_sql.append(f'"{key}" {value.upper()}')
-
-                    # MySQL
-                    elif self.db_system == 'MySQL':
-                        order_by_sql.append(f'`{key}` {value.upper()}')
-                else:
-                    order_by_sql.append(f'{key} {value.upper()}')
+                return self.rows
 
-            order_by = ' ORDER BY ' + ', '.join(order_by_sql)
+        # Fetch the rows (dict rows on every database system)
+        self.rows = self.query(self.sql, self.data_bind).fetchall()
 
-        else:
-            order_by = ''
+        # The rows before the keyset pagination token (fetched in the reversed order)
+        if self.keyset and self.keyset['before']:
+            self.rows.reverse()
 
-        # Check group_by
-        if group_by:
-            # Check the key
-            if not '.' in key:
-                # SQLite and Postgres
-                if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                    group_by = f' GROUP BY "{group_by}"'
+        # Cache the results (without the related rows)
+        if self.cache and key:
+            Results.set(key, self.rows, self.cache['ttl'], self.cache['tables'])
 
-                # MySQL
-                elif self.db_system == 'MySQL':
-                    group_by = f' GROUP BY `{group_by}`'
-            else:
-                group_by = f' GROUP BY {group_by}'
+        # Load the related rows
+        if self.prefetch:
+            self.prefetch(self.rows)
 
-        else:
-            group_by = ''
+        # Return the result
+        return self.rows
 
-        # Check limit
-        if limit:
-            limit = f' LIMIT {limit}'
-        else:
-            limit = ''
 
-        # Check offset
-        if offset:
-            offset = f' OFFSET {offset}'
-        else:
-            offset = ''
+    ##
+    # @desc Re-executes the query (drops the memoized rows)
+    #
+    # @return {class}
+    ##
+    def refresh(self):
+        self.rows = None
 
-        # Prepare the sql statement
-        # SQLite
-        if self.db_system == 'SQLite':
-            sql = f'''SELECT {cols} FROM '{table}'{join + where + order_by + group_by + limit + offset};'''
-            
-        # MySQL
-        elif self.db_system == 'MySQL':
-            sql = f'''SELECT {cols} FROM `{table}`{join + where + order_by + group_by + limit + offset};'''
-            
-        # Postgres
-        elif self.db_system == 'Postgres':
-            sql = f'''SELECT {cols} FROM "{table}"{join + where + order_by + group_by + limit + offset};'''
+        # Drop the cached results
+        if self.cache:
+            Results.discard(Results.key(self.parent, self.sql, self.data_bind))
 
-        # Return result
-        return Join(self, sql, data_bind)
+        self.fetch()
+
+        return self
 
 
-    ##################
-    # Update Methods #
-    ##################
     ##
-    # *CAUTION! If you ignore the 'where' parameter, it may updates the columns for all records! (must confirm)
+    # @desc Fetches the rows in chunks (streams the result in constant memory)
+    #       SQLite: a separate cursor, MySQL: an unbuffered cursor, Postgres: a named (server-side) cursor
     #
-    # @desc Updates row(s)
+    #       *CAUTION! On MySQL the connection cannot run other queries until the iteration ends.
     #
-    # @param {str}  table   -- Required Table name (ex. "users")
-    # @param {dict} data    -- Required data (ex. {"first_name": "John", "last_name": "Doe"})
-    # @param {dict} where   -- Optional (*CAUTION!) WHERE statement (ex. {"id": "2", "username": "admin"})
-    # @param {bool} confirm -- Optional|Required confirm (if not where it will be Required)
+    # @param {int} n    -- Optional chunk size (rows per fetchmany)
+    # @param {str} mode -- Optional row mode -- dict (default), tuple, row (a namedtuple class with __slots__)
     #
-    # @var {str}  sql       -- The sql statement
-    # @var {list} data_bind -- Data binding against SQL Injection
-    # @var {list} data_sql  -- A placeholder for the update data
-    # @var {list} where_sql -- A placeholder for the WHERE clause
-    # @var {list} in_bind   -- A placeholder IN operator
-    # @var {str}  in_sql    -- The sql statement for IN operator
+    # @var {object} cur -- The streaming cursor
     #
-    # @return {bool}
+    # @yield {list}
     ##
-    def update(self, table:str, data:dict={}, where:dict={}, confirm:bool=False):
+    def chunks(self, n:int=1000, mode:str='dict'):
+        # Check the row mode
+        if not self._check_mode(mode):
+            return
 
-        # Check the confirm if the where clase not set
-        if not where and not confirm:
-            # Developer mode
-            if self.debug:
-                # Raise error
-                raise Exception('For update without the where clause you must confirm the command.')
-
-            # Production mode
-            else:
-                print('For update without the where clause you must confirm the command.')
-                return False
-
-        # The default variables
-        data_bind = []
-        data_sql = []
-        where_sql = []
+        # Memoized rows (or the rows fetched in the reversed order, or cached results)
+        if self.rows != None or (self.keyset and self.keyset['before']) or self.cache:
+            rows = Read._from_dicts(self.fetch(), mode)
 
-        # Check required params
-        if not table or not data:
-            # Developer mode
-            if self.debug:
-                # Raise error
-                raise Exception("You must provide the required parameters: ['']")
+            for i in range(0, len(rows), n):
+                yield rows[i:i + n]
 
-            # Production mode
-            else:
-                print("You must provide the required parameters: ['']")
-                return False
+            return
 
-        # Prepare data
-        # SQLite and Postgres
-        if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-            for key, value in data.items():
-                data_sql.append(f'"{key}"={self.sp_char}')
-                data_bind.append(value)
+        # Open the streaming cursor
+        cur = self._cursor(mode, n, stream=True)
 
-            data = ', '.join(data_sql)
-        
-        # MySQL
-        elif self.db_system == 'MySQL':
-            for key, value in data.items():
-                data_sql.append(f'`{key}`={self.sp_char}')
-                data_bind.append(value)
+        if not cur:
+            return
 
-            data = ', '.join(data_sql)
+        # Fetch the chunks
+        try:
+            while True:
+                rows = cur.fetchmany(n)
 
-        # Check where
-        if where:
-            for key, value in where.items():
-                in_bind = []
+                if not rows:
+                    break
 
-                # Remove the Ineffective characters (#)
-                key = delete_chars(key, '#')
-        
-                # Check patterns
-                # Equal to (strict)
-                if re.search('--equal$', key) or re.search('--e$', key):
-                    key = key.replace('--equal', '')
-                    key = key.replace('--e', '')
+                rows = self._convert(cur, rows, mode)
 
-                    # SQLite and Postgres
-                    if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                        where_sql.append(f'"{key}"={self.sp_char}')
+                # Load the related rows of the chunk (dict rows)
+                if self.prefetch and mode == 'dict':
+                    self.prefetch(rows)
 
-                    # MySQL
-                    elif self.db_system == 'MySQL':
-                        where_sql.append(f'`{key}`={self.sp_char}')
+                yield rows
 
-                    data_bind.append(value)
+        # Close the streaming cursor (even if the iteration stopped early)
+        finally:
+            self._close(cur)
 
-                # Not equal to
-                elif re.search('--not-equal$', key) or re.search('--ne$', key):
-                    key = key.replace('--not-equal', '')
-                    key = key.replace('--ne', '')
 
-                    # SQLite and Postgres
-                    if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                        where_sql.append(f'"{key}"<>{self.sp_char}')
+    ##
+    # @desc Iterates over the rows one by one (streams the result in constant memory)
+    #
+    # @param {int} batch_size -- Optional rows per fetchmany
+    # @param {str} mode       -- Optional row mode -- dict (default), tuple, row (a namedtuple class with __slots__)
+    #
+    # @yield {dict|tuple}
+    ##
+    def iter(self, batch_size:int=1000, mode:str='dict'):
+        for rows in self.chunks(batch_size, mode):
+            yield from rows
 
-                    # MySQL
-                    elif self.db_system == 'MySQL':
-                        where_sql.append(f'`{key}`<>{self.sp_char}')
 
-                    data_bind.append(value)
+    ##
+    # @desc Opens a separate cursor for the query and executes it
+    #
+    # @param {str}  mode   -- Required row mode (dict, tuple, row)
+    # @param {int}  n      -- Optional rows per fetchmany (Postgres named cursors)
+    # @param {bool} stream -- Optional stream the rows (MySQL: unbuffered, Postgres: named cursor)
+    #
+    # @return {object|None}
+    ##
+    def _cursor(self, mode:str, n:int=1000, stream:bool=False):
+        # The connection of the cursor (a read replica or the primary)
+        conn = self.conn = Database._read_conn(self.parent)
 
-                # Greater than
-                elif re.search('--greater-than$', key) or re.search('--gt$', key):
-                    key = key.replace('--greater-than', '')
-                    key = key.replace('--gt', '')
+        try:
+            # SQLite
+            if self.db_system == 'SQLite':
+                cur = conn.cursor()
 
-                    # SQLite and Postgres
-                    if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                        where_sql.append(f'"{key}">{self.sp_char}')
+                # Plain tuples (no dict_factory)
+                if mode != 'dict':
+                    cur.row_factory = None
 
-                    # MySQL
-                    elif self.db_system == 'MySQL':
-                        where_sql.append(f'`{key}`>{self.sp_char}')
-                    
-                    data_bind.append(value)
+            # MySQL
+            elif self.db_system == 'MySQL':
+                cur = conn.cursor(dictionary=(mode == 'dict'), buffered=not stream)
+
+            # Postgres
+            elif self.db_system == 'Postgres':
+                from .connector import DictRowsCursor
+                options = {'cursor_factory': DictRowsCursor} if mode == 'dict' else {}
 
-                # Greater than or equal to
-                elif re.search('--greater-equal$', key) or re.search('--ge$', key):
-                    key = key.replace('--greater-equal', '')
-                    key = key.replace('--ge', '')
+                # Named (server-side) cursor (held past the commit of an autocommit connection)
+                if stream:
+                    cur = conn.cursor(name=f'aurora_{os.getpid()}_{next(Read.names)}', withhold=bool(conn.autocommit), **options)
+                    cur.itersize = n
+                else:
+                    cur = conn.cursor(**options)
+
+            start = time.perf_counter()
+            cur.execute(self.sql, self.data_bind)
 
-                    # SQLite and Postgres
-                    if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                        where_sql.append(f'"{key}">={self.sp_char}')
+            # Record the query (no EXPLAIN while a streaming cursor is open)
+            Queries.record(self.parent, cur, self.sql, self.data_bind, time.perf_counter() - start, replica=conn != self.parent.conn, explain=not stream)
 
-                    # MySQL
-                    elif self.db_system == 'MySQL':
-                        where_sql.append(f'`{key}`>={self.sp_char}')
+            return cur
+
+        # Catch error
+        except DatabaseError as err:
+            # Developer mode
+            if self.parent.debug:
+                # Raise error
+                raise Exception(err)
 
-                    data_bind.append(value)
+            # Production mode
+            else:
+                print(err)
+                return None
 
-                # Less than
-                elif re.search('--less-than$', key) or re.search('--lt$', key):
-                    key = key.replace('--less-than', '')
-                    key = key.replace('--lt', '')
 
-                    # SQLite and Postgres
-                    if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                        where_sql.append(f'"{key}"<{self.sp_char}')
+    ##
+    # @desc Converts the fetched rows into the row mode
+    #
+    # @param {object} cur  -- Required cursor (for the column description)
+    # @param {list}   rows -- Required fetched rows
+    # @param {str}    mode -- Required row mode (dict, tuple, row)
+    #
+    # @return {list}
+    ##
+    def _convert(self, cur, rows:list, mode:str):
+        # Dicts
+        if mode == 'dict':
+            return rows
 
-                    # MySQL
-                    elif self.db_system == 'MySQL':
-                        where_sql.append(f'`{key}`<{self.sp_char}')
+        # Return result (the column names from the cursor description)
+        return Read._make_rows(tuple([x[0] for x in cur.description]), rows, mode)
 
-                    data_bind.append(value)
 
-                # Less than or equal to
-                elif re.search('--less-equal$', key) or re.search('--le$', key):
-                    key = key.replace('--less-equal', '')
-                    key = key.replace('--le', '')
+    ##
+    # @desc Converts the memoized dict rows into the row mode
+    #
+    # @param {list} rows -- Required dict rows
+    # @param {str}  mode -- Required row mode (dict, tuple, row)
+    #
+    # @return {list}
+    ##
+    @staticmethod
+    def _from_dicts(rows:list, mode:str):
+        # Dicts or no rows
+        if mode == 'dict' or not rows:
+            return rows
 
-                    # SQLite and Postgres
-                    if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                        where_sql.append(f'"{key}"<={self.sp_char}')
+        # Return result (the column names from the dict keys)
+        return Read._make_rows(tuple(rows[0]), [row.values() for row in rows], mode)
 
-                    # MySQL
-                    elif self.db_system == 'MySQL':
-                        where_sql.append(f'`{key}`<={self.sp_char}')
-                        
-                    data_bind.append(value)
 
-                # LIKE
-                elif re.search('--like$', key) or re.search('--l$', key):
-                    key = key.replace('--like', '')
-                    key = key.replace('--l', '')
+    ##
+    # @desc Makes the tuple or compact rows (the cursor rows and the memoized dict rows share it)
+    #
+    # @param {tuple} names  -- Required column names
+    # @param {list}  values -- Required row values (in the column order)
+    # @param {str}   mode   -- Required row mode (tuple, row)
+    #
+    # @return {list}
+    ##
+    @staticmethod
+    def _make_rows(names:tuple, values:list, mode:str):
+        # Tuples
+        if mode == 'tuple':
+            return [tuple(row) for row in values]
 
-                    # SQLite and Postgres
-                    if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                        where_sql.append(f'"{key}" LIKE {self.sp_char}')
+        # Row class
+        Row = Read._row_class(names)
+        return [Row._make(row) for row in values]
 
-                    # MySQL
-                    elif self.db_system == 'MySQL':
-                        where_sql.append(f'`{key}` LIKE {self.sp_char}')
 
-                    data_bind.append(value)
-                    
-                # NOT LIKE
-                elif re.search('--not-like$', key) or re.search('--nl$', key):
-                    key = key.replace('--not-like', '')
-                    key = key.replace('--nl', '')
+    ##
+    # @desc Checks the row mode
+    #
+    # @param {str} mode -- Required row mode (dict, tuple, row)
+    #
+    # @return {bool}
+    ##
+    def _check_mode(self, mode:str):
+        # Valid row mode
+        if mode in ('dict', 'tuple', 'row'):
+            return True
 
-                    # SQLite and Postgres
-                    if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                        where_sql.append(f'"{key}" NOT LIKE {self.sp_char}')
+        err = f'Invalid row mode "{mode}"! (dict, tuple, row)'
 
-                    # MySQL
-                    elif self.db_system == 'MySQL':
-                        where_sql.append(f'`{key}`  NOT LIKE {self.sp_char}')
+        # Developer mode
+        if self.parent.debug:
+            # Raise error
+            raise Exception(err)
 
-                    data_bind.append(value)
-                
-                # BETWEEN
-                elif re.search('--between$', key) or re.search('--b$', key):
-                    key = key.replace('--between', '')
-                    key = key.replace('--b', '')
+        # Production mode
+        else:
+            print(err)
+            return False
 
-                    # SQLite and Postgres
-                    if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                        where_sql.append(f'"{key}" BETWEEN {self.sp_char} AND {self.sp_char}')
 
-                    # MySQL
-                    elif self.db_system == 'MySQL':
-                        where_sql.append(f'`{key}` BETWEEN {self.sp_char} AND {self.sp_char}')
+    ##
+    # @desc Generates (once per columns) a compact row class -- a namedtuple (__slots__ = ()) with attribute and index access
+    #
+    # @param {tuple} names -- Required column names
+    #
+    # @return {class}
+    ##
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _row_class(names:tuple):
+        return collections.namedtuple('Row', names, rename=True)
 
-                    data_bind.append(value[0])
-                    data_bind.append(value[1])
-                
-                # NOT BETWEEN
-                elif re.search('--not-between$', key) or re.search('--nb$', key):
-                    key = key.replace('--not-between', '')
-                    key = key.replace('--nb', '')
-
-                    # SQLite and Postgres
-                    if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                        where_sql.append(f'"{key}" NOT BETWEEN {self.sp_char} AND {self.sp_char}')
-
-                    # MySQL
-                    elif self.db_system == 'MySQL':
-                        where_sql.append(f'`{key}` NOT BETWEEN {self.sp_char} AND {self.sp_char}')
-                        
-                    data_bind.append(value[0])
-                    data_bind.append(value[1])
-                
-                # IN
-                elif re.search('--in$', key) or re.search('--i$', key):
-                    key = key.replace('--in', '')
-                    key = key.replace('--i', '')
-                    for x in value:
-                        in_bind.append(self.sp_char)
-                        data_bind.append(x)
-
-                    in_sql =','.join(in_bind)
-
-                    # SQLite and Postgres
-                    if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                        where_sql.append(f'"{key}" IN ({in_sql})')
-
-                    # MySQL
-                    elif self.db_system == 'MySQL':
-                        where_sql.append(f'`{key}` IN ({in_sql})')
-
-                # NOT IN
-                elif re.search('--not-in$', key) or re.search('--ni$', key):
-                    key = key.replace('--not-in', '')
-                    key = key.replace('--ni', '')
-                    for x in value:
-                        in_bind.append(self.sp_char)
-                        data_bind.append(x)
-
-                    in_sql =','.join(in_bind)
-
-                    # SQLite and Postgres
-                    if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                        where_sql.append(f'"{key}" NOT IN ({in_sql})')
-
-                    # MySQL
-                    elif self.db_system == 'MySQL':
-                        where_sql.append(f'`{key}` NOT IN ({in_sql})')
-
-                # Equal to (default)
-                else:
-                    # SQLite and Postgres
-                    if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                        where_sql.append(f'"{key}"={self.sp_char}')
 
-                    # MySQL
-                    elif self.db_system == 'MySQL':
-                        where_sql.append(f'`{key}`={self.sp_char}')
+    ##
+    # @desc Closes a streaming cursor
+    #
+    # @param {object} cur -- Required cursor
+    ##
+    def _close(self, cur):
+        # MySQL (drop the unread rows)
+        if self.db_system == 'MySQL':
+            self.conn.consume_results()
 
-                    data_bind.append(value)
+        cur.close()
 
-            # Prepare the where SQL
-            where = ' WHERE '
 
-            i = 0
-            for x in where_sql:
-                ch = ''
+    ##
+    # @desc Fetches the rows as columns (filled from the cursor in batches, no per-row dicts)
+    #
+    # @param {int} batch_size -- Optional rows per fetchmany
+    #
+    # @var {list} names -- The column names
+    # @var {list} cols  -- The column values
+    #
+    # @return {dict} -- {column: [values]}
+    ##
+    def columns(self, batch_size:int=1000):
+        # Memoized rows (or the rows fetched in the reversed order, or cached results)
+        if self.rows != None or (self.keyset and self.keyset['before']) or self.cache:
+            rows = self.fetch()
+            names = list(rows[0]) if rows else []
 
-                if re.search('^or--', clean_key(x)) or re.search('^o--', clean_key(x)):
-                    x = x.replace('or--', '')
-                    x = x.replace('o--', '')
-                    if i > 0:
-                        ch = 'OR '
+            return {name: [row[name] for row in rows] for name in names}
 
-                    where_sql[i] = f'{ch + x}'
-                
-                elif re.search('^and--', clean_key(x)) or re.search('^a--', clean_key(x)):
-                    x = x.replace('and--', '')
-                    x = x.replace('a--', '')
-                    if i > 0:
-                        ch = 'AND '
+        # Open the streaming cursor
+        cur = self._cursor('tuple', batch_size, stream=True)
 
-                    where_sql[i] = f'{ch + x}'
-                
-                else:
-                    if i > 0:
-                        ch = 'AND '
+        if not cur:
+            return False
 
-                    where_sql[i] = f'{ch + x}'
+        # Fill the columns
+        try:
+            cols = None
 
-                i += 1
+            while True:
+                rows = cur.fetchmany(batch_size)
 
-            where += ' '.join(where_sql)
+                # The column description (Postgres named cursors describe after the first fetch)
+                if cols == None:
+                    names = [x[0] for x in cur.description] if cur.description else []
+                    cols = [[] for name in names]
 
-        else:
-            where = ''
+                if not rows:
+                    break
 
-        # Prepare the sql statement
-        # SQLite
-        if self.db_system == 'SQLite':
-            sql = f'''UPDATE "{table}" SET {data + where};'''
-            
-        # MySQL
-        elif self.db_system == 'MySQL':
-            sql = f'''UPDATE `{table}` SET {data + where};'''
-            
-        # Postgres
-        elif self.db_system == 'Postgres':
-            sql = f'''UPDATE "{table}" SET {data + where};'''
+                for col, values in zip(cols, zip(*rows)):
+                    col.extend(values)
 
-        # Update was successfull
-        if self.query(sql, data_bind):
-            # Return result
-            return True
+        finally:
+            self._close(cur)
 
-        # Update failed
-        else:
-            # Return result
-            return False
+        # Return result
+        return dict(zip(names, cols))
 
 
     ##
-    # CAUTION! Use this methods only in development.
+    # @desc Fetches the rows as typed NumPy arrays (requires numpy)
     #
-    # @desc Updates a column
+    # @param {bool} structured -- Optional return one structured array instead of a dict of arrays
+    # @param {int}  batch_size -- Optional rows per fetchmany
     #
-    # @param {str} table       -- Required table name
-    # @param {str} old_col     -- Required old column name
-    # @param {str} new_col     -- Required new column name
-    # @param {str} datatype    -- Required new column data
-    # @param {str} constraints -- Optional new column constraints
-    # 
-    # @var {str}  sql             -- The sql statement
-    # @var {str}  table_existance -- SQL statement for sqlite_master
-    # @var {bool} recursion       -- For recursion the method
+    # @var {dict} arrays -- The column arrays (NULL columns fall back to the object dtype)
     #
-    # @return {bool}
+    # @return {dict|object} -- {column: ndarray} | structured ndarray
     ##
-    def _update_column(self, table:str, old_col:str, new_col:str, datatype:str, constraints:str=None):
+    def to_numpy(self, structured:bool=False, batch_size:int=1000):
+        # Import numpy
+        try:
+            import numpy
 
-        # Check development
-        if not self.development:
-            return True
+        # Catch error
+        except ImportError:
+            err = 'NumPy is not installed! Install it with: pip install numpy'
 
-        # Check the development
-        if not self.development:
-            alert = '''----------------------------------------------------------\n'''
-            alert += '''INFO!\n'''
-            alert += '''This method is only available in development!\n'''
-            alert += '''----------------------------------------------------------'''
+            # Developer mode
+            if self.parent.debug:
+                # Raise error
+                raise Exception(err)
 
-            # Alert the user
-            print(alert)
+            # Production mode
+            else:
+                print(err)
+                return False
 
-            # Exit the program
-            exit()
+        # Fetch the columns
+        cols = self.columns(batch_size)
+
+        if cols == False:
+            return False
+
+        arrays = {name: numpy.array(values) for name, values in cols.items()}
+
+        # Dict of arrays
+        if not structured:
+            return arrays
+
+        # Structured array
+        length = len(next(iter(arrays.values()))) if arrays else 0
+        result = numpy.empty(length, dtype=[(name, array.dtype) for name, array in arrays.items()])
+
+        for name, array in arrays.items():
+            result[name] = array
+
+        return result
+
+
+    ##
+    # @desc Produces the keyset pagination token of the next page (or the previous page)
+    #       ex. Model().read(order_by={"id": "DESC"}, limit=10, after=token)
+    #
+    # @param {bool} before -- Optional the token of the previous page (for the before parameter)
+    #
+    # @var {dict} row -- The last row (or the first row) of the page
+    #
+    # @return {str|None} -- None if there is no page
+    ##
+    def token(self, before:bool=False):
+        # Check the keyset pagination
+        if not self.keyset:
+            err = 'Keyset pagination needs after (after="" for the first page) or an order_by with the unique key!'
 
-        # Check required params
-        if not table  or not old_col or not new_col or not datatype:
             # Developer mode
-            if self.debug:
+            if self.parent.debug:
                 # Raise error
-                raise Exception("You must provide the required parameters: ['table', 'old_col', 'new_col', 'datatype']")
+                raise Exception(err)
 
             # Production mode
             else:
-                print("You must provide the required parameters: ['table', 'old_col', 'new_col', 'datatype']")
+                print(err)
                 return False
 
-        # Check the FOREIGN KEY
-        if self._exist_fk(table=table, column=old_col):
+        rows = self.fetch()
+
+        # No rows
+        if not rows:
+            return None
+
+        # The last page (in the same direction)
+        if self.keyset['limit'] and len(rows) < int(self.keyset['limit']) and before == self.keyset['before']:
+            return None
+
+        row = rows[0] if before else rows[-1]
+
+        # Check the keyset columns (the order_by columns and the primary key must be selected)
+        missing = [key for key in self.keyset['keys'] if not key.split('.')[-1] in row]
+
+        if missing:
+            err = f'Keyset pagination needs the order_by and primary key columns in cols! Missing: {missing}'
+
             # Developer mode
-            if self.debug:
+            if self.parent.debug:
                 # Raise error
-                raise Exception('You cannot change a foreign key with "_update_column" method!')
+                raise Exception(err)
 
             # Production mode
             else:
-                print('You cannot change a foreign key with "_update_column" method!')
+                print(err)
                 return False
 
-        # Check the column names
-        if old_col == new_col:
-            recursion = True
-            new_col += '__temp'
-        else:
-            recursion = False
+        # Return the result
+        return Read.encode([row[key.split('.')[-1]] for key in self.keyset['keys']])
 
-        # Fetch the old column data
-        old_data = self.read(table=table, cols=[old_col]).all()
 
-        # Table exists
-        if self._exist_table(table):
-            # Add the new column
-            self._create_column(table=table, column=new_col, datatype=datatype, constraints=constraints)
+    ##
+    # @desc Encodes the keyset pagination values into an opaque token
+    #
+    # @param {list} values -- Required token values
+    #
+    # @return {str}
+    ##
+    @staticmethod
+    def encode(values:list):
+        return base64.urlsafe_b64encode(json.dumps(values, default=str).encode()).decode()
 
-            # Update new column data
-            for x in old_data:
-                self.update(table=table, data={new_col:x[old_col]}, where={old_col:x[old_col]})
 
-            # Commit the changes so far
-            self.conn.commit()
+    ##
+    # @desc Decodes an opaque keyset pagination token
+    #
+    # @param {str} token -- Required token
+    #
+    # @return {list|None} -- None if the token is invalid
+    ##
+    @staticmethod
+    def decode(token:str):
+        try:
+            values = json.loads(base64.urlsafe_b64decode(token.encode()))
 
-            # Drop the old column
-            self._delete_column(table=table, column=old_col, confirm=True)
+        except (ValueError, TypeError, AttributeError):
+            return None
 
-            # Check the column names
-            if recursion:
-                # Recursion
-                return self._update_column(table, old_col=new_col, new_col=old_col, datatype=datatype, constraints=constraints)
+        # Return the result
+        return values if isinstance(values, list) else None
 
-            # Return the result
-            return True
 
-        # Table not exists
+    ##
+    # @desc Fetches the minimum of the given column(s) (must be of type int or float)
+    #
+    # @param {int} option -- Optional -- 0(@return int|float) 1(@return dict)
+    #
+    # @return {dict|int|float}
+    ##
+    def min(self, option=0):
+        # Prepare the sql query
+        temp_sql = f'''min({self.col}) as {self.col}'''
+        for col in self.cols[1:]: temp_sql += f''', min({col}) as {col}'''
+        sql = re.sub(self.regex, f'''SELECT {temp_sql} FROM''', self.sql)
+
+        # Return the matches as a dictionary
+        if option == 1:
+            return self.query(sql, self.data_bind).fetchone()
+
+        # Return the first match result as the number (default)
         else:
-            # Developer mode
-            if self.debug:
-                # Raise error
-                raise Exception(f'Table "{table}" doesn\'t exist')
+            # Produce final column
+            col = delete_chars(self.col, "'")
+            col = delete_chars(col, "`")
+            col = delete_chars(col, '"')
 
-            # Production mode
-            else:
-                print(f'Table "{table}" doesn\'t exist')
-                return False
+            return self.query(sql, self.data_bind).fetchone()[col]
+
+
+    ##
+    # @desc Fetches the maximum of the given column(s) (must be of type int or float)
+    #
+    # @param {int} option -- Optional -- 0(@return int|float) 1(@return dict)
+    #
+    # @return {dict|int|float}
+    ##
+    def max(self, option=0):
+        # Prepare the sql query
+        temp_sql = f'''max({self.col}) as {self.col}'''
+        for col in self.cols[1:]: temp_sql += f''', max({col}) as {col}'''
+        sql = re.sub(self.regex, f'''SELECT {temp_sql} FROM''', self.sql)
+
+        # Return the matches as a dictionary
+        if option == 1:
+            return self.query(sql, self.data_bind).fetchone()
+
+        # Return the first match result as the number (default)
+        else:
+            # Produce final column
+            col = delete_chars(self.col, "'")
+            col = delete_chars(col, "`")
+            col = delete_chars(col, '"')
+
+            return self.query(sql, self.data_bind).fetchone()[col]
 
 
     ##
-    # CAUTION! Use this methods only in development.
-    #
-    # @desc Renames a table if exists
-    #
-    # @param {str} old_table -- Required table old name
-    # @param {str} new_table -- Required table new name
+    # @desc Fetches the average of the given column(s) (must be of type int or float)
     #
-    # @var {str} sql             -- The sql statement
-    # @var {str} table_existance -- SQL statement for sqlite_master
+    # @param {int} option -- Optional -- 0(@return float) 1(@return dict)
     #
-    # @return {bool}
+    # @return {dict|float}
     ##
-    def _update_table(self, old_table:str, new_table:str):
-
-        # Check development
-        if not self.development:
-            return True
-
-        # Check the development
-        if not self.development:
-            alert = '''----------------------------------------------------------\n'''
-            alert += '''INFO!\n'''
-            alert += '''This method is only available in development!\n'''
-            alert += '''----------------------------------------------------------'''
-
-            # Alert the user
-            print(alert)
-
-            # Exit the program
-            exit()
+    def avg(self, option=0):
+        # Prepare the sql query
+        temp_sql = f'''avg({self.col}) as {self.col}'''
+        for col in self.cols[1:]: temp_sql += f''', avg({col}) as {col}'''
+        sql = re.sub(self.regex, f'''SELECT {temp_sql} FROM''', self.sql)
 
-        # Check required params
-        if not old_table or not new_table:
-            # Developer mode
-            if self.debug:
-                # Raise error
-                raise Exception("You must provide the required parameters: ['old_table', 'new_table']")
+        # Return the first match as a dictionary
+        if option == 1:
+            return self.query(sql, self.data_bind).fetchone()
 
-            # Production mode
-            else:
-                print("You must provide the required parameters: ['old_table', 'new_table']")
-                return False
+        # Return the first match result as the number (default)
+        else:
+            # Produce final column
+            col = delete_chars(self.col, "'")
+            col = delete_chars(col, "`")
+            col = delete_chars(col, '"')
 
-        # Table exists
-        if self._exist_table(old_table):
-            # Prepare sql statements
-            # SQLite
-            if self.db_system == 'SQLite':
-                sql = f'''
-                    ALTER TABLE '{old_table}'
-                    RENAME TO '{new_table}';
-                '''
+            return self.query(sql, self.data_bind).fetchone()[col]
 
-            # MySQL
-            elif self.db_system == 'MySQL':
-                sql = f'''
-                    ALTER TABLE `{old_table}`
-                    RENAME TO `{new_table}`;
-                '''
-                
-            # Postgres
-            elif self.db_system == 'Postgres':
-                sql = f'''
-                    ALTER TABLE "{old_table}"
-                    RENAME TO "{new_table}";
-                '''
 
-            # Alter the table
-            self.query(sql)
+    ##
+    # @desc Fetches the summary of the given column(s) (must be of type int or float)
+    #
+    # @param {int} option -- Optional -- 0(@return int|float) 1(@return dict)
+    #
+    # @return {dict|int|float}
+    ##
+    def sum(self, option=0):
+        # Prepare the sql query
+        temp_sql = f'''sum({self.col}) as {self.col}'''
+        for col in self.cols[1:]: temp_sql += f''', sum({col}) as {col}'''
+        sql = re.sub(self.regex, f'''SELECT {temp_sql} FROM''', self.sql)
 
-            # Return the result
-            return True
+        # Return the first match as a dictionary
+        if option == 1:
+            return self.query(sql, self.data_bind).fetchone()
 
-        # Table not exists
+        # Return the first match result as the number (default)
         else:
-            # Developer mode
-            if self.debug:
-                # Raise error
-                raise Exception(f'Table "{old_table}" doesn\'t exist')
+            # Produce final column
+            col = delete_chars(self.col, "'")
+            col = delete_chars(col, "`")
+            col = delete_chars(col, '"')
 
-            # Production mode
-            else:
-                print(f'Table "{old_table}" doesn\'t exist')
-                return False
+            return self.query(sql, self.data_bind).fetchone()[col]
 
 
-    ##################
-    # Delete Methods #
-    ##################
+##############
+# Join Class #
+##############
+##
+# @desc Provides several methods for join methods of the Database class
+##
+class Join(Read):
     ##
-    # *WARNING! If you ignore the 'where' parameter, it will deletes all the records inside your table! (must confirm)
+    # @desc Constructor method
     #
-    # @desc Deletes row(s)
+    # @param {class} parent    -- The Database Class
+    # @param {str}   sql       -- The sql query string
+    # @param {list}  data_bind -- The data to bind
+    # @param {dict}  parts     -- Optional sql statement parts (select, from, order_by, reverse, group_by, limit, offset)
+    # @param {dict}  keyset    -- Optional keyset pagination info (keys, limit, before)
+    # @param {dict}  cache     -- Optional result cache info (ttl, tables)
     #
-    # @param {str}  table   -- Required Table name (ex. "users")
-    # @param {dict} where   -- Optional (*WARNING!) WHERE statement (ex. {"id": "2", "username": "admin"})
-    # @param {bool} confirm -- Optional|Required confirm (if not where it will be Required)
+    # @property {str}    sql       -- the sql query string
+    # @property {object} data_bind -- the data to bind
+    # @property {class}  parent    -- the Database Class (for the streaming cursors)
+    # @property {method} query     -- the read query method of the Database class (a read replica or the primary)
+    # @property {list}   rows      -- the memoized rows (fetched once)
+    # @property {dict}   parts     -- the sql statement parts
+    # @property {list}   bind      -- the data to bind without the LIMIT and OFFSET values
+    # @property {dict}   keyset    -- the keyset pagination info
+    # @property {dict}   cache     -- the result cache info
+    # @property {object} conn      -- the connection of the last opened cursor (a read replica or the primary)
+    # @property {method} prefetch  -- the related rows loader (ex. Model.read(prefetch=[...])), called with the fetched dict rows
+    ##
+    def __init__(self, parent, sql, data_bind, parts=None, keyset=None, cache=None):
+        # Class properties
+        self.sql = sql
+        self.data_bind = data_bind
+        self.parent = parent
+        self.query = functools.partial(Database._read_query, parent)
+        self.db_system = parent.db_system
+        self.sp_char = parent.sp_char
+        self.rows = None
+        self.parts = parts
+        self.bind = Read._bind(data_bind, parts)
+        self.keyset = keyset
+        self.cache = cache
+        self.conn = None
+        self.prefetch = None
+
+
+    ##
+    # @desc Reports an unsupported Read method (the aggregates of the joined columns need aliases, use Database.query)
     #
-    # @var {str}  sql       -- The sql statement
-    # @var {list} data_bind -- Data binding against SQL Injection
-    # @var {list} where_sql -- A placeholder for the WHERE clause
-    # @var {list} in_bind   -- A placeholder IN operator
-    # @var {str}  in_sql    -- The sql statement for IN operator
+    # @param {str} name -- Required method name
     #
     # @return {bool}
     ##
-    def delete(self, table:str, where:dict={}, confirm:bool=False):
-        
-        # Check the confirm if the where clase not set
-        if not where and not confirm:
-            # Developer mode
-            if self.debug:
-                # Raise error
-                raise Exception('For delete without the where clause you must confirm the command.')
-
-            # Production mode
-            else:
-                print('For delete without the where clause you must confirm the command.')
-                return False
-
-        # The default variables
-        data_bind = []
-        where_sql = []
-
-        # Check required params
-        if not table:
-            # Developer mode
-            if self.debug:
-                # Raise error
-                raise Exception("You must provide the required parameters: ['table']")
-
-            # Production mode
-            else:
-                print("You must provide the required parameters: ['table']")
-                return False
-        
-        # Check where
-        if where:
-            for key, value in where.items():
-                in_bind = []
+    def _unsupported(self, name:str):
+        err = f'The {name}() method is not supported on join results! Use Database.query() for aggregates.'
 
-                # Remove the Ineffective characters (#)
-                key = delete_chars(key, '#')
-        
-                # Check patterns
-                # Equal to (strict)
-                if re.search('--equal$', key) or re.search('--e$', key):
-                    key = key.replace('--equal', '')
-                    key = key.replace('--e', '')
+        # Developer mode
+        if self.parent.debug:
+            # Raise error
+            raise Exception(err)
 
-                    # SQLite and Postgres
-                    if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                        where_sql.append(f'"{key}"={self.sp_char}')
+        # Production mode
+        else:
+            print(err)
+            return False
 
-                    # MySQL
-                    elif self.db_system == 'MySQL':
-                        where_sql.append(f'`{key}`={self.sp_char}')
 
-                    data_bind.append(value)
+    ##
+    # @desc Not supported on join results (see Join._unsupported)
+    ##
+    def min(self, option=0):
+        return self._unsupported('min')
 
-                # Not equal to
-                elif re.search('--not-equal$', key) or re.search('--ne$', key):
-                    key = key.replace('--not-equal', '')
-                    key = key.replace('--ne', '')
 
-                    # SQLite and Postgres
-                    if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                        where_sql.append(f'"{key}"<>{self.sp_char}')
+    ##
+    # @desc Not supported on join results (see Join._unsupported)
+    ##
+    def max(self, option=0):
+        return self._unsupported('max')
 
-                    # MySQL
-                    elif self.db_system == 'MySQL':
-                        where_sql.append(f'`{key}`<>{self.sp_char}')
 
-                    data_bind.append(value)
+    ##
+    # @desc Not supported on join results (see Join._unsupported)
+    ##
+    def avg(self, option=0):
+        return self._unsupported('avg')
 
-                # Greater than
-                elif re.search('--greater-than$', key) or re.search('--gt$', key):
-                    key = key.replace('--greater-than', '')
-                    key = key.replace('--gt', '')
 
-                    # SQLite and Postgres
-                    if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                        where_sql.append(f'"{key}">{self.sp_char}')
+    ##
+    # @desc Not supported on join results (see Join._unsupported)
+    ##
+    def sum(self, option=0):
+        return self._unsupported('sum')
 
-                    # MySQL
-                    elif self.db_system == 'MySQL':
-                        where_sql.append(f'`{key}`>{self.sp_char}')
-                    
-                    data_bind.append(value)
 
-                # Greater than or equal to
-                elif re.search('--greater-equal$', key) or re.search('--ge$', key):
-                    key = key.replace('--greater-equal', '')
-                    key = key.replace('--ge', '')
+#######################
+# AsyncDatabase Class #
+#######################
+##
+# @desc Awaitable Database methods (ex. rows = await AsyncDatabase().read('users', where={...}))
+#       Every call runs on a bounded thread pool executor, with its own Database instance and pooled connection.
+#       Successful write calls are committed, failed ones are rolled back.
+##
+class AsyncDatabase:
 
-                    # SQLite and Postgres
-                    if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                        where_sql.append(f'"{key}">={self.sp_char}')
+    # The process-wide executor
+    executor = None
+    lock = threading.Lock()
 
-                    # MySQL
-                    elif self.db_system == 'MySQL':
-                        where_sql.append(f'`{key}`>={self.sp_char}')
 
-                    data_bind.append(value)
+    ##
+    # @desc Constructor method
+    #
+    # @param {class} factory -- Optional Database (or Model) class instantiated in the worker threads
+    #
+    # @property {class} factory -- The Database (or Model) class
+    ##
+    def __init__(self, factory=None):
+        self.factory = factory or Database
 
-                # Less than
-                elif re.search('--less-than$', key) or re.search('--lt$', key):
-                    key = key.replace('--less-than', '')
-                    key = key.replace('--lt', '')
 
-                    # SQLite and Postgres
-                    if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                        where_sql.append(f'"{key}"<{self.sp_char}')
+    ##
+    # @desc Finds (or creates) the bounded thread pool executor
+    #       Size: DB_CONFIG['async_workers'] (defaults to the pool max_size)
+    #
+    # @return {object}
+    ##
+    @classmethod
+    def _executor(cls):
+        if cls.executor:
+            return cls.executor
 
-                    # MySQL
-                    elif self.db_system == 'MySQL':
-                        where_sql.append(f'`{key}`<{self.sp_char}')
+        with cls.lock:
+            if not cls.executor:
+                db_config = getattr(importlib.import_module('config'), "DB_CONFIG")
+                workers = db_config.get('async_workers') or db_config.get('pool', {}).get('max_size', 10)
 
-                    data_bind.append(value)
+                cls.executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix='aurora_async')
 
-                # Less than or equal to
-                elif re.search('--less-equal$', key) or re.search('--le$', key):
-                    key = key.replace('--less-equal', '')
-                    key = key.replace('--le', '')
+            return cls.executor
 
-                    # SQLite and Postgres
-                    if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                        where_sql.append(f'"{key}"<={self.sp_char}')
 
-                    # MySQL
-                    elif self.db_system == 'MySQL':
-                        where_sql.append(f'`{key}`<={self.sp_char}')
-                        
-                    data_bind.append(value)
+    ##
+    # @desc Runs a Database method on the executor
+    #
+    # @param {str}   method   -- Required method name
+    # @param {tuple} args     -- Optional method arguments
+    # @param {dict}  kwargs   -- Optional method keyword arguments
+    # @param {tuple} terminal -- Optional Read method to call on the result (name, args, kwargs)
+    #
+    # @return {any}
+    ##
+    async def _run(self, method:str, args:tuple=(), kwargs:dict={}, terminal:tuple=None):
+        loop = asyncio.get_event_loop()     # The running loop (get_running_loop needs Python 3.7)
 
-                # LIKE
-                elif re.search('--like$', key) or re.search('--l$', key):
-                    key = key.replace('--like', '')
-                    key = key.replace('--l', '')
+        return await loop.run_in_executor(AsyncDatabase._executor(), functools.partial(AsyncDatabase._call, self.factory, method, args, kwargs, terminal))
 
-                    # SQLite and Postgres
-                    if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                        where_sql.append(f'"{key}" LIKE {self.sp_char}')
 
-                    # MySQL
-                    elif self.db_system == 'MySQL':
-                        where_sql.append(f'`{key}` LIKE {self.sp_char}')
+    ##
+    # @desc Calls a Database method in a worker thread (commits on success, rolls back on exceptions)
+    #
+    # @param {class} factory  -- Required Database (or Model) class
+    # @param {str}   method   -- Required method name
+    # @param {tuple} args     -- Required method arguments
+    # @param {dict}  kwargs   -- Required method keyword arguments
+    # @param {tuple} terminal -- Optional Read method to call on the result (name, args, kwargs)
+    #
+    # @return {any}
+    ##
+    @staticmethod
+    def _call(factory, method:str, args:tuple, kwargs:dict, terminal:tuple=None):
+        db = factory()
 
-                    data_bind.append(value)
-                    
-                # NOT LIKE
-                elif re.search('--not-like$', key) or re.search('--nl$', key):
-                    key = key.replace('--not-like', '')
-                    key = key.replace('--nl', '')
+        try:
+            result = getattr(db, method)(*args, **kwargs)
 
-                    # SQLite and Postgres
-                    if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                        where_sql.append(f'"{key}" NOT LIKE {self.sp_char}')
+            # Read (or Join) results
+            if isinstance(result, Read):
+                # The Read method
+                if terminal:
+                    result = getattr(result, terminal[0])(*terminal[1], **terminal[2])
 
-                    # MySQL
-                    elif self.db_system == 'MySQL':
-                        where_sql.append(f'`{key}`  NOT LIKE {self.sp_char}')
+                # All the rows
+                else:
+                    result = result.all()
 
-                    data_bind.append(value)
-                
-                # BETWEEN
-                elif re.search('--between$', key) or re.search('--b$', key):
-                    key = key.replace('--between', '')
-                    key = key.replace('--b', '')
+            Database.save(db)
 
-                    # SQLite and Postgres
-                    if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                        where_sql.append(f'"{key}" BETWEEN {self.sp_char} AND {self.sp_char}')
+            return result
 
-                    # MySQL
-                    elif self.db_system == 'MySQL':
-                        where_sql.append(f'`{key}` BETWEEN {self.sp_char} AND {self.sp_char}')
+        except BaseException:
+            Database.rollback(db)
+            raise
 
-                    data_bind.append(value[0])
-                    data_bind.append(value[1])
-                
-                # NOT BETWEEN
-                elif re.search('--not-between$', key) or re.search('--nb$', key):
-                    key = key.replace('--not-between', '')
-                    key = key.replace('--nb', '')
-
-                    # SQLite and Postgres
-                    if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                        where_sql.append(f'"{key}" NOT BETWEEN {self.sp_char} AND {self.sp_char}')
-
-                    # MySQL
-                    elif self.db_system == 'MySQL':
-                        where_sql.append(f'`{key}` NOT BETWEEN {self.sp_char} AND {self.sp_char}')
-                        
-                    data_bind.append(value[0])
-                    data_bind.append(value[1])
-                
-                # IN
-                elif re.search('--in$', key) or re.search('--i$', key):
-                    key = key.replace('--in', '')
-                    key = key.replace('--i', '')
-                    for x in value:
-                        in_bind.append(self.sp_char)
-                        data_bind.append(x)
-
-                    in_sql =','.join(in_bind)
-
-                    # SQLite and Postgres
-                    if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                        where_sql.append(f'"{key}" IN ({in_sql})')
-
-                    # MySQL
-                    elif self.db_system == 'MySQL':
-                        where_sql.append(f'`{key}` IN ({in_sql})')
-
-                # NOT IN
-                elif re.search('--not-in$', key) or re.search('--ni$', key):
-                    key = key.replace('--not-in', '')
-                    key = key.replace('--ni', '')
-                    for x in value:
-                        in_bind.append(self.sp_char)
-                        data_bind.append(x)
-
-                    in_sql =','.join(in_bind)
-
-                    # SQLite and Postgres
-                    if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                        where_sql.append(f'"{key}" NOT IN ({in_sql})')
-
-                    # MySQL
-                    elif self.db_system == 'MySQL':
-                        where_sql.append(f'`{key}` NOT IN ({in_sql})')
-
-                # Equal to (default)
-                else:
-                    # SQLite and Postgres
-                    if self.db_system == 'SQLite' or self.db_system == 'Postgres':
-                        where_sql.append(f'"{key}"={self.sp_char}')
+        # Return the connection to the pool
+        finally:
+            Database.close(db)
 
-                    # MySQL
-                    elif self.db_system == 'MySQL':
-                        where_sql.append(f'`{key}`={self.sp_char}')
 
-                    data_bind.append(value)
+    ##
+    # @desc Inserts a row (see Database.create)
+    #
+    # @return {int|bool}
+    ##
+    async def create(self, *args, **kwargs):
+        return await self._run('create', args, kwargs)
 
-            # Prepare the where SQL
-            where = ' WHERE '
 
-            i = 0
-            for x in where_sql:
-                ch = ''
+    ##
+    # @desc Inserts several rows (see Database.create_multi)
+    #
+    # @return {int|list|bool}
+    ##
+    async def create_multi(self, *args, **kwargs):
+        return await self._run('create_multi', args, kwargs)
 
-                if re.search('^or--', clean_key(x)) or re.search('^o--', clean_key(x)):
-                    x = x.replace('or--', '')
-                    x = x.replace('o--', '')
-                    if i > 0:
-                        ch = 'OR '
 
-                    where_sql[i] = f'{ch + x}'
-                
-                elif re.search('^and--', clean_key(x)) or re.search('^a--', clean_key(x)):
-                    x = x.replace('and--', '')
-                    x = x.replace('a--', '')
-                    if i > 0:
-                        ch = 'AND '
+    ##
+    # @desc Inserts or updates a row (see Database.upsert)
+    #
+    # @return {bool}
+    ##
+    async def upsert(self, *args, **kwargs):
+        return await self._run('upsert', args, kwargs)
 
-                    where_sql[i] = f'{ch + x}'
-                
-                else:
-                    if i > 0:
-                        ch = 'AND '
 
-                    where_sql[i] = f'{ch + x}'
+    ##
+    # @desc Inserts or updates several rows (see Database.upsert_multi)
+    #
+    # @return {int|bool}
+    ##
+    async def upsert_multi(self, *args, **kwargs):
+        return await self._run('upsert_multi', args, kwargs)
 
-                i += 1
 
-            where += ' '.join(where_sql)
+    ##
+    # @desc Reads rows (see Database.read)
+    #       ex. rows = await db.read('users') | user = await db.read('users', where={'id': 1}).first()
+    #
+    # @return {object} -- AsyncRead (awaiting it fetches all the rows)
+    ##
+    def read(self, *args, **kwargs):
+        return AsyncRead(self, 'read', args, kwargs)
 
-        else:
-            where = ''
 
-        # Prepare the sql statement
-        # SQLite
-        if self.db_system == 'SQLite':
-            sql = f'''DELETE FROM '{table}'{where};'''
-            
-        # MySQL
-        elif self.db_system == 'MySQL':
-            sql = f'''DELETE FROM `{table}`{where};'''
-            
-        # Postgres
-        elif self.db_system == 'Postgres':
-            sql = f'''DELETE FROM "{table}"{where};'''
+    ##
+    # @desc Joins tables (see Database.join)
+    #
+    # @return {object} -- AsyncRead (awaiting it fetches all the rows)
+    ##
+    def join(self, *args, **kwargs):
+        return AsyncRead(self, 'join', args, kwargs)
 
-        # Deletion was successfull
-        if self.query(sql, data_bind):
-            # Return result
-            return True
 
-        # Deletion failed
-        else:
-            # Return result
-            return False
+    ##
+    # @desc Updates rows (see Database.update)
+    #
+    # @return {bool}
+    ##
+    async def update(self, *args, **kwargs):
+        return await self._run('update', args, kwargs)
 
 
     ##
-    # CAUTION! Use this methods only in development.
-    #
-    # @desc Drops a foreign key from an existing table (MySQL and Postgres)
+    # @desc Updates several rows by their keys (see Database.update_multi)
     #
-    # @param {str} table     -- Required table name
-    # @param {str} table     -- Required column name
-    # @param {str} fk_symbol -- Required foreign key symbol
-    # 
-    # @var {str} sql -- The sql statement
+    # @return {int|bool}
+    ##
+    async def update_multi(self, *args, **kwargs):
+        return await self._run('update_multi', args, kwargs)
+
+
+    ##
+    # @desc Deletes rows (see Database.delete)
     #
     # @return {bool}
     ##
-    def _delete_fk(self, table:str, column:str, fk_symbol:str, confirm:bool=False):
+    async def delete(self, *args, **kwargs):
+        return await self._run('delete', args, kwargs)
 
-        # Check development
-        if not self.development:
-            return True
 
-        # Check the development
-        if not self.development:
-            alert = '''----------------------------------------------------------\n'''
-            alert += '''INFO!\n'''
-            alert += '''This method is only available in development!\n'''
-            alert += '''----------------------------------------------------------'''
+###################
+# AsyncRead Class #
+###################
+##
+# @desc Awaitable Read methods of AsyncDatabase.read and AsyncDatabase.join
+#       Every method runs the query in a worker thread (the rows are not memoized between the calls).
+##
+class AsyncRead:
+    ##
+    # @desc Constructor method
+    #
+    # @param {object} parent -- The AsyncDatabase instance
+    # @param {str}    method -- The Database method (read or join)
+    # @param {tuple}  args   -- The method arguments
+    # @param {dict}   kwargs -- The method keyword arguments
+    ##
+    def __init__(self, parent, method:str, args:tuple, kwargs:dict):
+        self.parent = parent
+        self.method = method
+        self.args = args
+        self.kwargs = kwargs
 
-            # Alert the user
-            print(alert)
 
-            # Exit the program
-            exit()
+    ##
+    # @desc Awaits all the rows (ex. rows = await db.read('users'))
+    ##
+    def __await__(self):
+        return self.all().__await__()
 
-        # Check the database system
-        if not self.db_system == 'Postgres' and not self.db_system == 'MySQL':
-            # Developer mode
-            if self.debug:
-                # Raise error
-                raise Exception('The "delete_fk" method only works with MySQL and Postgres!')
 
-            # Production mode
-            else:
-                print('The "delete_fk" method only works with MySQL and Postgres!')
-                return False
+    ##
+    # @desc Runs a Read method in a worker thread
+    #
+    # @param {str} name -- Required Read method name
+    #
+    # @return {any}
+    ##
+    async def _run(self, name:str, *args, **kwargs):
+        return await self.parent._run(self.method, self.args, self.kwargs, (name, args, kwargs))
 
-        # Check required params
-        if not table or not column or not fk_symbol or not confirm:
-            # Developer mode
-            if self.debug:
-                # Raise error
-                raise Exception("You must provide the required parameters: ['table', 'column', 'fk_symbol', 'confirm']")
 
-            # Production mode
-            else:
-                print("You must provide the required parameters: ['table', 'column', 'fk_symbol', 'confirm']")
-                return False
+    ##
+    # @desc Fetches all the rows (see Read.all)
+    #
+    # @return {list}
+    ##
+    async def all(self, mode:str='dict'):
+        return await self._run('all', mode)
 
-        # Tables not exist
-        if not self._exist_table(table):
-            # Developer mode
-            if self.debug:
-                # Raise error
-                raise Exception(f'Table "{table}" doesn\'t exist!')
 
-            # Production mode
-            else:
-                print(f'Table "{table}" doesn\'t exist!')
-                return False
+    ##
+    # @desc Fetches the first row (see Read.first)
+    #
+    # @return {dict}
+    ##
+    async def first(self):
+        return await self._run('first')
 
-        # Foreign key not exists
-        if not self._exist_fk(table, column):
-            # Developer mode
-            if self.debug:
-                # Raise error
-                raise Exception(f'The foreign key not exists!')
 
-            # Production mode
-            else:
-                print(f'The foreign key not exists!')
-                return False
+    ##
+    # @desc Fetches the last row (see Read.last)
+    #
+    # @return {dict}
+    ##
+    async def last(self):
+        return await self._run('last')
 
-        # Everything is OK
-        # MySQL
-        if self.db_system == 'MySQL':
-            sql = f'''
-                ALTER TABLE `{table}`
-                DROP FOREIGN KEY `{fk_symbol}`;
-            '''
 
-        # Postgres
-        elif self.db_system == 'Postgres':
-            sql = f'''
-                ALTER TABLE "{table}"
-                DROP CONSTRAINT "{fk_symbol}";
-            '''
+    ##
+    # @desc Counts the rows (see Read.count)
+    #
+    # @return {int}
+    ##
+    async def count(self):
+        return await self._run('count')
 
-        # Attempt to drop the foreign key
-        try:
-            # Drop the foreign key
-            self.query(sql)
 
-            # Return the result
-            return True
+    ##
+    # @desc Fetches the rows as columns (see Read.columns)
+    #
+    # @return {dict}
+    ##
+    async def columns(self, batch_size:int=1000):
+        return await self._run('columns', batch_size)
 
-        # Handle errors
-        except NameError as err:
-            # Developer mode
-            if self.debug:
-                # Raise error
-                raise Exception(err)
 
-            # Production mode
-            else:
-                print(err)
-                return False
+    ##
+    # @desc Fetches the rows as NumPy arrays (see Read.to_numpy)
+    #
+    # @return {dict|object}
+    ##
+    async def to_numpy(self, structured:bool=False, batch_size:int=1000):
+        return await self._run('to_numpy', structured, batch_size)
 
 
     ##
-    # DANGER! Be super careful. This method drops your column permanently.
-    #
-    # CAUTION! Use this methods only in development.
+    # @desc Produces the keyset pagination token (see Read.token)
     #
-    # @desc Drops a column from a table
+    # @return {str|None}
+    ##
+    async def token(self, before:bool=False):
+        return await self._run('token', before)
+
+
+    ##
+    # @desc Fetches the minimum (see Read.min)
     #
-    # @param {str}  table   -- Required table name
-    # @param {str}  column  -- Required column name
-    # @param {bool} confirm -- Required confirmation
-    # 
-    # @var {str} sql             -- The sql statement
-    # @var {str} table_existance -- SQL statement for sqlite_master
+    # @return {dict|int|float}
+    ##
+    async def min(self, option=0):
+        return await self._run('min', option)
+
+
+    ##
+    # @desc Fetches the maximum (see Read.max)
     #
-    # @return {bool}
+    # @return {dict|int|float}
     ##
-    def _delete_column(self, table:str, column:str, confirm:bool=False):
+    async def max(self, option=0):
+        return await self._run('max', option)
 
-        # Check development
-        if not self.development:
-            return True
 
-        # Check the development
-        if not self.development:
-            alert = '''----------------------------------------------------------\n'''
-            alert += '''INFO!\n'''
-            alert += '''This method is only available in development!\n'''
-            alert += '''----------------------------------------------------------'''
+    ##
+    # @desc Fetches the average (see Read.avg)
+    #
+    # @return {dict|int|float}
+    ##
+    async def avg(self, option=0):
+        return await self._run('avg', option)
 
-            # Alert the user
-            print(alert)
 
-            # Exit the program
-            exit()
+    ##
+    # @desc Fetches the sum (see Read.sum)
+    #
+    # @return {dict|int|float}
+    ##
+    async def sum(self, option=0):
+        return await self._run('sum', option)
 
-        # Check required params
-        if not table or not column or not confirm:
-            # Developer mode
-            if self.debug:
-                # Raise error
-                raise Exception("You must provide the required parameters: ['table', 'column', 'confirm']")
 
-            # Production mode
-            else:
-                print("You must provide the required parameters: ['table', 'column', 'confirm']")
-                return False
+#################
+# Catalog Class #
+#################
+##
+# @desc Schema catalog cache of a connection pool -- Loaded once, invalidated by the DDL methods
+##
+class Catalog:
 
+    ##
+    # @desc Constructor method
+    #
+    # @property {dict}   schema    -- The loaded schema catalog (None until loaded)
+    # @property {dict}   types     -- The column types per table (Postgres)
+    # @property {object} relations -- The relationship registry of the models (see aurora.Model.Relations)
+    ##
+    def __init__(self):
+        self.schema = None
+        self.types = {}
+        self.relations = None
+        self.lock = threading.Lock()
 
-        # Check the FOREIGN KEY
-        if self._exist_fk(table=table, column=column):
-            # Developer mode
-            if self.debug:
-                # Raise error
-                raise Exception('You cannot drop a foreign key with "_delete_column" method!')
 
-            # Production mode
-            else:
-                print('You cannot drop a foreign key with "_delete_column" method!')
-                return False
+    ##
+    # @desc Finds the schema catalog (loads it on the first call)
+    #
+    # @param {class} db    -- The Database Class to load the catalog with
+    # @param {str}   table -- Optional table -- the catalog is loaded again if the table is missing
+    #
+    # @return {dict}
+    ##
+    def tables(self, db, table:str=None):
+        schema = self.schema
 
-        # Prepare sql statements
-        # SQLite
-        if self.db_system == 'SQLite':
-            sql = f'''
-                ALTER TABLE '{table}'
-                DROP COLUMN '{column}';
-            '''
-            
-        # MySQL
-        elif self.db_system == 'MySQL':
-            sql = f'''
-                ALTER TABLE `{table}`
-                DROP COLUMN `{column}`;
-            '''
-            
-        # Postgres
-        elif self.db_system == 'Postgres':
-            sql = f'''
-                ALTER TABLE "{table}"
-                DROP COLUMN "{column}";
-            '''
+        # Load the schema catalog (or load it again for a missing table)
+        if schema == None or (table and not table in schema):
+            with self.lock:
+                if self.schema == None or (table and not table in self.schema):
+                    self.schema = Database._load_catalog(db)
 
-        # Table exists
-        if self._exist_table(table):
+                schema = self.schema
 
-            # Column exists
-            if self._exist_column(table, column):
-                # Drop the column
-                self.query(sql)
+        return schema
 
-                # Return the result
-                return True
 
-            # Column not exists
-            else:
-                # Developer mode
-                if self.debug:
-                    # Raise error
-                    raise Exception(f'Column "{column}" does\'nt exists!')
+    ##
+    # @desc Clears the schema catalog
+    #
+    # @return None
+    ##
+    def clear(self):
+        with self.lock:
+            self.schema = None
+            self.types = {}
+            self.relations = None
 
-                # Production mode
-                else:
-                    print(f'Column "{column}" does\'nt exists!')
-                    return False
 
-        # Table not exists
-        else:
-            # Developer mode
-            if self.debug:
-                # Raise error
-                raise Exception(f'Table "{table}" doesn\'t exist')
+####################
+# Statements Class #
+####################
+##
+# @desc Compiled statements cache -- Maps the shape of a query (database system, table, columns,
+#       where keys, order_by, group_by, limit/offset presence) to its generated sql statement,
+#       so the repeated queries only rebind their values.
+##
+class Statements:
 
-            # Production mode
-            else:
-                print(f'Table "{table}" doesn\'t exist')
-                return False
+    # The compiled statements (least recently used first)
+    statements = collections.OrderedDict()
+    size = 1024
+    hits = 0
+    misses = 0
+    lock = threading.Lock()
 
 
     ##
-    # DANGER! Be super careful. This method drops your table permanently.
+    # @desc Finds a compiled statement
     #
-    # CAUTION! Use this methods only in development.
+    # @param {tuple} shape -- Required statement shape
     #
-    # @desc Drops a table if exists
+    # @return {tuple|None}
+    ##
+    @classmethod
+    def get(cls, shape:tuple):
+        with cls.lock:
+            statement = cls.statements.get(shape)
+
+            # Cache miss
+            if statement == None:
+                cls.misses += 1
+                return None
+
+            # Cache hit
+            cls.statements.move_to_end(shape)
+            cls.hits += 1
+
+            return statement
+
+
+    ##
+    # @desc Caches a compiled statement (evicts the least recently used one when full)
     #
-    # @param {str}  table   -- Required table name
-    # @param {bool} confirm -- Required confirmation
-    # 
-    # @var {str} sql             -- The sql statement
-    # @var {str} table_existance -- SQL statement for sqlite_master
+    # @param {tuple} shape     -- Required statement shape
+    # @param {tuple} statement -- Required compiled statement
     #
-    # @return {bool}
+    # @return {tuple} -- The compiled statement
     ##
-    def _delete_table(self, table:str, confirm:bool=False):
-
-        # Check development
-        if not self.development:
-            return True
+    @classmethod
+    def set(cls, shape:tuple, statement:tuple):
+        with cls.lock:
+            cls.statements[shape] = statement
 
-        # Check the development
-        if not self.development:
-            alert = '''----------------------------------------------------------\n'''
-            alert += '''INFO!\n'''
-            alert += '''This method is only available in development!\n'''
-            alert += '''----------------------------------------------------------'''
+            if len(cls.statements) > cls.size:
+                cls.statements.popitem(last=False)
 
-            # Alert the user
-            print(alert)
+        return statement
 
-            # Exit the program
-            exit()
 
-        # Check required params
-        if not table or not confirm:
-            # Developer mode
-            if self.debug:
-                # Raise error
-                raise Exception("You must provide the required parameters: ['table', 'confirm']")
+    ##
+    # @desc Reports the cache counters
+    #
+    # @return {dict}
+    ##
+    @classmethod
+    def info(cls):
+        return {
+            'hits': cls.hits,
+            'misses': cls.misses,
+            'size': len(cls.statements),
+        }
 
-            # Production mode
-            else:
-                print("You must provide the required parameters: ['table', 'confirm']")
-                return False
 
-        # Prepare sql statements
-        # SQLite
-        if self.db_system == 'SQLite':
-            sql = f'''DROP TABLE '{table}';'''
-            
-        # MySQL
-        elif self.db_system == 'MySQL':
-            sql = f'''DROP TABLE `{table}`;'''
-            
-        # Postgres
-        elif self.db_system == 'Postgres':
-            sql = f'''DROP TABLE "{table}";'''
+    ##
+    # @desc Clears the cache and its counters
+    #
+    # @return None
+    ##
+    @classmethod
+    def clear(cls):
+        with cls.lock:
+            cls.statements.clear()
+            cls.hits = 0
+            cls.misses = 0
 
-        # Table exists
-        if self._exist_table(table):
-            # Drop the table
-            self.query(sql)
 
-            # Return the result
-            return True
-            
-        else:
-            # Developer mode
-            if self.debug:
-                # Raise error
-                raise Exception(f'Table "{table}" doesn\'t exist')
+#################
+# Results Class #
+#################
+##
+# @desc Query result cache (opt-in, ex. Model().read(cache=60)) -- An LRU cache with a time to live per entry,
+#       invalidated by the writes (create, update, delete, upsert) to the same table.
+##
+class Results:
 
-            # Production mode
-            else:
-                print(f'Table "{table}" doesn\'t exist')
-                return False
+    # The cached results -- {key: (expires, rows, tables)} (least recently used first)
+    results = collections.OrderedDict()
+    tables = {}
+    size = 1024
+    hits = 0
+    misses = 0
+    evictions = 0
+    lock = threading.Lock()
 
 
     ##
-    # DANGER! Be super careful. This method drops your database permanently.
-    #
-    # CAUTION! Use this methods only in development.
-    #
-    # @desc Drops a database (Removes a database file for SQLite)
+    # @desc Produces the cache key of a query
     #
-    # @param {str}  database -- Required database name (file -- SQLite)
-    # @param {bool} confirm  -- Required confirmation
-    # 
-    # @var {str}    sql  -- The sql statement
-    # @var {object} conn -- The custom database connection form Postgres and MySQL
-    # @var {object} cur  -- The custom connection cursor form Postgres and MySQL
+    # @param {class} db        -- The Database Class
+    # @param {str}   sql       -- The sql query string
+    # @param {list}  data_bind -- The data to bind
     #
-    # @return {bool}
+    # @return {tuple|None} -- None if the data is not hashable
     ##
-    def _delete_database(self, database:str=None, confirm:str=False):
-        
-        # Check development
-        if not self.development:
-            return True
+    @staticmethod
+    def key(db, sql:str, data_bind:list):
+        key = (db.db_system, db.host, db.port, db.database, sql, tuple(data_bind))
 
-        # Check the development
-        if not self.development:
-            alert = '''----------------------------------------------------------\n'''
-            alert += '''INFO!\n'''
-            alert += '''This method is only available in development!\n'''
-            alert += '''----------------------------------------------------------'''
+        try:
+            hash(key)
 
-            # Alert the user
-            print(alert)
+        except TypeError:
+            return None
 
-            # Exit the program
-            exit()
+        return key
 
-        # Check the required params
-        if not database or not confirm:
-            # Developer mode
-            if self.debug:
-                # Raise error
-                raise Exception("You must provide the required parameters: ['database', 'confirm']")
 
-            # Production mode
-            else:
-                print("You must provide the required parameters: ['database', 'confirm']")
-                return False
+    ##
+    # @desc Finds the cached rows of a query (a copy of the rows)
+    #
+    # @param {tuple} key -- Required cache key
+    #
+    # @return {list|None}
+    ##
+    @classmethod
+    def get(cls, key:tuple):
+        with cls.lock:
+            result = cls.results.get(key)
 
-        # Database not exists
-        if not self._exist_database(database=database):
-            # Developer mode
-            if self.debug:
-                # Raise error
-                raise Exception(f'Database "{database}" not exists!')
+            # Cache miss (or expired)
+            if result == None or result[0] < time.monotonic():
+                if result != None:
+                    cls._remove(key)
 
-            # Production mode
-            else:
-                print(f'Database "{database}" not exists!')
-                return False
+                cls.misses += 1
+                return None
 
-        # Database exists
-        else:
-            # Close the database connection
-            self.conn.close()
+            # Cache hit
+            cls.results.move_to_end(key)
+            cls.hits += 1
 
-            # SQLite
-            if self.db_system == 'SQLite':
-                # Attempt the process
-                try:
-                    # Remove the database file
-                    delete_file(self.app_path + self.sep + database)
+            return [dict(row) for row in result[1]]
 
-                    # Return the result
-                    return True
 
-                # Handle the errors
-                except NameError as err:
-                    # Developer mode
-                    if self.debug:
-                        # Raise error
-                        raise Exception(err)
+    ##
+    # @desc Caches the rows of a query (evicts the least recently used ones when full)
+    #
+    # @param {tuple} key    -- Required cache key
+    # @param {list}  rows   -- Required rows
+    # @param {int}   ttl    -- Required time to live (seconds)
+    # @param {list}  tables -- Required tables of the query
+    #
+    # @return None
+    ##
+    @classmethod
+    def set(cls, key:tuple, rows:list, ttl:int, tables:list):
+        with cls.lock:
+            cls._remove(key)
 
-                    # Production mode
-                    else:
-                        print(err)
-                        return False
+            cls.results[key] = (time.monotonic() + ttl, [dict(row) for row in rows], tables)
 
-            # MySQL
-            elif self.db_system == 'MySQL':
-                # Create a database connection
-                conn = DatabaseAPI.connect(
-                    host=self.host,
-                    user=self.user,
-                    password=self.password,
-                )
+            for table in tables:
+                cls.tables.setdefault(table, set()).add(key)
 
-                # Attempt the process
-                try:
-                    # Prepare sql
-                    sql = f'''DROP DATABASE `{database}`;'''
-                    
-                    # Create the connection cursor
-                    cur = conn.cursor()
+            # Evict the least recently used results
+            while len(cls.results) > cls.size:
+                cls._remove(next(iter(cls.results)))
+                cls.evictions += 1
 
-                    # Excecute the sql
-                    cur.execute(sql)
 
-                    # Close the current connection
-                    conn.close()
+    ##
+    # @desc Drops the cached rows of a query
+    #
+    # @param {tuple} key -- Required cache key
+    #
+    # @return None
+    ##
+    @classmethod
+    def discard(cls, key:tuple):
+        with cls.lock:
+            cls._remove(key)
 
-                    # Return the result
-                    return True
 
-                # Handle the errors
-                except NameError as err:
-                    # Developer mode
-                    if self.debug:
-                        # Raise error
-                        raise Exception(err)
+    ##
+    # @desc Drops the cached results of a table
+    #
+    # @param {str} table -- Required table name
+    #
+    # @return None
+    ##
+    @classmethod
+    def invalidate(cls, table:str):
+        # Nothing cached
+        if not table in cls.tables:
+            return
 
-                    # Production mode
-                    else:
-                        print(err)
-                        return False
+        with cls.lock:
+            for key in list(cls.tables.get(table, ())):
+                cls._remove(key)
 
-            # Postgres
-            elif self.db_system == 'Postgres':
-                # Create a database connection
-                conn = DatabaseAPI.connect(
-                    host=self.host,
-                    port=self.port,
-                    user=self.user,
-                    password=self.password,
-                )
 
-                # Attempt the process
-                try:
-                    # Prepare sql
-                    sql = f'''DROP DATABASE "{database}";'''
+    ##
+    # @desc Reports the cache counters
+    #
+    # @return {dict}
+    ##
+    @classmethod
+    def info(cls):
+        return {
+            'hits': cls.hits,
+            'misses': cls.misses,
+            'evictions': cls.evictions,
+            'size': len(cls.results),
+        }
 
-                    # Set the transaction to autocommit
-                    conn.autocommit = True
-                    
-                    # Create the connection cursor
-                    cur = conn.cursor()
 
-                    # Excecute the sql
-                    cur.execute(sql)
+    ##
+    # @desc Clears the cache and its counters
+    #
+    # @return None
+    ##
+    @classmethod
+    def clear(cls):
+        with cls.lock:
+            cls.results.clear()
+            cls.tables.clear()
+            cls.hits = 0
+            cls.misses = 0
+            cls.evictions = 0
 
-                    # Close the current connection
-                    conn.close()
 
-                    # Return the result
-                    return True
+    ##
+    # @desc Removes a cached result and its table references (the lock must be held)
+    #
+    # @param {tuple} key -- Required cache key
+    #
+    # @return None
+    ##
+    @classmethod
+    def _remove(cls, key:tuple):
+        result = cls.results.pop(key, None)
 
-                # Handle the errors
-                except NameError as err:
-                    # Developer mode
-                    if self.debug:
-                        # Raise error
-                        raise Exception(err)
+        if result == None:
+            return
 
-                    # Production mode
-                    else:
-                        print(err)
-                        return False
+        for table in result[2]:
+            keys = cls.tables.get(table)
 
+            if keys != None:
+                keys.discard(key)
 
-##############
-# Read Class #
-##############
+                if not keys:
+                    del cls.tables[table]
+
+
+#################
+# Queries Class #
+#################
 ##
-# @desc Provides several methods for the read method of the Database class
+# @desc Query instrumentation of Database.query -- The wall time, row count and bound parameter count of every statement,
+#       a slow query log with the EXPLAIN output (DB_CONFIG['slow_query'] seconds), and hooks for the metrics sinks.
+#       ex. Queries.hook(lambda event: statsd.timing('db.query', event['time'] * 1000))
 ##
-class Read:
+class Queries:
+
+    # The hooks -- functions called with every query event
+    hooks = []
+    count = 0
+    time = 0.0
+    slow = 0
+    lock = threading.Lock()
+
+
     ##
-    # @desc Constructor method
+    # @desc Adds a hook
     #
-    # @param {class} parent    -- The Database Class
-    # @param {str}   sql       -- The sql query string
-    # @param {list}  data_bind -- The data to bind
+    # @param {function} hook -- Required function called with the event of every query
+    #                           {"sql", "time", "rows", "params", "db_system", "replica", "slow"}
     #
-    # @property {str}    sql       -- the sql query string
-    # @property {object} data_bind -- the data to bind
-    # @property {method} query     -- the query method of the Database class
-    # @property {str}    regex     -- the regular expression for the select statement
-    # @property {str}    col       -- the first column extracted from the match
+    # @return {function} -- The hook (usable as a decorator)
+    ##
+    @classmethod
+    def hook(cls, hook):
+        with cls.lock:
+            if not hook in cls.hooks:
+                cls.hooks = cls.hooks + [hook]
+
+        return hook
+
+
+    ##
+    # @desc Removes a hook
     #
-    # @var {str}  regex -- the regular expression for the select statement
-    # @var {str}  match -- the regular expression match
-    # @var {list} cols  -- the columns list extracted from the match
+    # @param {function} hook -- Required hook
     ##
-    def __init__(self, parent, sql, data_bind):
-        # Regular expression
-        regex = f'''SELECT.*?FROM'''
-        
-        # Find the match
-        match = re.search(regex, sql).group()
+    @classmethod
+    def unhook(cls, hook):
+        with cls.lock:
+            cls.hooks = [x for x in cls.hooks if not x == hook]
 
-        # Extract column from the match
-        cols = re.sub('SELECT ', '', match)
-        cols = re.sub(' FROM', '', cols)
-        cols = cols.split (',')
 
-        # Class properties
-        self.sql = sql
-        self.data_bind = data_bind
-        self.query = parent.query
-        self.db_system = parent.db_system
-        self.regex = regex
-        self.col = cols[0]
-        self.cols = cols
+    ##
+    # @desc Records an executed query
+    #
+    # @param {class}  db        -- Required Database Class
+    # @param {object} cur       -- Required cursor of the query
+    # @param {str}    sql       -- Required sql query string
+    # @param {list}   data_bind -- Required data to bind
+    # @param {float}  seconds   -- Required wall time of the query
+    # @param {bool}   replica   -- Optional the query ran on a read replica
+    # @param {bool}   explain   -- Optional log the EXPLAIN output of a slow query
+    # @param {int}    params    -- Optional bound parameter count (bulk queries, default: the data_bind length)
+    ##
+    @classmethod
+    def record(cls, db, cur, sql:str, data_bind:list, seconds:float, replica:bool=False, explain:bool=True, params:int=None):
+        slow = db.slow_query != None and seconds >= db.slow_query
+
+        # Statistics
+        with cls.lock:
+            cls.count += 1
+            cls.time += seconds
+            cls.slow += slow
+
+        # Nothing else to do
+        if not slow and not cls.hooks:
+            return
+
+        # The query event (the row count is -1 when the driver does not know it before fetching)
+        event = {
+            'sql': sql,
+            'time': seconds,
+            'rows': cur.rowcount,
+            'params': params if params != None else len(data_bind) if data_bind else 0,
+            'db_system': db.db_system,
+            'replica': replica,
+            'slow': slow,
+        }
+
+        # Slow query log
+        if slow:
+            log = f'''Slow query ({seconds * 1000:.1f} ms, {event['params']} params, {event['rows']} rows): {sql}'''
+
+            if explain:
+                log += '\n' + Queries.explain(cur.connection if hasattr(cur, 'connection') else db.conn, db.db_system, sql, data_bind)
+
+            print(log)
+
+        # Hooks (a failing hook never fails the query)
+        for hook in cls.hooks:
+            try:
+                hook(event)
+
+            except Exception as err:
+                print(f'''Query hook error: {err}''')
 
 
     ##
-    # @desc Fetches the first row
+    # @desc Produces the EXPLAIN output of a query
     #
-    # @return {dict}
+    # @param {object} conn      -- Required connection of the query
+    # @param {str}    db_system -- Required database system
+    # @param {str}    sql       -- Required sql query string
+    # @param {list}   data_bind -- Required data to bind
+    #
+    # @return {str}
     ##
-    def first(self):
-        if self.all():
-            return self.all()[0]
-        else:
-            return False
+    @staticmethod
+    def explain(conn, db_system:str, sql:str, data_bind:list):
+        # Only the SELECT, UPDATE and DELETE statements
+        if not re.match(r'^\s*(SELECT|WITH|UPDATE|DELETE)\b', sql, re.IGNORECASE):
+            return 'EXPLAIN: -'
+
+        try:
+            cur = conn.cursor()
+            cur.execute(('EXPLAIN QUERY PLAN ' if db_system == 'SQLite' else 'EXPLAIN ') + sql, data_bind)
+
+            rows = cur.fetchall()
+            cur.close()
+
+            return 'EXPLAIN:\n' + '\n'.join([' | '.join([str(x) for x in (row.values() if isinstance(row, dict) else row)]) for row in rows])
+
+        except Exception as err:
+            return f'''EXPLAIN: {err}'''
 
 
     ##
-    # @desc Fetches the last row
+    # @desc Reports the statistics
     #
     # @return {dict}
     ##
-    def last(self):
-        if self.all()[self.count()-1]:
-            return self.all()[self.count()-1]
-        else:
-            return False
+    @classmethod
+    def info(cls):
+        return {
+            'count': cls.count,
+            'time': cls.time,
+            'slow': cls.slow,
+        }
 
 
     ##
-    # @desc Fetches all the rows
+    # @desc Clears the statistics (the hooks are kept)
     #
-    # @return {list}
+    # @return None
     ##
-    def all(self):
-        # Postgres
-        if self.db_system == 'Postgres':
-            return real_dict(self.query(self.sql, self.data_bind).fetchall())
+    @classmethod
+    def clear(cls):
+        with cls.lock:
+            cls.count = 0
+            cls.time = 0.0
+            cls.slow = 0
+
+
+#####################
+# Transaction Class #
+#####################
+##
+# @desc Transaction context manager -- The outermost transaction of a connection commits (or rolls back)
+#       once, the nested ones are savepoints.
+##
+class Transaction:
 
-        # SQLite or MySQL
-        elif self.db_system == 'SQLite' or self.db_system == 'MySQL':
-            return self.query(self.sql, self.data_bind).fetchall()
+    # The open transactions per connection -- {id(conn): depth}
+    depths = {}
 
 
     ##
-    # @desc Counts the number of rows
+    # @desc Constructor method
     #
-    # @return {int}
+    # @param {class} parent -- The Database Class
+    #
+    # @property {class} parent    -- The Database Class
+    # @property {str}   savepoint -- The savepoint name (nested transactions)
     ##
-    def count(self):
-        return len(self.all())
+    def __init__(self, parent):
+        self.parent = parent
+        self.savepoint = None
 
 
     ##
-    # @desc Fetches the minimum of the given column(s) (must be of type int or float)
-    #
-    # @param {int} option -- Optional -- 0(@return int|float) 1(@return dict)
+    # @desc Starts the transaction (or the savepoint)
     #
-    # @return {dict|int|float}
+    # @return {class} -- The Database Class
     ##
-    def min(self, option=0):
-        # Prepare the sql query
-        temp_sql = f'''min({self.col}) as {self.col}'''
-        for col in self.cols[1:]: temp_sql += f''', min({col}) as {col}'''
-        sql = re.sub(self.regex, f'''SELECT {temp_sql} FROM''', self.sql)
+    def __enter__(self):
+        conn = Database._connect(self.parent)
+        depth = Transaction.depths.get(id(conn), 0)
 
-        # Return the matches as a dictionary
-        if option == 1:
-            # Postgres
-            if self.db_system == 'Postgres':
-                return real_dict(self.query(sql, self.data_bind).fetchall())[0]
+        # Nested transaction
+        if depth:
+            self.savepoint = f'aurora_savepoint_{depth}'
+            self.parent.cur.execute(f'SAVEPOINT {self.savepoint}')
 
-            # SQLite or MySQL
-            elif self.db_system == 'SQLite' or self.db_system == 'MySQL':
-                return self.query(sql, self.data_bind).fetchone()
+        # Autocommit mode or SQLite (open the transaction explicitly, SQLite opens it only before writes)
+        elif self.parent.autocommit or (self.parent.db_system == 'SQLite' and not conn.in_transaction):
+            self.parent.cur.execute('BEGIN')
 
-        # Return the first match result as the number (default)
-        else:
-            # Produce final column
-            col = delete_chars(self.col, "'")
-            col = delete_chars(col, "`")
-            col = delete_chars(col, '"')
+        Transaction.depths[id(conn)] = depth + 1
 
-            return self.query(sql, self.data_bind).fetchone()[col]
+        return self.parent
 
 
     ##
-    # @desc Fetches the maximum of the given column(s) (must be of type int or float)
+    # @desc Ends the transaction -- Commits on success, rolls back on exceptions (the exceptions are re-raised)
     #
-    # @param {int} option -- Optional -- 0(@return int|float) 1(@return dict)
+    # @param {class}  error_type -- The exception type
+    # @param {object} error      -- The exception
+    # @param {object} traceback  -- The traceback
     #
-    # @return {dict|int|float}
+    # @return {bool}
     ##
-    def max(self, option=0):
-        # Prepare the sql query
-        temp_sql = f'''max({self.col}) as {self.col}'''
-        for col in self.cols[1:]: temp_sql += f''', max({col}) as {col}'''
-        sql = re.sub(self.regex, f'''SELECT {temp_sql} FROM''', self.sql)
+    def __exit__(self, error_type, error, traceback):
+        conn = self.parent.conn
+        depth = Transaction.depths.get(id(conn), 1) - 1
 
-        # Return the matches as a dictionary
-        if option == 1:
-            # Postgres
-            if self.db_system == 'Postgres':
-                return real_dict(self.query(sql, self.data_bind).fetchall())[0]
+        # Close the transaction level
+        if depth:
+            Transaction.depths[id(conn)] = depth
+        else:
+            Transaction.depths.pop(id(conn), None)
 
-            # SQLite or MySQL
-            elif self.db_system == 'SQLite' or self.db_system == 'MySQL':
-                return self.query(sql, self.data_bind).fetchone()
+        # Nested transaction
+        if self.savepoint:
+            if error_type:
+                self.parent.cur.execute(f'ROLLBACK TO SAVEPOINT {self.savepoint}')
 
-        # Return the first match result as the number (default)
+            self.parent.cur.execute(f'RELEASE SAVEPOINT {self.savepoint}')
+
+        # Autocommit mode
+        elif self.parent.autocommit:
+            self.parent.cur.execute('ROLLBACK' if error_type else 'COMMIT')
+
+        # Roll back
+        elif error_type:
+            conn.rollback()
+
+        # Commit
         else:
-            # Produce final column
-            col = delete_chars(self.col, "'")
-            col = delete_chars(col, "`")
-            col = delete_chars(col, '"')
+            conn.commit()
 
-            return self.query(sql, self.data_bind).fetchone()[col]
+        # Re-raise the exceptions
+        return False
 
 
+#################
+# Session Class #
+#################
+##
+# @desc Request-scoped database session -- All the Database (and Model) instances created
+#       during a request share one connection, committed or rolled back once on teardown.
+##
+class Session:
     ##
-    # @desc Fetches the average of the given column(s) (must be of type int or float)
+    # @desc Constructor method
     #
-    # @param {int} option -- Optional -- 0(@return float) 1(@return dict)
+    # @param {object} pool -- Required connection pool
     #
-    # @return {dict|float}
+    # @property {object} conn    -- The checked out connection
+    # @property {bool}   written -- The request wrote to the primary (reads go to the primary)
     ##
-    def avg(self, option=0):
-        # Prepare the sql query
-        temp_sql = f'''avg({self.col}) as {self.col}'''
-        for col in self.cols[1:]: temp_sql += f''', avg({col}) as {col}'''
-        sql = re.sub(self.regex, f'''SELECT {temp_sql} FROM''', self.sql)
+    def __init__(self, pool):
+        self.pool = pool
+        self.conn = pool.checkout()
+        self.written = False
 
-        # Return the first match as a dictionary
-        if option == 1:
-            # Postgres
-            if self.db_system == 'Postgres':
-                return real_dict(self.query(sql, self.data_bind).fetchall())[0]
 
-            # SQLite or MySQL
-            elif self.db_system == 'SQLite' or self.db_system == 'MySQL':
-                return self.query(sql, self.data_bind).fetchone()
+    ##
+    # @desc Finds (or creates) the session of the current request
+    #
+    # @param {object} pool -- Required connection pool
+    #
+    # @return {object|None} -- None outside of a Flask app context
+    ##
+    @staticmethod
+    def current(pool):
+        # Outside of a request
+        if not has_app_context():
+            return None
 
-        # Return the first match result as the number (default)
-        else:
-            # Produce final column
-            col = delete_chars(self.col, "'")
-            col = delete_chars(col, "`")
-            col = delete_chars(col, '"')
+        # The request sessions (one per pool)
+        sessions = g.setdefault('_aurora_sessions', {})
 
-            return self.query(sql, self.data_bind).fetchone()[col]
+        # Create the session
+        if not pool in sessions:
+            sessions[pool] = Session(pool)
+
+        # Return the session
+        return sessions[pool]
 
 
     ##
-    # @desc Fetches the summary of the given column(s) (must be of type int or float)
-    #
-    # @param {int} option -- Optional -- 0(@return int|float) 1(@return dict)
+    # @desc Ends the session -- Commits (or rolls back on error) and returns the connection to the pool
     #
-    # @return {dict|int|float}
+    # @param {Exception} error -- Optional request error
     ##
-    def sum(self, option=0):
-        # Prepare the sql query
-        temp_sql = f'''sum({self.col}) as {self.col}'''
-        for col in self.cols[1:]: temp_sql += f''', sum({col}) as {col}'''
-        sql = re.sub(self.regex, f'''SELECT {temp_sql} FROM''', self.sql)
+    def close(self, error=None):
+        # Check the connection
+        if not self.conn:
+            return
 
-        # Return the first match as a dictionary
-        if option == 1:
-            # Postgres
-            if self.db_system == 'Postgres':
-                return real_dict(self.query(sql, self.data_bind).fetchall())[0]
+        try:
+            # Roll back on error
+            if error:
+                self.conn.rollback()
 
-            # SQLite or MySQL
-            elif self.db_system == 'SQLite' or self.db_system == 'MySQL':
-                return self.query(sql, self.data_bind).fetchone()
+            # Commit the request changes
+            else:
+                self.conn.commit()
 
-        # Return the first match result as the number (default)
-        else:
-            # Produce final column
-            col = delete_chars(self.col, "'")
-            col = delete_chars(col, "`")
-            col = delete_chars(col, '"')
+            # Return the connection to the pool
+            self.pool.checkin(self.conn)
 
-            return self.query(sql, self.data_bind).fetchone()[col]
+        except:
+            # Discard the broken connection
+            self.pool.checkin(self.conn, discard=True)
+
+            # Check the request error
+            if not error:
+                raise
+
+        finally:
+            self.conn = None
+
+
+    ##
+    # @desc Ends the sessions of the current request (Flask teardown_appcontext handler)
+    #
+    # @param {Exception} error -- Optional request error
+    ##
+    @staticmethod
+    def teardown(error=None):
+        # The request sessions
+        sessions = g.pop('_aurora_sessions', {})
+
+        # Close the sessions
+        for session in sessions.values():
+            session.close(error)
 
 
 ##############
-# Join Class #
+# Pool Class #
 ##############
 ##
-# @desc Provides several methods for join methods of the Database class
+# @desc Process-wide connection pool for the Database class
+#
+# Optional DB_CONFIG['pool'] settings:
+# DB_CONFIG['pool'] = {
+#   'min_size':  1,      # Idle connections never evicted for idle time (the pool is not pre-filled)
+#   'max_size':  10,     # Maximum open connections
+#   'timeout':   30,     # Seconds to wait for a free connection
+#   'idle_time': 300,    # Seconds an idle connection is kept open
+#   'life_time': 3600,   # Seconds a connection is reused before reconnecting
+# }
 ##
-class Join:
+class Pool:
+
+    # The process-wide pools
+    pools = {}
+    lock = threading.Lock()
+
+
     ##
     # @desc Constructor method
     #
-    # @param {class} parent    -- The Database Class
-    # @param {str}   sql       -- The sql query string
-    # @param {list}  data_bind -- The data to bind
+    # @param {function} connect   -- Required connection factory
+    # @param {int}      min_size  -- Optional idle connections kept by the idle eviction (opened on demand)
+    # @param {int}      max_size  -- Optional maximum open connections
+    # @param {float}    timeout   -- Optional checkout timeout (seconds)
+    # @param {float}    idle_time -- Optional idle eviction time (seconds)
+    # @param {float}    life_time -- Optional maximum lifetime of a connection (seconds)
     #
-    # @property {str}    sql       -- the sql query string
-    # @property {object} data_bind -- the data to bind
-    # @property {method} query     -- the query method of the Database class
-    # @property {str}    regex     -- the regular expression for the select statement
-    # @property {str}    col       -- the first column extracted from the match
+    # @property {deque} idle    -- The idle connections (conn, last used time)
+    # @property {dict}  created -- The creation time and generation of the open connections
+    # @property {int}   size    -- The number of open connections
+    # @property {int}   pid     -- The process id of the pool owner
+    # @property {class} catalog -- The schema catalog of the database
+    # @property {list}  replicas -- The pools of the read replicas
+    # @property {float} written  -- The time of the last write (the read replica window)
+    # @property {object} turn    -- The round-robin counter of the read replicas
+    ##
+    def __init__(self, connect, min_size:int=1, max_size:int=10, timeout:float=30, idle_time:float=300, life_time:float=3600):
+        # Check the pool size
+        if max_size < 1 or min_size < 0 or min_size > max_size:
+            raise Exception('Invalid pool size! (0 <= min_size <= max_size, max_size >= 1)')
+
+        # Public properties
+        self.connect = connect
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.idle_time = idle_time
+        self.life_time = life_time
+        self.idle = collections.deque()
+        self.created = {}
+        self.size = 0
+        self.generation = 0
+        self.pid = os.getpid()
+        self.cond = threading.Condition()
+        self.catalog = Catalog()
+        self.replicas = None
+        self.written = 0
+        self.turn = itertools.count()
+
+
+    ##
+    # @desc Finds or creates the pool of a connection key
     #
-    # @var {int}  regex -- the regular expression for the select statement
-    # @var {int}  match -- the regular expression match
-    # @var {list} cols  -- the columns list extracted from the match
+    # @param {tuple}    key     -- Required pool key
+    # @param {function} connect -- Required connection factory
+    # @param {dict}     options -- Optional pool settings
+    #
+    # @return {object}
     ##
-    def __init__(self, parent, sql, data_bind):
-        # Class properties
-        self.sql = sql
-        self.data_bind = data_bind
-        self.query = parent.query
-        self.db_system = parent.db_system
+    @classmethod
+    def get(cls, key:tuple, connect, **options):
+        pool = cls.pools.get(key)
+
+        # Pool exists (and was not inherited from a parent process)
+        if pool and pool.pid == os.getpid():
+            return pool
+
+        with cls.lock:
+            pool = cls.pools.get(key)
+
+            # Create a new pool
+            if not pool or not pool.pid == os.getpid():
+                pool = cls(connect, **options)
+                cls.pools[key] = pool
+
+            return pool
 
 
     ##
-    # @desc Fetches the first row
+    # @desc Checks out a connection (waits for a free one if the pool is full)
     #
-    # @return {dict}
+    # @param {float} timeout -- Optional checkout timeout (seconds)
+    #
+    # @return {object}
     ##
-    def first(self):
-        if self.all():
-            return self.all()[0]
-        else:
-            return False
+    def checkout(self, timeout:float=None):
+        # Checkout deadline
+        deadline = time.monotonic() + (self.timeout if timeout == None else timeout)
+
+        # The expired connections (closed outside of the lock)
+        expired = []
+
+        try:
+            with self.cond:
+                while True:
+                    # Evict the expired idle connections
+                    expired += self._evict()
+
+                    # Reuse an idle connection (most recently used first)
+                    if self.idle:
+                        conn, used = self.idle.pop()
+
+                        # Connection lifetime expired
+                        if self.life_time and time.monotonic() - self.created[id(conn)][0] > self.life_time:
+                            self._forget(conn)
+                            expired.append(conn)
+                            continue
+
+                        return conn
+
+                    # Open a new connection
+                    if self.size < self.max_size:
+                        self.size += 1
+                        break
+
+                    # Wait for a free connection
+                    remaining = deadline - time.monotonic()
+
+                    if remaining <= 0:
+                        raise Exception(f'Database connection pool exhausted! (max_size={self.max_size}, timeout={self.timeout})')
+
+                    self.cond.wait(remaining)
+
+        finally:
+            for conn in expired:
+                Pool._close(conn)
+
+        # Create the connection outside of the lock
+        try:
+            conn = self.connect()
+
+        except Exception:
+            with self.cond:
+                self.size -= 1
+                self.cond.notify()
+            raise
+
+        with self.cond:
+            self.created[id(conn)] = (time.monotonic(), self.generation)
+
+        return conn
 
 
     ##
-    # @desc Fetches the last row
+    # @desc Returns a connection to the pool
     #
-    # @return {dict}
+    # @param {object} conn    -- Required connection
+    # @param {bool}   discard -- Optional close the connection instead of reusing it
     ##
-    def last(self):
-        if self.all()[self.count()-1]:
-            return self.all()[self.count()-1]
-        else:
-            return False
+    def checkin(self, conn, discard:bool=False):
+        with self.cond:
+            # Unknown connection
+            if not id(conn) in self.created:
+                return
+
+            created, generation = self.created[id(conn)]
+
+        # Check the connection lifetime
+        if self.life_time and time.monotonic() - created > self.life_time:
+            discard = True
+
+        # Reset the connection state (outside of the lock, a round trip on MySQL and Postgres)
+        if not discard:
+            try:
+                conn.rollback()
+
+            except Exception:
+                discard = True
+
+        with self.cond:
+            # Check the connection generation (pool cleared)
+            if not generation == self.generation:
+                discard = True
+
+            # Release the connection
+            if discard:
+                self._forget(conn)
+
+            # Reuse the connection
+            else:
+                self.idle.append((conn, time.monotonic()))
+
+            # Wake up a waiting checkout
+            self.cond.notify()
+
+        # Close the connection (outside of the lock)
+        if discard:
+            Pool._close(conn)
 
 
     ##
-    # @desc Fetches all the rows
+    # @desc Closes the idle connections (checked out connections are closed on checkin)
+    ##
+    def clear(self):
+        self.catalog.clear()
+
+        expired = []
+
+        with self.cond:
+            self.generation += 1
+
+            while self.idle:
+                conn, used = self.idle.pop()
+                self._forget(conn)
+                expired.append(conn)
+
+            self.cond.notify_all()
+
+        # Close the connections (outside of the lock)
+        for conn in expired:
+            Pool._close(conn)
+
+
+    ##
+    # @desc Evicts the idle connections which passed the idle time or lifetime (keeps min_size connections)
+    #       Called with the lock held, the evicted connections are closed by the caller (outside of the lock)
     #
-    # @return {list}
+    # @return {list} -- The evicted connections
     ##
-    def all(self):
-        # Postgres
-        if self.db_system == 'Postgres':
-            return real_dict(self.query(self.sql, self.data_bind).fetchall())
+    def _evict(self):
+        now = time.monotonic()
+        evicted = []
+
+        # Least recently used connections are on the left
+        while self.idle:
+            conn, used = self.idle[0]
+            created = self.created[id(conn)][0]
 
-        # SQLite or MySQL
-        elif self.db_system == 'SQLite' or self.db_system == 'MySQL':
-            return self.query(self.sql, self.data_bind).fetchall()
+            # Connection lifetime expired
+            if self.life_time and now - created > self.life_time:
+                pass
+
+            # Connection idle time expired
+            elif self.idle_time and now - used > self.idle_time and self.size > self.min_size:
+                pass
+
+            # Connection is fine
+            else:
+                break
+
+            self.idle.popleft()
+            self._forget(conn)
+            evicted.append(conn)
+
+        return evicted
 
 
     ##
-    # @desc Counts the number of rows
+    # @desc Removes a connection from the pool (called with the lock held)
     #
-    # @return {int}
+    # @param {object} conn -- Required connection
     ##
-    def count(self):
-        return len(self.all())
+    def _forget(self, conn):
+        self.created.pop(id(conn), None)
+        self.size -= 1
+
+
+    ##
+    # @desc Closes a connection (outside of the lock)
+    #
+    # @param {object} conn -- Required connection
+    ##
+    @staticmethod
+    def _close(conn):
+        try:
+            conn.close()
+
+        except Exception:
+            pass
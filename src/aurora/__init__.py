@@ -6,7 +6,7 @@ try:
     from .Controller import Controller
     from .Template import View
     from .Forms import Forms
-    from .Model import Model
+    from .Model import Model, AsyncModel
 
 # Pass on error
 except:
@@ -59,10 +59,57 @@ elif db_system in ('mysql', 'mariadb'):
 elif db_system in ('postgres', 'postgresql'):
     try:
         import psycopg2 as _pg
+        import psycopg2.extras
         DatabaseAPI   = _pg
         DatabaseError = _pg.Error
         DatabaseDict  = _pg.extras
 
+        ##
+        # @desc Postgres cursor with plain dict rows -- The tuple rows are zipped with the column names
+        #       (faster and smaller than the RealDictCursor rows, which are OrderedDict instances)
+        ##
+        class DictRowsCursor(_pg.extensions.cursor):
+            ##
+            # @desc Converts the tuple rows into dicts
+            #
+            # @param {list} rows -- Required tuple rows
+            #
+            # @return {list}
+            ##
+            def _dicts(self, rows:list):
+                if not rows:
+                    return rows
+
+                names = [x[0] for x in self.description]
+
+                return [dict(zip(names, row)) for row in rows]
+
+            def fetchone(self):
+                row = super().fetchone()
+
+                return None if row is None else dict(zip([x[0] for x in self.description], row))
+
+            def fetchmany(self, size:int=None):
+                return self._dicts(super().fetchmany(self.arraysize if size is None else size))
+
+            def fetchall(self):
+                return self._dicts(super().fetchall())
+
+            def __iter__(self):
+                names = None
+
+                while True:
+                    try:
+                        row = super().__next__()
+
+                    except StopIteration:
+                        return
+
+                    if names is None:
+                        names = [x[0] for x in self.description]
+
+                    yield dict(zip(names, row))
+
     except:
         pass
 
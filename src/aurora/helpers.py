@@ -11,9 +11,102 @@ import importlib
 from zipfile import ZipFile
 from pathlib import Path
 import time
+from types import MappingProxyType
 from datetime import datetime, timedelta
 
 
+############
+# Settings #
+############
+##
+# @desc Precomputed (read-only) settings of the root app -- Built once from the config and _apps modules, so the
+#       controllers, security functions and helpers do not import and scan them on every request
+##
+class Settings:
+
+    # The shared settings instance
+    instance = None
+
+    ##
+    # @desc Constructor method
+    #
+    # @property {bool}  debug        -- The debug mode
+    # @property {str}   default_lang -- The default language
+    # @property {bool}  multi_lang   -- The multi-language mode
+    # @property {tuple} languages    -- The supported languages
+    # @property {str}   statics      -- The statics folder
+    # @property {str}   error_app    -- The error app name
+    # @property {str}   default_app  -- The default app name
+    # @property {tuple} apps         -- The apps -- ((name, url), ...)
+    # @property {dict}  app_urls     -- The apps index -- {name: url}
+    # @property {set}   urls         -- The app urls
+    # @property {dict}  globals      -- The global variables of the views (GLOBALS + Auto Globals, uppercase keys)
+    ##
+    def __init__(self):
+        config = importlib.import_module('config')
+        apps = tuple(tuple(x) for x in getattr(importlib.import_module('_apps'), 'apps'))
+
+        attrs = {
+            'debug': getattr(config, 'DEBUG'),
+            'default_lang': getattr(config, 'DEFAULT_LANG'),
+            'multi_lang': getattr(config, 'MULTI_LANG'),
+            'languages': tuple(getattr(config, 'LANGUAGES')),
+            'statics': getattr(config, 'STATICS'),
+            'error_app': getattr(config, 'ERROR_APP', None),
+            'default_app': getattr(config, 'DEFAULT_APP', None),
+            'apps': apps,
+            'app_urls': MappingProxyType({x[0]: x[1] for x in apps}),
+            'urls': frozenset(x[1] for x in apps),
+        }
+
+        # Auto globals
+        auto_globals = {'statics': '/' + attrs['statics']}
+
+        # Add apps
+        for app in apps:
+            # Error app
+            if app[0] == attrs['error_app']:
+                auto_globals['error_app'] = '/' + app[1]
+
+            # Default app
+            if app[0] == attrs['default_app']:
+                auto_globals['default_app'] = '/' + app[1]
+
+            # All apps
+            auto_globals[app[0]] = '/' + app[1]
+
+        # Add global variables
+        auto_globals.update(getattr(config, 'GLOBALS', {}))
+
+        # Translate auto_globals to uppercase
+        attrs['globals'] = MappingProxyType({k.upper(): v for k, v in auto_globals.items()})
+
+        for key, value in attrs.items():
+            object.__setattr__(self, key, value)
+
+
+    ##
+    # @desc Prevents changing the settings
+    ##
+    def __setattr__(self, key, value):
+        raise AttributeError('The settings are read-only!')
+
+
+    ##
+    # @desc Finds (or builds once) the shared settings
+    #
+    # @param {bool} reload -- Rebuilds the settings from the config and _apps modules
+    #
+    # @return {object}
+    ##
+    @staticmethod
+    def current(reload:bool=False):
+        if reload or not Settings.instance:
+            Settings.instance = Settings()
+
+        return Settings.instance
+
+
 ##########
 # Aurora #
 ##########
@@ -82,32 +175,16 @@ def app(name:str, url:str):
 # 
 # @param {str} app -- The app name
 #
-# @var {list} apps -- The apps list
+# @var {str} url -- The app url (None if the app does not exist)
 # 
 # @return {dict}
 ##
 def app_exists(app:str):
-    # Apps info
-    apps_module = importlib.import_module(f'_apps')
-    apps = getattr(apps_module, 'apps')
-
-    exists = False
-    url = ''
-    while True:
-        i = 0
-        for route in apps:
-            # App exists
-            if app == route[0]:
-                url = route[1]
-                exists = True
-                break
-
-            i += 1
-
-        break
+    # Apps index
+    url = Settings.current().app_urls.get(app)
 
     # App exists
-    if exists:
+    if url is not None:
         return {
             'result': True, 
             'url': f'{url}'
@@ -129,25 +206,8 @@ def app_exists(app:str):
 # @return {bool}
 ##
 def app_url_exists(url:str):
-    # Apps info
-    apps_module = importlib.import_module(f'_apps')
-    apps = getattr(apps_module, 'apps')
-
-    exists = False
-    while True:
-        i = 0
-        for route in apps:
-            # App url exists
-            if url == route[1]:
-                exists = True
-                break
-
-            i += 1
-
-        break
-
     # App url exists
-    if exists:
+    if url in Settings.current().urls:
         return True
 
     # App url not exists
@@ -244,20 +304,17 @@ def controller_url_exists(app:str, url:str=''):
 # @return object
 ##
 def route_url(app:str, controller:str=None):
-    # Apps info
-    apps_module = importlib.import_module(f'_apps')
-    apps = getattr(apps_module, 'apps')
-
     app_url = ''
+    exists = app_exists(app)
 
     # App not exists
-    if not app_exists(app)['result']:
+    if not exists['result']:
         # Raise error
-        raise Exception(app_exists(app)['message'])
+        raise Exception(exists['message'])
 
     # App exists
     else:
-        app_url = app_exists(app)['url']
+        app_url = exists['url']
 
     # Controller inserted
     if controller:
@@ -2,10 +2,9 @@
 # Dependencies #
 ################
 import re
-import importlib
 from datetime import datetime, timedelta
 from typing import Union
-from .helpers import route_url
+from .helpers import route_url, Settings
 from flask import make_response, jsonify, render_template, request as flask_request, abort as flask_abort, redirect as flask_redirect, session as flask_session
 from werkzeug.security import check_password_hash, generate_password_hash
 
@@ -13,17 +12,6 @@ from werkzeug.security import check_password_hash, generate_password_hash
 request = flask_request
 session = flask_session
 
-# Fetch configuretion module
-config = importlib.import_module('config')
-debug = getattr(config, "DEBUG")
-default_lang = getattr(config, "DEFAULT_LANG")
-multi_lang = getattr(config, "MULTI_LANG")
-languages = getattr(config, "LANGUAGES")
-
-# Fetch apps module
-apps_module = importlib.import_module('_apps')
-apps = getattr(apps_module, "apps")
-
 
 ###################
 # URL Redirecting #
@@ -113,7 +101,7 @@ def login_required(app:str, controller:str=None, check:Union[str, list]='user'):
 
             # User is not logged-in
             # Check the language
-            if multi_lang:
+            if Settings.current().multi_lang:
                 if check_session('active_lang'):
                     return redirect(f'''/{get_session('active_lang')}/{url}?next={next}''')
 
@@ -261,7 +249,7 @@ def set_cookie(name:str, value:str, data:dict={}, days:int=30):
         error = 'Please provide the required parameters!'
 
         # Check debug mode
-        if debug:
+        if Settings.current().debug:
             # Raise error
             raise Exception(error)
 
@@ -311,7 +299,7 @@ def unset_cookie(name:str, data:dict={}):
         error = 'Please provide the required parameters!'
 
         # Check debug mode
-        if debug:
+        if Settings.current().debug:
             # Raise error
             raise Exception(error)
 
@@ -471,10 +459,14 @@ def find_lang():
     path = request.path
     lang = path.split('/')[1]
 
+    # The precomputed settings
+    settings = Settings.current()
+    default_lang = settings.default_lang
+
     # Check multi language
-    if multi_lang:
+    if settings.multi_lang:
         # Check the language path
-        if lang in languages:
+        if lang in settings.languages:
             active_lang = lang
             LANGUAGE = '/' + active_lang
             set_session('active_lang', lang)